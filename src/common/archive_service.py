@@ -1,31 +1,103 @@
 # src/common/archive_service.py
 
+import os
 import shutil
+import tempfile
+import zipfile
 from pathlib import Path
 
+import h5py
+
 from src.common.solver_state import SolverState
 
+ARCHIVE_NAME = "navier_stokes_output.zip"
+
+
+def _archive_target_dir() -> Path:
+    # Rule 5: Explicit or Error. We pull the live BASE_DIR from the main_solver
+    # to ensure consistency between simulation run and archival.
+    import src.main_solver
+    return Path(src.main_solver.BASE_DIR) / "data" / "testing-input-output"
+
+def _is_compressed_hdf5(path: Path) -> bool:
+    """True when any dataset of the HDF5 file carries an HDF5 compression filter."""
+    def visit(_name, obj):
+        if isinstance(obj, h5py.Dataset) and obj.compression is not None:
+            return True
+        return None
+
+    with h5py.File(path, "r") as h5f:
+        return bool(h5f.visititems(visit))
+
+
+class StreamingArchive:
+    """
+    Final ZIP archive written incrementally, one member per completed file.
+
+    Members are appended to a partial file next to the destination while
+    the run proceeds (deflated, or stored as-is when the HDF5 data is
+    already compressed), so finalize() only writes the central directory
+    and renames the archive into place atomically.
+    """
+    __slots__ = ['_zip', '_partial', '_destination', '_members']
+
+    def __init__(self, target_dir: Path | None = None):
+        target_dir = Path(target_dir) if target_dir is not None else _archive_target_dir()
+        target_dir.mkdir(parents=True, exist_ok=True)
+        self._destination = target_dir / ARCHIVE_NAME
+
+        # Unique partial name in the destination directory, so os.replace stays atomic
+        fd, partial = tempfile.mkstemp(prefix=f".{ARCHIVE_NAME}.", suffix=".partial", dir=target_dir)
+        os.close(fd)
+        self._partial = Path(partial)
+        self._zip = zipfile.ZipFile(self._partial, "w", allowZip64=True)
+        self._members = set()
 
-def archive_simulation_artifacts(state: SolverState) -> str:
+    @property
+    def members(self) -> frozenset:
+        return frozenset(self._members)
+
+    def add(self, path) -> None:
+        """Appends one finished file under its base name (the flat layout of the run directory)."""
+        path = Path(path)
+        if path.name in self._members:
+            raise ValueError(f"Archive already holds '{path.name}'.")
+        is_hdf5 = path.suffix in (".h5", ".hdf5")
+        compression = zipfile.ZIP_STORED if is_hdf5 and _is_compressed_hdf5(path) else zipfile.ZIP_DEFLATED
+        self._zip.write(path, arcname=path.name, compress_type=compression)
+        self._members.add(path.name)
+
+    def finalize(self) -> str:
+        """Writes the central directory and moves the archive into place."""
+        self._zip.close()
+        os.replace(self._partial, self._destination)
+        return str(self._destination)
+
+    def abort(self) -> None:
+        """Discards the partial archive (failed run)."""
+        self._zip.close()
+        self._partial.unlink(missing_ok=True)
+
+
+def archive_simulation_artifacts(state: SolverState, archive: StreamingArchive | None = None) -> str:
     """
     Context-aware archiving that adapts to both CI/CD runners and local tests.
     Uses Dynamic Lookup of BASE_DIR to anchor the 'data/' folder correctly.
+
+    With a StreamingArchive that already holds the snapshots, only files it
+    has not seen are appended before it is finalized; nothing is re-read or
+    re-compressed.
     """
     # 1. Resolve Dynamic Paths via Dynamic Lookup
-    # Rule 5: Explicit or Error. We pull the live BASE_DIR from the main_solver
-    # to ensure consistency between simulation run and archival.
-    import src.main_solver
-    current_base = Path(src.main_solver.BASE_DIR)
-
     # Source: Where the solver just wrote files (Resolved against current env)
     source_dir = Path(state.manifest.output_directory).resolve()
-    
+
     # Target: Always anchored to the current project/test root
-    target_dir = current_base / "data" / "testing-input-output"
-    
+    target_dir = _archive_target_dir()
+
     # Staging: Keep temporary folders in the current working directory to avoid root clutter
     renamed_dir = Path.cwd() / "navier_stokes_output"
-    
+
     # 2. Safety Check (Rule 5: Explicit or Error)
     if not source_dir.exists():
         raise FileNotFoundError(
@@ -39,18 +111,27 @@ def archive_simulation_artifacts(state: SolverState) -> str:
     # 4. Atomic Staging (Move 'output' -> 'navier_stokes_output')
     if renamed_dir.exists():
         shutil.rmtree(renamed_dir)
-    
+
+    # 5. Streaming path: complete the archive built during the run
+    if archive is not None:
+        for path in sorted(source_dir.iterdir()):
+            if path.is_file() and path.name not in archive.members:
+                archive.add(path)
+        final_destination = archive.finalize()
+        shutil.move(str(source_dir), str(renamed_dir))
+        return final_destination
+
     shutil.move(str(source_dir), str(renamed_dir))
 
-    # 5. Package into Archive
+    # 6. Package into Archive
     # Note: Using renamed_dir as the base ensures a clean internal ZIP structure
     temp_zip_path = shutil.make_archive(str(renamed_dir), 'zip', str(renamed_dir))
 
-    # 6. Final Placement
-    final_destination = target_dir / "navier_stokes_output.zip"
+    # 7. Final Placement
+    final_destination = target_dir / ARCHIVE_NAME
     if final_destination.exists():
         final_destination.unlink()
 
     shutil.move(temp_zip_path, str(final_destination))
 
-    return str(final_destination)
\ No newline at end of file
+    return str(final_destination)
@@ -1,11 +1,12 @@
 # src/common/base_container.py
-import json
 from collections.abc import Iterator
 from typing import Any
 
 import jsonschema
 import numpy as np
 
+from src.common.schema_validation import schema_validator
+
 
 class ValidatedContainer:
     """The 'Security Guard' logic. Now with memory-efficient slots and O(1) attribute validation."""
@@ -15,7 +16,8 @@ class ValidatedContainer:
     def __iter__(self) -> Iterator[str]:
         """Helper to iterate over attributes defined in slots across the hierarchy."""
         for cls in reversed(self.__class__.__mro__):
-            yield from getattr(cls, '__slots__', [])
+            # Interpreter slots (e.g. '__weakref__') carry no data
+            yield from (s for s in getattr(cls, '__slots__', []) if not s.startswith('__'))
     
     def _get_safe(self, name: str) -> Any:
         # Rule 5: Explicit or Error. No fallbacks.
@@ -34,12 +36,9 @@ class ValidatedContainer:
 
     def validate_against_schema(self, schema_path: str):
         """Final Firewall: Validates current state against the SSoT JSON Schema."""
-        with open(schema_path) as f:
-            schema = json.load(f)
-            
+        # Compiled once per schema file; arrays in the payload are checked vectorized
         try:
-            data_to_validate = self.to_dict()
-            jsonschema.validate(instance=data_to_validate, schema=schema)
+            schema_validator(schema_path).validate(self.schema_payload())
         except jsonschema.exceptions.ValidationError as e:
             # 1. Isolate the specific sub-dictionary/value that failed
             failed_instance = e.instance
@@ -71,6 +70,10 @@ class ValidatedContainer:
                 f"Data fragment: {repr(failed_instance)[:100]}"
             ) from None
 
+    def schema_payload(self) -> dict:
+        """The instance the schema firewall validates; containers holding large arrays may keep them as arrays."""
+        return self.to_dict()
+
     def __setattr__(self, name: str, value: Any):
         if self._ALLOWED_ATTRS is None:
             allowed = set()
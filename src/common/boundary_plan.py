@@ -0,0 +1,48 @@
+# src/common/boundary_plan.py
+
+import numpy as np
+
+from src.common.base_container import ValidatedContainer
+
+
+class BoundaryPlan(ValidatedContainer):
+    """
+    Precompiled Step 4 work list.
+
+    Each group holds the flat Foundation indices of the core cells that 
+    receive one boundary rule (wall, solid or a domain face), together with 
+    the (field id, value) pairs to write. Interior fluid cells never appear, 
+    so applying the plan touches only cells where a rule exists.
+
+    Each face holds the ghost-layer rule of one domain face: the BC type, 
+    the Dirichlet velocity (or None; a None component is zero-gradient) 
+    and the Dirichlet pressure (or None, for zero-gradient pressure).
+    """
+    __slots__ = ['_groups', '_faces']
+
+    def __init__(self):
+        self._groups = []
+        self._faces = []
+
+    @property
+    def groups(self) -> list: return self._get_safe("groups")
+
+    @property
+    def faces(self) -> list: return self._get_safe("faces")
+
+    def __len__(self) -> int:
+        return len(self._groups)
+
+    def add_group(self, location: str, bc_type: str, indices: np.ndarray, field_values: dict) -> None:
+        """Registers one rule over 'indices'; empty selections are dropped."""
+        if not isinstance(indices, np.ndarray) or indices.ndim != 1:
+            raise ValueError(f"BoundaryPlan: indices for '{location}' must be a 1D index array.")
+        if indices.size == 0:
+            return
+        self._groups.append((location, bc_type, indices, tuple(field_values.items())))
+
+    def add_face(self, location: str, bc_type: str, velocity: tuple | None, pressure: float | None) -> None:
+        """Registers the ghost-layer rule of one domain face."""
+        if velocity is not None and len(velocity) != 3:
+            raise ValueError(f"BoundaryPlan: velocity for '{location}' must have 3 components.")
+        self._faces.append((location, bc_type, velocity, pressure))
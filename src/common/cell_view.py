@@ -0,0 +1,76 @@
+# src/common/cell_view.py
+
+import numpy as np
+
+from src.common.base_container import ValidatedContainer
+from src.common.cell import Cell
+from src.common.field_schema import FI
+
+
+class CellView(ValidatedContainer):
+    """
+    Vectorized Topology DTO (Wiring).
+    The region counterpart of Cell: instead of one flat index, 'index' holds 
+    one basic slice per spatial axis of the padded [i, j, k, field] view 
+    (see grid_math.get_padded_view). get_field therefore returns a NumPy 
+    view of the whole region and set_field writes straight through to the 
+    Foundation, so a StencilBlock wired with CellViews drives the 
+    src/step3/ops formulas over every selected cell in one call.
+    """
+    __slots__ = ['index', 'fields_buffer', 'is_ghost']
+
+    def __init__(self, index: tuple[slice, slice, slice], fields_buffer: np.ndarray):
+        object.__setattr__(self, 'index', index)
+        object.__setattr__(self, 'fields_buffer', fields_buffer)
+        # Views are only ever assembled over the Core; ghosts are read as neighbors.
+        object.__setattr__(self, 'is_ghost', False)
+
+    # --- Coordinate Properties (logical ranges, ghost offset removed) ---
+    def _logical_range(self, axis: int) -> range:
+        start, stop, step = self.index[axis].indices(self.fields_buffer.shape[axis])
+        return range(start - 1, stop - 1, step)
+
+    @property
+    def i(self) -> range: return self._logical_range(0)
+
+    @property
+    def j(self) -> range: return self._logical_range(1)
+
+    @property
+    def k(self) -> range: return self._logical_range(2)
+
+    @property
+    def core_index(self) -> tuple[slice, slice, slice]:
+        """The same region addressed in arrays shaped like the Core (nx, ny, nz)."""
+        return tuple(slice(s.start - 1, s.stop - 1, s.step) for s in self.index)
+
+    # --- Schema-Locked Foundation Access (Rule 9) ---
+    def get_field(self, field_id: int) -> np.ndarray:
+        """Returns a view of the field over the whole region."""
+        return self.fields_buffer[(*self.index, field_id)]
+
+    def set_field(self, field_id: int, value):
+        """Writes a scalar or a region-shaped array into the Foundation."""
+        self.fields_buffer[(*self.index, field_id)] = value
+
+    @property
+    def mask(self) -> np.ndarray:
+        return self.get_field(FI.MASK)
+
+class IndexedCellView(Cell):
+    """
+    Gather/Scatter Topology DTO (Wiring).
+    A Cell whose 'index' is an integer array of flat Foundation indices 
+    (see StencilTable). get_field gathers one value per cell and set_field 
+    scatters back, so irregular cell sets run through the same kernels as 
+    the slice-based CellView. Coordinates come back as arrays.
+    """
+    __slots__ = []
+
+    def __init__(self, index: np.ndarray, fields_buffer: np.ndarray, nx_buf: int, ny_buf: int):
+        # Tables only ever list Core cells; ghosts are read as neighbors.
+        super().__init__(index, fields_buffer, nx_buf, ny_buf, is_ghost=False)
+
+    @property
+    def mask(self) -> np.ndarray:
+        return self.fields_buffer[self.index, FI.MASK]
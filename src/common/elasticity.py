@@ -1,20 +1,56 @@
 # src/common/elasticity.py
 
+import json
 import logging
+import time
+from collections import deque
+from pathlib import Path
 
 import numpy as np
 
 from src.common.field_schema import FI
 
+# Column blocks of the Foundation (FI keeps each velocity triple adjacent):
+# basic slices are strided views, so the audit and commit never gather copies.
+VELOCITY = slice(FI.VX, FI.VZ + 1)
+VELOCITY_STAR = slice(FI.VX_STAR, FI.VZ_STAR + 1)
+
+# PPE-iteration controller (config 'ppe_target_iterations'): PID gains on the
+# log iteration error, sliding window length, and per-step dt change bounds.
+PID_GAINS = (0.3, 0.02, 0.1)
+PID_INTEGRAL_LIMIT = 10.0
+PID_WINDOW = 8
+PID_DT_FACTOR = (0.5, 1.25)
+# Over-relaxation range the controller may choose for red-black SOR
+OMEGA_RANGE = (1.0, 1.95)
+
 
 class ElasticManager:
     """
     SSoT for Numerical Stability. 
     Acts as the dynamic authority for dt, omega, and max_iter.
+
+    With config 'cfl_number' set, dt is also chosen proactively before each 
+    step (adapt_dt) as the largest convective/viscous-stable value below 
+    the current ceiling; Panic Mode and recovery then move that ceiling.
+
+    With config 'ppe_target_iterations' set, a PID controller replaces the 
+    fixed recovery steps: every committed step reports its PPE iterations 
+    (record_solve), the ceiling is steered toward the target iteration count 
+    and omega follows the observed SOR convergence factor. The per-step 
+    controller record is kept in 'history' (export_history).
+
+    With config 'checkpoint_depth' > 0, the committed fields of the last 
+    steps are kept in a preallocated ring (checkpoint); a panic restores the 
+    Foundation from it (rollback) instead of retrying on half-written trials.
     """
     __slots__ = [
         'config', 'logger', '_dt', '_omega', '_max_iter', 
-        'is_in_panic', 'stable_streak', 'cooldown_limit', 'dt_floor'
+        'is_in_panic', 'stable_streak', 'cooldown_limit', 'dt_floor',
+        'cfl_number', '_dt_cap',
+        'target_iterations', 'sweep_deltas', 'history',
+        '_iterations', '_factors', '_error', '_integral', '_clock',
+        'checkpoint_depth', '_ring', '_ring_clock', '_ring_head', '_ring_size'
     ]
 
     def __init__(self, config, initial_dt: float):
@@ -23,6 +59,8 @@ class ElasticManager:
         
         # SSoT: _dt comes from the simulation input, NOT the solver config
         self._dt = initial_dt 
+        # Largest dt allowed: the target, lowered by Panic Mode
+        self._dt_cap = initial_dt
         
         # RULE 5: dt_floor comes from the solver config JSON
         self.dt_floor = self.config.dt_min_limit 
@@ -34,6 +72,28 @@ class ElasticManager:
         self.stable_streak = 0
         self.cooldown_limit = 5
 
+        # Opt-in proactive dt (None keeps the reactive panic/recovery control only)
+        self.cfl_number = getattr(self.config, "cfl_number", None)
+
+        # Opt-in PPE-iteration controller (None keeps the fixed recovery steps)
+        self.target_iterations = getattr(self.config, "ppe_target_iterations", None)
+        # Last two SOR max deltas of the current solve (filled by the SOR backend)
+        self.sweep_deltas = deque(maxlen=2)
+        self.history = []
+        self._iterations = deque(maxlen=PID_WINDOW)
+        self._factors = deque(maxlen=PID_WINDOW)
+        self._error = 0.0
+        self._integral = 0.0
+        self._clock = time.perf_counter()
+
+        # Opt-in checkpoint ring (0 keeps retries on the current Foundation);
+        # buffers are allocated on the first checkpoint, when n_cells is known
+        self.checkpoint_depth = getattr(self.config, "checkpoint_depth", 0)
+        self._ring = None
+        self._ring_clock = None
+        self._ring_head = -1
+        self._ring_size = 0
+
     @property
     def dt(self) -> float:
         return self._dt
@@ -47,43 +107,209 @@ class ElasticManager:
         return self._max_iter
 
     def validate_and_commit(self, state) -> bool:
-        """Audits trial fields. Returns True if math is sane and committed."""
-        audit_fields = [FI.VX_STAR, FI.VY_STAR, FI.VZ_STAR, FI.P_NEXT]
-        data_slice = state.fields.data[:, audit_fields]
+        """
+        Audits trial fields. Returns True if math is sane and committed.
+
+        The trial fields stay columns of the single Foundation (every Cell, 
+        view block and the stencil table address it by reference), so the 
+        commit copies in place instead of swapping arrays; neither step 
+        allocates a temporary of the buffer size.
+        """
+        data = state.fields.data
+        trial_velocity = data[:, VELOCITY_STAR]
+        trial_pressure = data[:, FI.P_NEXT]
         
         # Access threshold via SSoT (Rule 4 & 5)
         # If the config doesn't have it, Rule 5 mandates we crash with an AttributeError
         limit = self.config.divergence_threshold 
 
-        # Use a more direct check if memory is a concern at scale:
-        if not np.isfinite(data_slice).all():
-            return False
-
-        # Use the absolute maximum to avoid creating a full boolean mask array
-        # Slightly better: find max and min separately to avoid the abs() allocation
-        if data_slice.max() > limit or data_slice.min() < -limit:
+        # Fused audit: max/min propagate NaN and see +-Inf, and NaN fails every 
+        # comparison, so one pair of reductions covers finiteness and threshold.
+        # (np.minimum/np.maximum, not the builtins, which drop a NaN second argument)
+        lo = np.minimum(trial_velocity.min(), trial_pressure.min())
+        hi = np.maximum(trial_velocity.max(), trial_pressure.max())
+        if not (-limit <= lo and hi <= limit):
             return False
 
         # COMMIT: Star -> Foundation
-        state.fields.data[:, [FI.VX, FI.VY, FI.VZ]] = state.fields.data[:, [FI.VX_STAR, FI.VY_STAR, FI.VZ_STAR]]
-        state.fields.data[:, FI.P] = state.fields.data[:, FI.P_NEXT]
+        np.copyto(data[:, VELOCITY], trial_velocity)
+        np.copyto(data[:, FI.P], trial_pressure)
         return True
 
+    def stable_dt(self, state) -> float:
+        """
+        Largest dt meeting both stability numbers on the committed fields:
+        convective  dt * max(|u|/dx + |v|/dy + |w|/dz) <= cfl_number
+        viscous     dt * 2 * nu * (1/dx^2 + 1/dy^2 + 1/dz^2) <= cfl_number
+        The convective rate is one matrix-vector reduction over the Foundation.
+        """
+        grid = state.grid
+        inv_spacing = np.array([1.0 / grid.dx, 1.0 / grid.dy, 1.0 / grid.dz])
+        rate = float((np.abs(state.fields.data[:, VELOCITY]) @ inv_spacing).max())
+
+        nu = state.fluid_properties.viscosity / state.fluid_properties.density
+        rate_visc = 2.0 * nu * float((inv_spacing ** 2).sum())
+
+        limits = [self.cfl_number / r for r in (rate, rate_visc) if r > 0]
+        return min(limits) if limits else np.inf
+
+    def adapt_dt(self, state) -> float:
+        """
+        Proactive step size (config 'cfl_number'): the stable dt, no lower 
+        than dt_floor, capped by the current ceiling. A no-op otherwise.
+        """
+        if self.cfl_number is not None:
+            self._dt = min(max(self.stable_dt(state), self.dt_floor), self._dt_cap)
+        return self._dt
+
+    def record_solve(self, iterations: int) -> None:
+        """
+        Reports the PPE iterations of a committed step to the controller. The 
+        SOR convergence factor is the ratio of the last two sweep deltas 
+        (only SOR solves with two or more sweeps provide one).
+        """
+        factor = None
+        if len(self.sweep_deltas) == 2 and iterations >= 2 and self.sweep_deltas[0] > 0:
+            factor = float(self.sweep_deltas[1] / self.sweep_deltas[0])
+        self.sweep_deltas.clear()
+        if self.target_iterations is None:
+            return
+
+        self._iterations.append(iterations)
+        if factor is not None and 0 < factor < 1:
+            self._factors.append(factor)
+        now = time.perf_counter()
+        self.history.append({
+            "dt": self._dt, "omega": self._omega, "ppe_iterations": int(iterations),
+            "convergence_factor": factor, "wall_time": now - self._clock,
+        })
+        self._clock = now
+
+    def _tuned_omega(self) -> float:
+        """
+        Red-black SOR relaxation from the windowed convergence factor rho 
+        (Hageman-Young): in the under-relaxed regime rho > omega - 1 yields the 
+        Jacobi spectral radius mu = (rho + omega - 1) / (omega sqrt(rho)) and the 
+        optimum 2 / (1 + sqrt(1 - mu^2)). At or past the optimum rho only 
+        reflects omega - 1, so omega backs off toward it.
+        """
+        if not self._factors:
+            return self._omega
+        rho = float(np.exp(np.mean(np.log(self._factors))))
+        omega = self._omega
+        if rho > omega - 1.0:
+            mu = min((rho + omega - 1.0) / (omega * np.sqrt(rho)), 1.0)
+            target = 2.0 / (1.0 + np.sqrt(1.0 - mu * mu))
+        else:
+            target = 1.0 + 0.9 * (omega - 1.0)
+        # Half-step toward the estimate: single-step factors are noisy
+        return float(np.clip(omega + 0.5 * (target - omega), *OMEGA_RANGE))
+
+    def _controller_update(self) -> None:
+        """
+        PID step on e = log(target / windowed mean iterations): the dt ceiling 
+        is scaled by exp(Kp e + Ki sum(e) + Kd de), bounded per step and by 
+        [dt_floor, config dt]. The integral is clamped, and frozen while the 
+        ceiling is pinned at either bound.
+        """
+        kp, ki, kd = PID_GAINS
+        error = float(np.log(self.target_iterations / max(np.mean(self._iterations), 1.0)))
+        integral = float(np.clip(self._integral + error, -PID_INTEGRAL_LIMIT, PID_INTEGRAL_LIMIT))
+        factor = float(np.clip(np.exp(kp * error + ki * integral + kd * (error - self._error)), *PID_DT_FACTOR))
+        cap = min(max(self._dt_cap * factor, self.dt_floor), self.config.dt)
+        saturated = (cap == self.config.dt and error > 0) or (cap == self.dt_floor and error < 0)
+        if not saturated:
+            self._integral = integral
+        self._error = error
+        self._dt_cap = cap
+        if self.cfl_number is None:
+            self._dt = cap
+        self._omega = self._tuned_omega()
+
+    def export_history(self, path) -> None:
+        """Writes the controller history (one record per committed step) as JSON."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump({"target_iterations": self.target_iterations, "steps": self.history}, f, indent=2)
+
+    @property
+    def checkpoint_nbytes(self) -> int:
+        """Memory held by the checkpoint ring (0 until the first checkpoint)."""
+        return 0 if self._ring is None else self._ring.nbytes + self._ring_clock.nbytes
+
+    def checkpoint(self, state) -> None:
+        """
+        Copies the committed velocity and pressure (the only fields a step 
+        reads that it does not rebuild) plus iteration/time into the next ring slot.
+        """
+        if self.checkpoint_depth == 0:
+            return
+        data = state.fields.data
+        if self._ring is None:
+            self._ring = np.empty((self.checkpoint_depth, data.shape[0], 4))
+            self._ring_clock = np.empty((self.checkpoint_depth, 2))
+            self.logger.info(f"Checkpoint ring: {self.checkpoint_depth} slots, {self.checkpoint_nbytes / 2**20:.2f} MiB")
+        self._ring_head = (self._ring_head + 1) % self.checkpoint_depth
+        slot = self._ring[self._ring_head]
+        np.copyto(slot[:, :3], data[:, VELOCITY])
+        np.copyto(slot[:, 3], data[:, FI.P])
+        self._ring_clock[self._ring_head] = (state.iteration, state.time)
+        self._ring_size = min(self._ring_size + 1, self.checkpoint_depth)
+
+    def rollback(self, state, steps_back: int = 0) -> None:
+        """
+        Restores the Foundation to the checkpoint 'steps_back' commits before 
+        the latest. Trial columns are reset to the committed values, exactly 
+        as a commit leaves them; newer checkpoints are dropped.
+        """
+        if not 0 <= steps_back < self._ring_size:
+            raise ValueError(f"Rollback of {steps_back} steps exceeds the {self._ring_size} checkpoints held.")
+        self._ring_head = (self._ring_head - steps_back) % self.checkpoint_depth
+        self._ring_size -= steps_back
+        slot = self._ring[self._ring_head]
+        data = state.fields.data
+        for columns in (VELOCITY, VELOCITY_STAR):
+            np.copyto(data[:, columns], slot[:, :3])
+        for column in (FI.P, FI.P_NEXT):
+            np.copyto(data[:, column], slot[:, 3])
+        iteration, sim_time = self._ring_clock[self._ring_head]
+        state.iteration = int(iteration)
+        state.time = float(sim_time)
+
     def apply_panic_mode(self):
         self.is_in_panic = True
         self.stable_streak = 0
         self._dt *= 0.5
-        self._omega = max(0.5, self._omega - 0.2)
+        self._dt_cap = self._dt
+        if self.target_iterations is None:
+            self._omega = max(0.5, self._omega - 0.2)
+        else:
+            # Gauss-Seidel converges for the SPD pressure system; the controller 
+            # re-derives omega from the factors observed after the retry
+            self._omega = OMEGA_RANGE[0]
+            self._factors.clear()
+            self._integral = 0.0
         self._max_iter = 5000
         self.logger.warning(f"PANIC: dt reduced to {self._dt:.2e}")
         print("!!! ACTUAL LOG TRIGGERED !!!")
 
     def gradual_recovery(self):
+        if self.target_iterations is not None:
+            self._controller_update()
+            if self.is_in_panic:
+                self.stable_streak += 1
+                if self.stable_streak >= self.cooldown_limit:
+                    self.is_in_panic = False
+                    self._max_iter = self.config.ppe_max_iter
+            return
         if not self.is_in_panic: return
         self.stable_streak += 1
         if self.stable_streak >= self.cooldown_limit:
-            self._dt = min(self.config.dt, self._dt * 1.1)
+            self._dt_cap = min(self.config.dt, self._dt_cap * 1.1)
+            if self.cfl_number is None:
+                self._dt = self._dt_cap
             self._omega = min(self.config.ppe_omega, self._omega + 0.05)
-            if self._dt == self.config.dt and self._omega == self.config.ppe_omega:
+            if self._dt_cap == self.config.dt and self._omega == self.config.ppe_omega:
                 self.is_in_panic = False
                 self._max_iter = self.config.ppe_max_iter
\ No newline at end of file
@@ -1,5 +1,10 @@
 # src/common/grid_math.py
 
+from itertools import product
+
+import numpy as np
+
+
 def get_flat_index(i: int, j: int, k: int, nx: int, ny: int) -> int:
     """
     Computes a flat index from 3D coordinates. 
@@ -18,4 +23,71 @@ def get_coords_from_index(index: int, nx: int, ny: int) -> tuple[int, int, int]:
     j = rem // nx
     i = rem % nx
     
-    return i, j, k
\ No newline at end of file
+    return i, j, k
+
+def is_mask_valued(values: np.ndarray) -> bool:
+    """
+    True when every entry equals -1, 0 or 1 (the 'in {-1, 0, 1}' test by 
+    value). Integer arrays take one min/max range check, float arrays add an 
+    integrality check (NaN fails both); anything else is tested elementwise.
+    """
+    values = np.asarray(values)
+    if values.size == 0 or values.dtype.kind == "b":
+        return True
+    if values.dtype.kind in "iu":
+        return bool(values.min() >= -1 and values.max() <= 1)
+    if values.dtype.kind == "f":
+        return bool(((values >= -1) & (values <= 1) & (values == np.trunc(values))).all())
+    return all(value in {-1, 0, 1} for value in values.flat)
+
+def get_padded_view(data: np.ndarray, nx_buf: int, ny_buf: int, nz_buf: int) -> np.ndarray:
+    """
+    SSoT Mapping: Exposes the (n_cells, n_fields) Foundation as a 
+    (nx_buf, ny_buf, nz_buf, n_fields) array addressed as [i, j, k, field].
+
+    get_flat_index makes 'i' the fastest-varying axis, so the buffer is 
+    reshaped as [k, j, i, field] and the spatial axes are transposed back.
+    No data is copied: writes through the view land in the Foundation.
+    Leading axes (e.g. the case axis of an ensemble batch) are kept in front.
+    """
+    lead = data.shape[:-2]
+    n = len(lead)
+    view = data.reshape(*lead, nz_buf, ny_buf, nx_buf, data.shape[-1])
+    return view.transpose(*range(n), n + 2, n + 1, n, n + 3)
+
+def shift_index(index: tuple, axis: int, offset: int) -> tuple:
+    """Moves one axis of a slice-index by 'offset' buffer cells."""
+    s = index[axis]
+    shifted = list(index)
+    shifted[axis] = slice(s.start + offset, s.stop + offset, s.step)
+    return tuple(shifted)
+
+def weighted_neighbor_sum(padded: np.ndarray, index: tuple, weights: tuple) -> np.ndarray:
+    """7-point stencil off-diagonal: sum over axes of w_axis * (f[+1] + f[-1]) at 'index'."""
+    total = 0.0
+    for axis, w in enumerate(weights):
+        total = total + w * (padded[shift_index(index, axis, 1)] + padded[shift_index(index, axis, -1)])
+    return total
+
+def get_red_black_indices(nx: int, ny: int, nz: int) -> list[tuple[slice, slice, slice]]:
+    """
+    Buffer slice-indices of the eight parity sub-lattices (stride 2 on every 
+    axis) of an nx x ny x nz core, red ((i+j+k) even) first, then black.
+    Sub-lattices that are empty on a degenerate axis (n == 1) are skipped.
+    """
+    red, black = [], []
+    for a, b, c in product((0, 1), repeat=3):
+        if a >= nx or b >= ny or c >= nz:
+            continue
+        index = (slice(1 + a, nx + 1, 2), slice(1 + b, ny + 1, 2), slice(1 + c, nz + 1, 2))
+        (red if (a + b + c) % 2 == 0 else black).append(index)
+    return red + black
+
+def get_slab_bounds(nz: int, n_slabs: int) -> list[tuple[int, int]]:
+    """
+    Splits the core z-range [0, nz) into at most 'n_slabs' contiguous, 
+    non-empty, near-equal (k_start, k_stop) slabs, lowest first.
+    """
+    n_slabs = max(1, min(int(n_slabs), nz))
+    bounds = np.linspace(0, nz, n_slabs + 1).astype(int)
+    return [(int(k0), int(k1)) for k0, k1 in zip(bounds[:-1], bounds[1:], strict=True)]
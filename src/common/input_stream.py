@@ -0,0 +1,164 @@
+# src/common/input_stream.py
+
+"""
+Streaming reader for solver input JSON.
+
+json.load materializes an inline 'mask' as one Python int per cell. This
+reader walks the top-level object incrementally instead. Every member
+except an inline mask is decoded as usual (grid, fluid properties,
+boundary conditions, ... are small). An inline mask array is parsed in
+fixed-size text chunks straight into a preallocated int8 array (sized from
+'grid' when it precedes the mask). Peak memory therefore stays close to
+the final mask plus one chunk.
+"""
+
+import json
+import re
+import warnings
+
+import numpy as np
+
+from src.common.grid_math import is_mask_valued
+
+CHUNK_SIZE = 1 << 20
+MASK_ERROR = "Mask contains invalid values. Only -1, 0, 1 allowed."
+# An empty field (',,' or a leading/trailing comma): np.fromstring would read it as -1
+_EMPTY_FIELD = re.compile(r"(?:^|,)\s*(?:,|$)")
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+# Characters that can follow a complete top-level member value
+_VALUE_END = ",:}] \t\n\r"
+_DECODER = json.JSONDecoder()
+
+
+class _Reader:
+    """Buffered text cursor over a file, refilled in CHUNK_SIZE reads."""
+    __slots__ = ['_file', 'buf', 'pos', 'eof']
+
+    def __init__(self, f):
+        self._file = f
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        """Appends the next chunk (dropping consumed text); False at end of file."""
+        if self.eof:
+            return False
+        chunk = self._file.read(CHUNK_SIZE)
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        self.eof = not chunk
+        return bool(chunk)
+
+    def peek(self) -> str:
+        """Next non-whitespace character without consuming it ('' at end of input)."""
+        while True:
+            self.pos = _WHITESPACE.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self.fill():
+                return ""
+
+    def expect(self, chars: str) -> str:
+        ch = self.peek()
+        if not ch or ch not in chars:
+            raise ValueError(f"Input JSON: expected one of {chars!r}, found {ch or 'end of file'!r}.")
+        self.pos += 1
+        return ch
+
+    def value(self):
+        """Decodes one complete JSON value, reading more text until it is whole."""
+        self.peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.buf, self.pos)
+                # A number is whole only once a structural character or whitespace
+                # follows: a read may stop after '1' of '1.5e0' (or mid-digits)
+                if self.eof or (end < len(self.buf) and self.buf[end] in _VALUE_END):
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            self.fill()
+
+
+def _parse_mask_segment(segment: str) -> np.ndarray:
+    """Comma-separated numbers -> float array (C-speed); malformed text raises."""
+    if _EMPTY_FIELD.search(segment):
+        raise ValueError(MASK_ERROR)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        try:
+            return np.fromstring(segment, dtype=np.float64, sep=",")
+        except (ValueError, DeprecationWarning) as e:
+            raise ValueError(MASK_ERROR) from e
+
+def _read_mask_array(reader: _Reader, n_cells: int | None) -> np.ndarray:
+    """Parses an inline mask array into int8, chunk by chunk."""
+    reader.expect("[")
+    out = np.empty(n_cells if n_cells else CHUNK_SIZE, dtype=np.int8)
+    n = 0
+    if reader.peek() == "]":
+        reader.pos += 1
+        return out[:0]
+
+    while True:
+        text = reader.buf
+        close = text.find("]", reader.pos)
+        if close >= 0:
+            cut, final = close, True
+        else:
+            # Only whole fields: parse up to the last comma, keep the tail
+            cut, final = text.rfind(",", reader.pos), False
+            if cut < reader.pos:
+                if not reader.fill():
+                    raise ValueError("Input JSON: unterminated mask array.")
+                continue
+        values = _parse_mask_segment(text[reader.pos:cut])
+        reader.pos = cut + 1
+        if not is_mask_valued(values):
+            raise ValueError(MASK_ERROR)
+        if n + len(values) > len(out):
+            # Mask before 'grid' (or longer than the grid): grow geometrically
+            out = np.resize(out, max(2 * len(out), n + len(values)))
+        out[n:n + len(values)] = values
+        n += len(values)
+        if final:
+            return out if n == len(out) else out[:n].copy()
+        if reader.pos >= len(reader.buf):
+            reader.fill()
+
+def _grid_cells(data: dict) -> int | None:
+    grid = data.get("grid")
+    try:
+        return int(grid["nx"]) * int(grid["ny"]) * int(grid["nz"])
+    except (TypeError, KeyError, ValueError):
+        return None
+
+def load_input_streaming(path) -> dict:
+    """
+    json.load equivalent for a solver input file, except that an inline
+    'mask' list is returned as a flat int8 array.
+    """
+    with open(path, encoding="utf-8") as f:
+        reader = _Reader(f)
+        reader.expect("{")
+        data = {}
+        if reader.peek() == "}":
+            reader.pos += 1
+        else:
+            while True:
+                key = reader.value()
+                if not isinstance(key, str):
+                    raise ValueError("Input JSON: object keys must be strings.")
+                reader.expect(":")
+                if key == "mask" and reader.peek() == "[":
+                    data[key] = _read_mask_array(reader, _grid_cells(data))
+                else:
+                    data[key] = reader.value()
+                if reader.expect(",}") == "}":
+                    break
+        if reader.peek():
+            raise ValueError("Input JSON: extra data after the top-level object.")
+    return data
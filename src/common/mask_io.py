@@ -0,0 +1,103 @@
+# src/common/mask_io.py
+
+"""
+Decoders for the three 'mask' forms of the input schema.
+
+- Inline list: the canonical flattening i + nx*(j + ny*k).
+- {"encoding": "file", "path": ..., "dataset": ...}: a .npy or HDF5 array,
+  memory-mapped when its storage allows (uncompressed, contiguous). It is
+  either flat in canonical order or 3-D indexed [i, j, k].
+- {"encoding": "rle", "values": [...], "counts": [...]}: run-length
+  encoding of the canonical flattening.
+- {"encoding": "geometry", "geometry": [...]}: procedural primitives, which
+  need the grid and are rasterized by Step 1 (src/step1/geometry.py).
+
+Every stored form decodes to the same flat array, so Step 1 builds the
+same int8 3-D mask whichever one the input uses.
+"""
+
+from pathlib import Path
+
+import h5py
+import numpy as np
+
+from src.common.grid_math import is_mask_valued
+
+DEFAULT_DATASET = "mask"
+
+
+def _flatten_canonical(array: np.ndarray) -> np.ndarray:
+    """Flat or [i, j, k] array -> canonical flat order (a view when the layout allows)."""
+    if array.ndim == 3:
+        return array.reshape(-1, order="F")
+    return array
+
+def _load_npy(path: Path) -> np.ndarray:
+    return np.load(path, mmap_mode="r", allow_pickle=False)
+
+def _load_hdf5(path: Path, dataset: str) -> np.ndarray:
+    with h5py.File(path, "r") as h5f:
+        if dataset not in h5f:
+            raise ValueError(f"Mask dataset '{dataset}' not found in {path}")
+        ds = h5f[dataset]
+        offset = ds.id.get_offset()
+        # Contiguous, unfiltered storage is a plain array at 'offset' in the file
+        if ds.chunks is None and offset is not None:
+            return np.memmap(path, dtype=ds.dtype, mode="r", offset=offset, shape=ds.shape)
+        return ds[...]
+
+def load_mask_file(path, dataset: str = DEFAULT_DATASET) -> np.ndarray:
+    """Reads an external mask array (.npy or .h5/.hdf5) without copying it into memory when possible."""
+    path = Path(path)
+    if not path.exists():
+        raise FileNotFoundError(f"Mask file missing at {path}")
+    if path.suffix == ".npy":
+        return _flatten_canonical(_load_npy(path))
+    if path.suffix in (".h5", ".hdf5"):
+        return _flatten_canonical(_load_hdf5(path, dataset))
+    raise ValueError(f"Unsupported mask file type '{path.suffix}' (expected .npy, .h5 or .hdf5).")
+
+def decode_rle(values, counts) -> np.ndarray:
+    """values[n] repeated counts[n] times, as int8."""
+    values, counts = np.asarray(values), np.asarray(counts)
+    if values.ndim != 1 or values.shape != counts.shape:
+        raise ValueError("RLE mask: 'values' and 'counts' must be flat lists of equal length.")
+    if counts.size and (counts.dtype.kind not in "iu" or counts.min() < 0):
+        raise ValueError("RLE mask: 'counts' must be non-negative integers.")
+    # Before the int8 cast, which would wrap 255 to -1 and truncate 1.7 to 1
+    if not is_mask_valued(values):
+        raise ValueError("Mask contains invalid values. Only -1, 0, 1 allowed.")
+    return np.repeat(values.astype(np.int8), counts)
+
+def encode_rle(mask: np.ndarray) -> dict:
+    """Inverse of decode_rle for a flat (canonical order) mask: the compact input form."""
+    mask = np.asarray(mask).ravel()
+    if mask.size == 0:
+        return {"encoding": "rle", "values": [], "counts": []}
+    starts = np.flatnonzero(np.diff(mask, prepend=mask[0] - 1))
+    counts = np.diff(np.append(starts, mask.size))
+    return {"encoding": "rle", "values": mask[starts].tolist(), "counts": counts.tolist()}
+
+def anchor_mask_path(spec, base_dir):
+    """A file-form mask spec with its relative path resolved against 'base_dir'; other forms unchanged."""
+    if isinstance(spec, dict) and spec.get("encoding") == "file":
+        return {**spec, "path": str(Path(base_dir) / spec["path"])}
+    return spec
+
+def is_procedural(spec) -> bool:
+    """True for the geometry form, which has no flat array before Step 1."""
+    return isinstance(spec, dict) and spec.get("encoding") == "geometry"
+
+def decode_mask(spec) -> np.ndarray:
+    """
+    Flat mask array in canonical order from any schema form. Values are not
+    validated here (see MaskInput).
+    """
+    if not isinstance(spec, dict):
+        return np.asarray(spec)
+    encoding = spec.get("encoding")
+    if encoding == "file":
+        return load_mask_file(spec["path"], spec.get("dataset", DEFAULT_DATASET))
+    if encoding == "rle":
+        return decode_rle(spec["values"], spec["counts"])
+    raise ValueError(f"Unknown mask encoding: '{encoding}'")
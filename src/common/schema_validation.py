@@ -0,0 +1,164 @@
+# src/common/schema_validation.py
+
+"""
+Cached schema firewall with a vectorized path for array payloads.
+
+A schema file is read once (load_schema) and each schema is compiled once
+(compile_schema / schema_validator). At compile time, every object
+property whose schema (or one oneOf/anyOf branch of it) is a flat array
+of scalars becomes an "array slot" (mask, velocity, force_vector, ...). When the instance holds
+a NumPy array in such a slot, the array is checked against that subschema
+with vectorized shape, dtype and value tests. It is then replaced by a
+sentinel that the compiled schema accepts in its place. jsonschema
+validates everything else (scalars and structure), so no Python list is
+built per cell. Plain lists still go through jsonschema unchanged.
+"""
+
+import copy
+import json
+from collections import deque
+from functools import cache
+
+import jsonschema
+import numpy as np
+
+# Stand-in for a vectorized-checked array; the compiled schema accepts it in array slots
+ARRAY_SENTINEL = "<ndarray: validated vectorized>"
+# Keywords the vectorized checks implement; any other one leaves the array to jsonschema
+_ARRAY_KEYWORDS = {"type", "items", "minItems", "maxItems", "description"}
+_ITEM_KEYWORDS = {"type", "enum", "minimum", "maximum", "exclusiveMinimum", "exclusiveMaximum", "description"}
+_ITEM_KINDS = {"integer": "iuf", "number": "iuf"}
+# id(schema) -> (schema, validator); holding the schema keeps its id from being reused
+_COMPILED: dict[int, tuple[dict, "SchemaValidator"]] = {}
+_BOUNDS = {
+    "minimum": np.less, "maximum": np.greater,
+    "exclusiveMinimum": np.less_equal, "exclusiveMaximum": np.greater_equal,
+}
+
+
+def _scalar_array_schema(subschema: dict) -> dict | None:
+    """'subschema' itself, or its single array branch, when the vectorized checks cover it."""
+    branches = subschema.get("oneOf", subschema.get("anyOf", [subschema]))
+    arrays = [b for b in branches if b.get("type") == "array"]
+    if len(arrays) != 1:
+        return None
+    array = arrays[0]
+    items = array.get("items", {})
+    if set(array) - _ARRAY_KEYWORDS or set(items) - _ITEM_KEYWORDS or items.get("type") not in _ITEM_KINDS:
+        return None
+    return array
+
+def _collect_slots(schema: dict, path=()) -> dict:
+    """Property path -> array subschema, following nested object properties."""
+    slots = {}
+    for name, subschema in schema.get("properties", {}).items():
+        array = _scalar_array_schema(subschema)
+        if array is not None:
+            slots[path + (name,)] = array
+        elif subschema.get("type") == "object":
+            slots.update(_collect_slots(subschema, path + (name,)))
+    return slots
+
+def _fail(message, path, validator, validator_value, instance, schema):
+    # Same exception as jsonschema, so the existing firewall diagnostics apply
+    return jsonschema.exceptions.ValidationError(
+        message, validator=validator, path=deque(path), validator_value=validator_value,
+        instance=instance, schema=schema,
+    )
+
+def check_array(array: np.ndarray, schema: dict, path=()) -> None:
+    """Vectorized equivalent of validating array.tolist() against a scalar-array 'schema'."""
+    if array.ndim != 1:
+        raise _fail(f"array of shape {array.shape} is not a flat list", path, "type", "array", array, schema)
+    if array.size < schema.get("minItems", 0):
+        raise _fail(f"{array.size} items is too short", path, "minItems", schema["minItems"], array, schema)
+    if array.size > schema.get("maxItems", array.size):
+        raise _fail(f"{array.size} items is too long", path, "maxItems", schema["maxItems"], array, schema)
+    if array.size == 0:
+        return
+
+    items = schema.get("items", {})
+    kind = items["type"]
+    if array.dtype.kind not in _ITEM_KINDS[kind]:
+        raise _fail(f"dtype {array.dtype} is not of type '{kind}'", path, "type", kind, array, items)
+    if kind == "integer" and array.dtype.kind == "f" and not np.all(np.mod(array, 1) == 0):
+        raise _fail("array has non-integral values", path, "type", kind, array, items)
+    if "enum" in items and not np.all(np.isin(array, items["enum"])):
+        raise _fail(f"array has values outside {items['enum']}", path, "enum", items["enum"], array, items)
+    for keyword, violates in _BOUNDS.items():
+        if keyword in items and np.any(violates(array, items[keyword])):
+            raise _fail(f"array has values violating {keyword} {items[keyword]}", path, keyword,
+                        items[keyword], array, items)
+
+
+class SchemaValidator:
+    """One compiled schema: array slots checked vectorized, the rest by jsonschema."""
+    __slots__ = ['slots', '_validator']
+
+    def __init__(self, schema: dict):
+        cls = jsonschema.validators.validator_for(schema)
+        cls.check_schema(schema)
+        self.slots = _collect_slots(schema)
+
+        compiled = copy.deepcopy(schema)
+        for path in self.slots:
+            parent = compiled
+            for name in path[:-1]:
+                parent = parent["properties"][name]
+            original = parent["properties"][path[-1]]
+            parent["properties"][path[-1]] = {"anyOf": [original, {"const": ARRAY_SENTINEL}]}
+        self._validator = cls(compiled)
+
+    def validate(self, instance: dict) -> None:
+        """Raises jsonschema.exceptions.ValidationError on the first violation."""
+        for path, array_schema in self.slots.items():
+            instance = self._check_slot(instance, path, array_schema)
+        # The error jsonschema.validate would raise for the original schema
+        error = jsonschema.exceptions.best_match(self._unwrap(e) for e in self._validator.iter_errors(instance))
+        if error is not None:
+            raise error
+
+    def _unwrap(self, error):
+        """A list rejected in an array slot is reported against its original subschema, not the sentinel wrapper."""
+        if error.validator != "anyOf" or tuple(error.path) not in self.slots:
+            return error
+        original = next(e for e in error.context if e.relative_schema_path[0] == 0)
+        original.path.extendleft(reversed(error.path))
+        original.parent = None
+        return original
+
+    @staticmethod
+    def _check_slot(instance, path, array_schema):
+        """Checks an ndarray at 'path' and returns the instance with it replaced (copying only the path)."""
+        parents = [instance]
+        for name in path:
+            node = parents[-1]
+            if not isinstance(node, dict) or name not in node:
+                return instance
+            parents.append(node[name])
+        if not isinstance(parents[-1], np.ndarray):
+            return instance
+
+        check_array(parents[-1], array_schema, path)
+        value = ARRAY_SENTINEL
+        for name, node in zip(reversed(path), reversed(parents[:-1]), strict=True):
+            value = {**node, name: value}
+        return value
+
+
+@cache
+def load_schema(schema_path: str) -> dict:
+    """Parsed schema, read once per path. Shared: callers must not mutate it."""
+    with open(schema_path) as f:
+        return json.load(f)
+
+def compile_schema(schema: dict) -> SchemaValidator:
+    """Compiled validator for a schema dict, built once per dict object (see load_schema)."""
+    entry = _COMPILED.get(id(schema))
+    if entry is None or entry[0] is not schema:
+        entry = _COMPILED[id(schema)] = (schema, SchemaValidator(schema))
+    return entry[1]
+
+def schema_validator(schema_path: str) -> SchemaValidator:
+    """Compiled validator for the schema file at 'schema_path'."""
+    return compile_schema(load_schema(schema_path))
@@ -15,12 +15,13 @@ class SimulationContext:
     config: SolverConfig
 
     @classmethod
-    def create(cls, input_dict: dict, config_dict: dict) -> "SimulationContext":
+    def create(cls, input_dict: dict, config_dict: dict, base_dir=None) -> "SimulationContext":
         """
         Factory method to assemble the context.
+        'base_dir' anchors relative file references of the input (mask files).
         """
         # 1. Load physical data
-        input_data = SolverInput.from_dict(input_dict)
+        input_data = SolverInput.from_dict(input_dict, base_dir)
         
         # 2. Extract the base time_step from physical input
         # This becomes the 'Target DT' for the ElasticManager
@@ -4,6 +4,13 @@ from dataclasses import dataclass
 
 from src.common.base_container import ValidatedContainer
 
+# Pressure Poisson backends selectable via 'ppe_solver' (see src/step3/ppe_dispatcher.py)
+PPE_SOLVERS = ("sor", "cg", "mg", "spectral")
+# Preconditioners for the 'cg' backend
+PPE_PRECONDITIONERS = ("jacobi", "ssor")
+# Cycle types for the 'mg' backend
+PPE_MG_CYCLES = ("v", "fmg")
+
 
 @dataclass
 class SolverConfig(ValidatedContainer):
@@ -14,7 +21,12 @@ class SolverConfig(ValidatedContainer):
     # Rule 4: dt is removed from here because it's injected from Simulation Input
     __slots__ = [
         '_ppe_tolerance', '_ppe_atol', '_ppe_max_iter', 
-        '_ppe_omega', '_dt_min_limit', '_divergence_threshold'
+        '_ppe_omega', '_dt_min_limit', '_divergence_threshold',
+        '_ppe_solver', '_ppe_preconditioner', '_ppe_mg_cycle', '_num_threads', '_num_processes',
+        '_snapshot_queue_depth', '_cfl_number', '_ppe_target_iterations',
+        '_checkpoint_depth',
+        # Target dt: not read from config.json, injected by SimulationContext.create
+        '_dt'
     ]
 
     def __init__(self, **kwargs):
@@ -27,16 +39,41 @@ class SolverConfig(ValidatedContainer):
         self.ppe_max_iter = kwargs.get('ppe_max_iter')
         self.ppe_omega = kwargs.get('ppe_omega')
         self.divergence_threshold = kwargs.get('divergence_threshold')
+        # Opt-in: PPE backend (default: the baseline SOR solve)
+        self.ppe_solver = kwargs.get('ppe_solver', 'sor')
+        self.ppe_preconditioner = kwargs.get('ppe_preconditioner')
+        self.ppe_mg_cycle = kwargs.get('ppe_mg_cycle')
+        # Opt-in: slab threads for the Step 3 kernels (1 = serial main loop)
+        self.num_threads = kwargs.get('num_threads', 1)
+        # Opt-in: slab worker processes over a shared-memory Foundation
+        self.num_processes = kwargs.get('num_processes', 1)
+        # Opt-in: staging buffers of the asynchronous snapshot writer (0 = inline writes)
+        self.snapshot_queue_depth = kwargs.get('snapshot_queue_depth', 0)
+        # Opt-in: proactive CFL/viscous dt control in the Elastic Manager
+        self.cfl_number = kwargs.get('cfl_number')
+        # Opt-in: PID control of dt/omega toward this PPE iteration count
+        self.ppe_target_iterations = kwargs.get('ppe_target_iterations')
+        # Opt-in: committed-state checkpoints kept for panic rollback (0 = none)
+        self.checkpoint_depth = kwargs.get('checkpoint_depth', 0)
         
         # Rule 5 check: Ensure the floor is defined
         required_fields = [
             'dt', 'dt_min_limit', 'ppe_tolerance', 'ppe_atol', 
             'ppe_max_iter', 'ppe_omega', 'divergence_threshold'
         ]
+        # Conditionally required: backend-specific settings
+        if self._ppe_solver == "cg":
+            required_fields.append('ppe_preconditioner')
+        if self._ppe_solver == "mg":
+            required_fields.append('ppe_mg_cycle')
         for field in required_fields:
             if getattr(self, field) is None:
                 raise AttributeError(f"CONTRACT VIOLATION: '{field}' must be in JSON.")
 
+        if self._num_threads is not None and self._num_processes is not None \
+                and self._num_threads > 1 and self._num_processes > 1:
+            raise ValueError("num_threads and num_processes cannot both be > 1.")
+
     @property
     def dt_min_limit(self) -> float: 
         return self._get_safe("dt_min_limit")
@@ -105,3 +142,95 @@ class SolverConfig(ValidatedContainer):
         if v is not None and v <= 0:
             raise ValueError(f"divergence_threshold must be > 0, got {v}")
         self._set_safe("divergence_threshold", v, float)
+
+    @property
+    def ppe_solver(self) -> str:
+        return self._get_safe("ppe_solver")
+
+    @ppe_solver.setter
+    def ppe_solver(self, v: str):
+        if v is not None and v not in PPE_SOLVERS:
+            raise ValueError(f"ppe_solver must be one of {PPE_SOLVERS}, got {v!r}")
+        self._set_safe("ppe_solver", v, str)
+
+    @property
+    def ppe_preconditioner(self) -> str:
+        return self._get_safe("ppe_preconditioner")
+
+    @ppe_preconditioner.setter
+    def ppe_preconditioner(self, v: str):
+        if v is not None and v not in PPE_PRECONDITIONERS:
+            raise ValueError(f"ppe_preconditioner must be one of {PPE_PRECONDITIONERS}, got {v!r}")
+        self._set_safe("ppe_preconditioner", v, str)
+
+    @property
+    def ppe_mg_cycle(self) -> str:
+        return self._get_safe("ppe_mg_cycle")
+
+    @ppe_mg_cycle.setter
+    def ppe_mg_cycle(self, v: str):
+        if v is not None and v not in PPE_MG_CYCLES:
+            raise ValueError(f"ppe_mg_cycle must be one of {PPE_MG_CYCLES}, got {v!r}")
+        self._set_safe("ppe_mg_cycle", v, str)
+
+    @property
+    def num_threads(self) -> int:
+        return self._get_safe("num_threads")
+
+    @num_threads.setter
+    def num_threads(self, v: int):
+        if v is not None and (isinstance(v, bool) or not isinstance(v, int) or v < 1):
+            raise ValueError(f"num_threads must be an integer >= 1, got {v!r}")
+        self._set_safe("num_threads", v, int)
+
+    @property
+    def num_processes(self) -> int:
+        return self._get_safe("num_processes")
+
+    @num_processes.setter
+    def num_processes(self, v: int):
+        if v is not None and (isinstance(v, bool) or not isinstance(v, int) or v < 1):
+            raise ValueError(f"num_processes must be an integer >= 1, got {v!r}")
+        self._set_safe("num_processes", v, int)
+
+    @property
+    def snapshot_queue_depth(self) -> int:
+        return self._get_safe("snapshot_queue_depth")
+
+    @snapshot_queue_depth.setter
+    def snapshot_queue_depth(self, v: int):
+        if v is not None and (isinstance(v, bool) or not isinstance(v, int) or v < 0):
+            raise ValueError(f"snapshot_queue_depth must be an integer >= 0, got {v!r}")
+        self._set_safe("snapshot_queue_depth", v, int)
+
+    @property
+    def cfl_number(self) -> float | None:
+        # Optional key: absent means reactive (panic-only) dt control
+        return self._cfl_number
+
+    @cfl_number.setter
+    def cfl_number(self, v: float):
+        if v is not None and not (0 < v <= 1):
+            raise ValueError(f"cfl_number must be in (0, 1], got {v}")
+        self._set_safe("cfl_number", v, float)
+
+    @property
+    def ppe_target_iterations(self) -> int | None:
+        # Optional key: absent keeps the fixed Panic Mode recovery steps
+        return self._ppe_target_iterations
+
+    @ppe_target_iterations.setter
+    def ppe_target_iterations(self, v: int):
+        if v is not None and (isinstance(v, bool) or not isinstance(v, int) or v < 1):
+            raise ValueError(f"ppe_target_iterations must be an integer >= 1, got {v!r}")
+        self._set_safe("ppe_target_iterations", v, int)
+
+    @property
+    def checkpoint_depth(self) -> int:
+        return self._checkpoint_depth
+
+    @checkpoint_depth.setter
+    def checkpoint_depth(self, v: int):
+        if v is not None and (isinstance(v, bool) or not isinstance(v, int) or v < 0):
+            raise ValueError(f"checkpoint_depth must be an integer >= 0, got {v!r}")
+        self._set_safe("checkpoint_depth", v, int)
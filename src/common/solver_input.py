@@ -2,7 +2,11 @@
 
 from dataclasses import dataclass
 
+import numpy as np
+
 from src.common.base_container import ValidatedContainer
+from src.common.grid_math import is_mask_valued
+from src.common.mask_io import anchor_mask_path, decode_mask, is_procedural
 
 # =========================================================
 # 1. SUB-DEPARTMENT CONTAINERS
@@ -195,17 +199,39 @@ class BoundaryConditionsInput(ValidatedContainer):
 
 @dataclass
 class MaskInput(ValidatedContainer):
-    __slots__ = ['_data']
+    __slots__ = ['_data', '_array']
     
-    def __init__(self): self._data = None
+    def __init__(self): self._data = self._array = None
 
     @property
-    def data(self) -> list: return self._get_safe("data")
+    def data(self) -> list | dict | np.ndarray: return self._get_safe("data")
     @data.setter
-    def data(self, v: list):
-        if not all(val in {-1, 0, 1} for val in v):
+    def data(self, v: list | dict | np.ndarray):
+        # Procedural primitives are rasterized on the grid in Step 1
+        if is_procedural(v):
+            self._set_safe("data", v, dict)
+            self._array = None
+            return
+        # Inline list (or the flat array the streaming reader parsed it into),
+        # external file or RLE (see mask_io); one conversion and one
+        # vectorized check instead of a per-element set lookup
+        array = decode_mask(v)
+        if array.ndim != 1 or not is_mask_valued(array):
             raise ValueError("Mask contains invalid values. Only -1, 0, 1 allowed.")
-        self._set_safe("data", v, list)
+        self._set_safe("data", v, (list, dict, np.ndarray))
+        # int8 files stay memory-mapped (no copy)
+        self._array = array.astype(np.int8, copy=False)
+        self._array.flags.writeable = False
+
+    @property
+    def geometry(self) -> list | None:
+        """Procedural primitives of the geometry form; None for stored masks."""
+        return self.data["geometry"] if is_procedural(self.data) else None
+
+    @property
+    def array(self) -> np.ndarray:
+        """The mask as a read-only flat int8 array (decoded once, in the setter)."""
+        return self._get_safe("array")
 
 @dataclass
 class ExternalForcesInput(ValidatedContainer):
@@ -233,7 +259,8 @@ class SolverInput(ValidatedContainer):
         for slot in self.__slots__: object.__setattr__(self, slot, None)
 
     @classmethod
-    def from_dict(cls, data: dict) -> "SolverInput":
+    def from_dict(cls, data: dict, base_dir=None) -> "SolverInput":
+        """'base_dir' anchors a relative mask file path (the input file's directory)."""
         obj = cls()
         obj.domain_configuration = DomainConfigInput()
         obj.grid = GridInput()
@@ -270,7 +297,8 @@ class SolverInput(ValidatedContainer):
         obj.simulation_parameters.output_interval = sp["output_interval"]
         
         obj.external_forces.force_vector = data["external_forces"]["force_vector"]
-        obj.mask.data = data["mask"]
+        mask = data["mask"]
+        obj.mask.data = mask if base_dir is None else anchor_mask_path(mask, base_dir)
         obj.boundary_conditions.items = data["boundary_conditions"]
         
         return obj
@@ -291,6 +319,7 @@ class SolverInput(ValidatedContainer):
                 "output_interval": self.simulation_parameters.output_interval
             },
             "boundary_conditions": [{"location": bc.location, "type": bc.type, "values": bc.values} for bc in self.boundary_conditions.items],
+            # A streamed inline mask stays an array (checked vectorized by the firewall)
             "mask": self.mask.data,
             "external_forces": {"force_vector": self.external_forces.force_vector}
         }
\ No newline at end of file
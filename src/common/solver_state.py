@@ -1,9 +1,14 @@
 # src/common/solver_state.py
 
+from collections.abc import Sequence
+
 import numpy as np
 
 from src.common.base_container import ValidatedContainer
+from src.common.boundary_plan import BoundaryPlan
 from src.common.field_schema import FI
+from src.common.grid_math import is_mask_valued
+from src.common.stencil_table import StencilTable
 
 # =========================================================
 # POST: PRE-FLIGHT INTEGRITY CHECK (Rule 9 Sentinel)
@@ -163,6 +168,13 @@ class GridManager(ValidatedContainer):
     @property
     def dz(self) -> float: return (self.z_max - self.z_min) / self.nz
 
+    def cell_centers(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """1-D cell-center coordinates along x, y and z (core cells only)."""
+        return tuple(
+            lo + (np.arange(n) + 0.5) * d
+            for lo, n, d in ((self.x_min, self.nx, self.dx), (self.y_min, self.ny, self.dy), (self.z_min, self.nz, self.dz))
+        )
+
 class FluidPropertiesManager(ValidatedContainer):
     __slots__ = ['_density', '_viscosity']
     
@@ -289,7 +301,7 @@ class MaskManager(ValidatedContainer):
     def to_dict(self):
         if self._mask is None:
             raise RuntimeError("MaskManager: _mask is uninitialized. Cannot serialize.")
-        return self._mask.flatten().tolist()
+        return self.flat.tolist()
     
     def __init__(self):
         self._mask = None
@@ -299,10 +311,15 @@ class MaskManager(ValidatedContainer):
     @mask.setter
     def mask(self, value: np.ndarray):
         if value is not None:
-            if not isinstance(value, np.ndarray) or not np.all(np.isin(value, [-1, 0, 1])):
+            if not isinstance(value, np.ndarray) or not is_mask_valued(value):
                 raise ValueError("Mask must be a NumPy array of -1, 0, 1.")
         self._set_safe("mask", value, np.ndarray)
 
+    @property
+    def flat(self) -> np.ndarray:
+        """The mask in flat input order (get_flat_index: i fastest)."""
+        return self.mask.flatten(order="F")
+
 class ExternalForceManager(ValidatedContainer):
     def to_dict(self):
         if self.force_vector is None:
@@ -362,7 +379,7 @@ class SolverState(ValidatedContainer):
     __slots__ = [
         '_domain_configuration', '_grid', '_fluid_properties', '_initial_conditions', 
         '_boundary_conditions', '_external_forces', '_simulation_parameters', 
-        '_mask', '_fields', '_stencil_matrix', 
+        '_mask', '_fields', '_stencil_matrix', '_stencil_table', '_boundary_plan',
         '_iteration', '_time', '_ready_for_time_loop', '_manifest'
     ]
 
@@ -370,7 +387,8 @@ class SolverState(ValidatedContainer):
         super().__init__()
         self._domain_configuration = self._grid = self._fluid_properties = self._initial_conditions = None
         self._boundary_conditions = self._external_forces = self._simulation_parameters = None
-        self._mask = self._fields = self._stencil_matrix = None
+        self._mask = self._fields = self._stencil_matrix = self._stencil_table = None
+        self._boundary_plan = None
         self._iteration = 0
         self._time = 0.0
         self._ready_for_time_loop = False
@@ -427,9 +445,19 @@ class SolverState(ValidatedContainer):
     def fields(self, value: FieldManager): self._set_safe("fields", value, FieldManager)
 
     @property
-    def stencil_matrix(self) -> list: return self._get_safe("stencil_matrix")
+    def stencil_matrix(self) -> Sequence: return self._get_safe("stencil_matrix")
     @stencil_matrix.setter
-    def stencil_matrix(self, value: list): self._set_safe("stencil_matrix", value, list)
+    def stencil_matrix(self, value: Sequence): self._set_safe("stencil_matrix", value, Sequence)
+
+    @property
+    def stencil_table(self) -> StencilTable: return self._get_safe("stencil_table")
+    @stencil_table.setter
+    def stencil_table(self, value: StencilTable): self._set_safe("stencil_table", value, StencilTable)
+
+    @property
+    def boundary_plan(self) -> BoundaryPlan: return self._get_safe("boundary_plan")
+    @boundary_plan.setter
+    def boundary_plan(self, value: BoundaryPlan): self._set_safe("boundary_plan", value, BoundaryPlan)
 
     @property
     def iteration(self) -> int: return self._iteration
@@ -475,4 +503,12 @@ class SolverState(ValidatedContainer):
             "mask": self.mask.to_dict(),
             "external_forces": self.external_forces.to_dict(),
             "manifest": self.manifest.to_dict()
-        }
\ No newline at end of file
+        }
+
+    def schema_payload(self) -> dict:
+        """to_dict with the mask kept as its flat int8 array, checked vectorized by the firewall."""
+        sections = ("domain_configuration", "grid", "fluid_properties", "initial_conditions",
+                    "simulation_parameters", "boundary_conditions", "external_forces", "manifest")
+        payload = {name: getattr(self, name).to_dict() for name in sections}
+        payload["mask"] = self.mask.flat
+        return payload
\ No newline at end of file
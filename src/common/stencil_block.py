@@ -16,7 +16,8 @@ class StencilBlock(ValidatedContainer):
 
     __slots__ = [
         '_center', '_i_minus', '_i_plus', '_j_minus', '_j_plus', '_k_minus', '_k_plus',
-        '_dx', '_dy', '_dz', '_dt', '_rho', '_mu', '_f_vals'
+        '_dx', '_dy', '_dz', '_dt', '_rho', '_mu', '_f_vals',
+        '__weakref__'
     ]
 
     def __init__(self, center: Cell, i_minus: Cell, i_plus: Cell, 
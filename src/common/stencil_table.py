@@ -0,0 +1,198 @@
+# src/common/stencil_table.py
+
+import operator
+import weakref
+from collections.abc import Sequence
+
+import numpy as np
+
+from src.common.base_container import ValidatedContainer
+from src.common.cell import Cell
+from src.common.cell_view import IndexedCellView
+from src.common.grid_math import get_coords_from_index
+from src.common.stencil_block import StencilBlock
+
+
+class StencilTable(ValidatedContainer):
+    """
+    Compact Topology: the 7-point stencil of every Core cell as flat
+    Foundation indices, one integer array per member.
+
+    Row r describes core cell (i, j, k) with r = i + nx*j + nx*ny*k, the
+    order assemble_stencil_matrix has always used. Physics parameters are
+    stored once for the whole table instead of once per StencilBlock.
+    """
+    __slots__ = [
+        '_center', '_i_minus', '_i_plus', '_j_minus', '_j_plus', '_k_minus', '_k_plus',
+        '_nx_buf', '_ny_buf',
+        '_dx', '_dy', '_dz', '_dt', '_rho', '_mu', '_f_vals'
+    ]
+
+    MEMBERS = ('center', 'i_minus', 'i_plus', 'j_minus', 'j_plus', 'k_minus', 'k_plus')
+
+    def __init__(self, center: np.ndarray, i_minus: np.ndarray, i_plus: np.ndarray,
+                 j_minus: np.ndarray, j_plus: np.ndarray, k_minus: np.ndarray, k_plus: np.ndarray,
+                 nx_buf: int, ny_buf: int,
+                 dx: float, dy: float, dz: float, dt: float,
+                 rho: float, mu: float, f_vals: tuple):
+        for name, value in zip(self.MEMBERS, (center, i_minus, i_plus, j_minus, j_plus, k_minus, k_plus), strict=True):
+            if not isinstance(value, np.ndarray) or value.shape != center.shape:
+                raise ValueError(f"StencilTable: '{name}' must be an index array shaped like 'center'.")
+            object.__setattr__(self, f'_{name}', value)
+
+        object.__setattr__(self, '_nx_buf', int(nx_buf))
+        object.__setattr__(self, '_ny_buf', int(ny_buf))
+
+        # Physics attributes (stored once, Rule 4: SSoT)
+        object.__setattr__(self, '_dx', float(dx))
+        object.__setattr__(self, '_dy', float(dy))
+        object.__setattr__(self, '_dz', float(dz))
+        object.__setattr__(self, '_dt', float(dt))
+        object.__setattr__(self, '_rho', float(rho))
+        object.__setattr__(self, '_mu', float(mu))
+        object.__setattr__(self, '_f_vals', tuple(f_vals))
+
+    def __len__(self) -> int:
+        return self._center.shape[0]
+
+    # --- Topological Accessors (flat Foundation indices) ---
+    @property
+    def center(self) -> np.ndarray: return self._center
+
+    @property
+    def i_minus(self) -> np.ndarray: return self._i_minus
+
+    @property
+    def i_plus(self) -> np.ndarray: return self._i_plus
+
+    @property
+    def j_minus(self) -> np.ndarray: return self._j_minus
+
+    @property
+    def j_plus(self) -> np.ndarray: return self._j_plus
+
+    @property
+    def k_minus(self) -> np.ndarray: return self._k_minus
+
+    @property
+    def k_plus(self) -> np.ndarray: return self._k_plus
+
+    @property
+    def nx_buf(self) -> int: return self._nx_buf
+
+    @property
+    def ny_buf(self) -> int: return self._ny_buf
+
+    # --- Physics Facades ---
+    @property
+    def dx(self) -> float: return self._dx
+
+    @property
+    def dy(self) -> float: return self._dy
+
+    @property
+    def dz(self) -> float: return self._dz
+
+    @property
+    def dt(self) -> float: return self._dt
+
+    @property
+    def rho(self) -> float: return self._rho
+
+    @property
+    def mu(self) -> float: return self._mu
+
+    @property
+    def f_vals(self) -> tuple: return self._f_vals
+
+    def physics_params(self) -> dict:
+        """StencilBlock keyword arguments for the shared physics parameters."""
+        return {
+            "dx": self._dx, "dy": self._dy, "dz": self._dz, "dt": self._dt,
+            "rho": self._rho, "mu": self._mu, "f_vals": self._f_vals
+        }
+
+    def as_block(self, fields_buffer: np.ndarray, rows=slice(None)) -> StencilBlock:
+        """
+        Gather/scatter StencilBlock over the selected rows: every member is an
+        IndexedCellView, so the src/step3/ops kernels and the step 4 applier
+        run over all selected cells in one call.
+        """
+        members = {
+            name: IndexedCellView(getattr(self, f'_{name}')[rows], fields_buffer, self._nx_buf, self._ny_buf)
+            for name in self.MEMBERS
+        }
+        return StencilBlock(**members, **self.physics_params())
+
+
+class LazyStencilMatrix(Sequence):
+    """
+    Read-only, list-compatible stencil_matrix backed by a StencilTable.
+
+    Blocks and Cells are built on demand from the table rows and cached as
+    flyweights in weak-value maps: while a caller holds a block, asking for
+    it (or for a Cell it shares with a neighbor) returns the same instance,
+    and once released it costs nothing. Memory therefore no longer grows
+    with one object per cell, while indexing, len() and iteration behave
+    like the eager list of assemble_stencil_matrix. It is a Sequence, not a
+    list subclass, so no C fast path can read an (empty) list storage
+    instead; copies and pickles rebuild it over the same table and buffer.
+    """
+    __slots__ = ['_table', '_fields_buffer', '_nz_buf', '_blocks', '_cells']
+
+    def __init__(self, table: StencilTable, fields_buffer: np.ndarray):
+        self._table = table
+        self._fields_buffer = fields_buffer
+        self._nz_buf = fields_buffer.shape[0] // (table.nx_buf * table.ny_buf)
+        self._blocks = weakref.WeakValueDictionary()
+        self._cells = weakref.WeakValueDictionary()
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return [self._block(row) for row in range(*key.indices(len(self)))]
+        row = operator.index(key)
+        if row < 0:
+            row += len(self)
+        if not 0 <= row < len(self):
+            raise IndexError("stencil_matrix index out of range")
+        return self._block(row)
+
+    def __iter__(self):
+        for row in range(len(self)):
+            yield self._block(row)
+
+    def __repr__(self) -> str:
+        return f"LazyStencilMatrix({len(self)} blocks)"
+
+    def __reduce__(self):
+        # Flyweight caches are per instance and not picklable: start empty
+        return (LazyStencilMatrix, (self._table, self._fields_buffer))
+
+    def _read_only(self, *_args, **_kwargs):
+        raise TypeError("stencil_matrix is a read-only view of the StencilTable.")
+
+    # List mutators of the eager stencil_matrix fail loudly instead of being missing
+    append = extend = insert = pop = remove = clear = sort = reverse = _read_only
+    __setitem__ = __delitem__ = __iadd__ = _read_only
+
+    def _cell(self, index: int) -> Cell:
+        cell = self._cells.get(index)
+        if cell is None:
+            table = self._table
+            i, j, k = get_coords_from_index(index, table.nx_buf, table.ny_buf)
+            is_ghost = i in (0, table.nx_buf - 1) or j in (0, table.ny_buf - 1) or k in (0, self._nz_buf - 1)
+            cell = Cell(index, self._fields_buffer, table.nx_buf, table.ny_buf, is_ghost=is_ghost)
+            self._cells[index] = cell
+        return cell
+
+    def _block(self, row: int) -> StencilBlock:
+        block = self._blocks.get(row)
+        if block is None:
+            table = self._table
+            members = {name: self._cell(int(getattr(table, name)[row])) for name in table.MEMBERS}
+            block = StencilBlock(**members, **table.physics_params())
+            self._blocks[row] = block
+        return block
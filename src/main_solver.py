@@ -11,19 +11,33 @@ from pathlib import Path
 
 import jsonschema
 
-from src.common.archive_service import archive_simulation_artifacts
+from src.common.archive_service import StreamingArchive, archive_simulation_artifacts
 from src.common.elasticity import ElasticManager  # Moved to common
+from src.common.input_stream import load_input_streaming
+from src.common.schema_validation import compile_schema, load_schema
 from src.common.simulation_context import SimulationContext
+from src.common.solver_state import SolverState
+from src.parallel.process_executor import (
+    ProcessSlabExecutor,
+    release_foundation,
+    share_foundation,
+)
+from src.parallel.slab_executor import SlabExecutor
 from src.step1.orchestrate_step1 import orchestrate_step1
 from src.step2.orchestrate_step2 import orchestrate_step2
-from src.step3.orchestrate_step3 import orchestrate_step3
-from src.step4.orchestrate_step4 import orchestrate_step4
+from src.step2.stencil_assembler import assemble_core_block, assemble_red_black_blocks
+from src.step3.orchestrate_step3 import orchestrate_step3, orchestrate_step3_projection
+from src.step3.ppe_dispatcher import select_ppe_backend
+from src.step4.boundary_dispatcher import DOMAIN_FACES
+from src.step4.orchestrate_step4 import orchestrate_step4_plan
+from src.step5.io_archivist import SnapshotWriter
 from src.step5.orchestrate_step5 import orchestrate_step5
 
 # Global Debug Toggle: Rule 7 requires high-res logging for math
 DEBUG = False
 logger = logging.getLogger("Solver.Main")
 BASE_DIR = Path(__file__).resolve().parent.parent
+SCHEMA_FILE = "schema/solver_input_schema.json"
 
 def _load_simulation_context(input_path: str) -> SimulationContext:
     """Assembles physical input and numerical config into a unified context."""
@@ -36,24 +50,36 @@ def _load_simulation_context(input_path: str) -> SimulationContext:
     if not config_path.exists():
         raise FileNotFoundError(f"config.json required at {config_path}")
 
-    with open(full_input_path) as f:
-        input_data = json.load(f)
+    # Streamed: an inline mask goes straight into an int8 array
+    input_data = load_input_streaming(full_input_path)
     with open(config_path) as f:
         config_data = json.load(f)
         
-    return SimulationContext.create(input_data, config_data)
+    return SimulationContext.create(input_data, config_data, full_input_path.parent)
 
-def run_solver(input_path: str) -> str:
-    """Main Orchestrator with Elastic Stability."""
-    
-    context = _load_simulation_context(input_path)
+def load_input_schema() -> dict:
+    """Reads the input contract enforced by both firewalls (once; the dict is shared, read-only)."""
+    return load_schema(str(BASE_DIR / SCHEMA_FILE))
 
+def assemble_simulation(context: SimulationContext, schema: dict, mask_3d=None, stencil_table=None,
+                        fields_buffer=None, communicator=None):
+    """
+    Steps 1-2 behind the input and state firewalls.
+
+    'mask_3d' and 'stencil_table' are optional pre-built topology for the 
+    same grid and mask (see src/sweep_runner.py); they are rebuilt from the 
+    input when None. 'fields_buffer' is an optional preallocated Foundation 
+    (e.g. one case row of an EnsembleSolver batch) that Step 2 is wired to. 
+    An optional 'communicator' marks the input as its rank's block of a 
+    z-decomposed domain: boundary rules are compiled only for the block's 
+    faces on the global boundary (Communicator.physical_faces). 
+    Returns the state and the shared Foundation handle (None unless config 
+    'num_processes' > 1).
+    """
     # 1. PRE-EXECUTION FIREWALL: Validate Input Schema
-    SCHEMA_PATH = BASE_DIR / "schema/solver_input_schema.json"
     try:
-        with open(SCHEMA_PATH) as f:
-            schema = json.load(f)
-        jsonschema.validate(instance=context.input_data.to_dict(), schema=schema)
+        # Compiled once per schema; array payloads are checked vectorized
+        compile_schema(schema).validate(context.input_data.to_dict())
         if DEBUG:
             print(f"DEBUG [Main]: ✅ Input schema validation passed.")
     except jsonschema.exceptions.ValidationError as e:
@@ -61,76 +87,174 @@ def run_solver(input_path: str) -> str:
         raise
 
     # 2. ASSEMBLY via Orchestrators (Foundation logic)
-    state = orchestrate_step1(context)
-    state = orchestrate_step2(state)
-
-    # 3. FIREWALL: State Contract Validation (Post-Assembly, Rule 4/SSoT)
+    state = orchestrate_step1(context, mask_3d=mask_3d)
+    if fields_buffer is not None:
+        fields_buffer[...] = state.fields.data
+        state.fields.data = fields_buffer
+    # Opt-in worker processes: Step 2 must wire its views over the shared Foundation
+    foundation = share_foundation(state) if context.config.num_processes > 1 else None
     try:
-        state.validate_against_schema(str(SCHEMA_PATH))
-        if DEBUG:
-            print("DEBUG [Main]: ✅ State validation passed.")
-    except jsonschema.exceptions.ValidationError as e:
-        path_str = '.'.join([str(p) for p in e.path])
-        print(f"!!! CONTRACT VIOLATION at {path_str}: {e.message}")
-        raise
-    
-    # 4. ELASTICITY ENGINE (Numerical SSoT)
-    # We pass context.config directly as elasticity manages numerical behavior
-    elasticity = ElasticManager(context.config)
+        physical_faces = communicator.physical_faces() if communicator is not None else DOMAIN_FACES
+        state = orchestrate_step2(state, stencil_table=stencil_table, physical_faces=physical_faces)
 
-    # 5. MAIN EXECUTION LOOP
-    while state.ready_for_time_loop:
+        # 3. FIREWALL: State Contract Validation (Post-Assembly, Rule 4/SSoT)
         try:
-            # A. PREDICTOR PASS
-            # Rule 4: block.dt is internally synced with elasticity.dt
-            for block in state.stencil_matrix:
-                orchestrate_step3(block, context, elasticity, is_first_pass=True)
-                orchestrate_step4(block, context, state.grid, state.boundary_conditions)
+            state.validate_against_schema(str(BASE_DIR / SCHEMA_FILE))
+            if DEBUG:
+                print("DEBUG [Main]: ✅ State validation passed.")
+        except jsonschema.exceptions.ValidationError as e:
+            path_str = '.'.join([str(p) for p in e.path])
+            print(f"!!! CONTRACT VIOLATION at {path_str}: {e.message}")
+            raise
+    except BaseException:
+        # No run will release the shared Foundation: drop its segment name now
+        if foundation is not None:
+            foundation.unlink()
+        raise
+
+    return state, foundation
+
+def execute_time_loop(state: SolverState, context: SimulationContext, foundation=None,
+                      archive: StreamingArchive | None = None) -> SolverState:
+    """
+    Runs the elastic time loop of an assembled state up to total_time.
+    Snapshots are streamed into 'archive' as they are written, when given.
+    The shared Foundation segment ('foundation', see assemble_simulation) 
+    is released on every exit.
+    """
+    # Workers, shared-memory segments and the writer thread are released on every exit,
+    # including the FATAL dt circuit breaker and a failure to start any of them
+    executor = None
+    writer = None
+    try:
+        # 4. ELASTICITY ENGINE (Numerical SSoT)
+        # We pass context.config directly as elasticity manages numerical behavior;
+        # the starting dt is the physical time_step from the simulation input.
+        elasticity = ElasticManager(context.config, context.input_data.simulation_parameters.time_step)
+
+        # Whole-core view block: drives the vectorized predictor over the padded Foundation
+        core_block = assemble_core_block(state)
+        # Parity sub-lattice view blocks (red, then black) for the vectorized SOR sweep
+        sweep_blocks = assemble_red_black_blocks(state)
+        # PPE backend: config.ppe_solver, or the spectral direct solve for all-fluid boxes
+        ppe_backend = select_ppe_backend(context.config, state.mask)
+        # Opt-in z-slab parallelism for the Step 3 kernels (config 'num_processes' / 'num_threads')
+        if foundation is not None:
+            executor = ProcessSlabExecutor(state, context.config.num_processes, foundation)
+        elif context.config.num_threads > 1:
+            executor = SlabExecutor(state, context.config.num_threads)
+        # Opt-in background snapshot writes (config 'snapshot_queue_depth')
+        if context.config.snapshot_queue_depth > 0:
+            writer = SnapshotWriter(state, context.config.snapshot_queue_depth, archive)
+
+        # Opt-in panic rollback target (config 'checkpoint_depth'): the initial state
+        elasticity.checkpoint(state)
+
+        # 5. MAIN EXECUTION LOOP
+        while state.ready_for_time_loop:
+            try:
+                # Opt-in (config 'cfl_number'): largest stable dt for this attempt
+                elasticity.adapt_dt(state)
+
+                # A. PREDICTOR PASS
+                # Rule 4: block.dt is internally synced with elasticity.dt.
+                # One call computes v* for every core cell with shifted NumPy slices.
+                if executor is None:
+                    orchestrate_step3(core_block, context, elasticity, is_first_pass=True)
+                else:
+                    executor.predict(elasticity.dt)
+                # Boundary plan compiled in Step 2: grouped fancy-indexed writes
+                orchestrate_step4_plan(state)
             
-            # B. ITERATIVE SOLVER (PPE)
-            for _ in range(elasticity.max_iter):
-                max_delta = 0.0
-                for block in state.stencil_matrix:
-                    _, delta = orchestrate_step3(block, context, elasticity, is_first_pass=False)
-                    orchestrate_step4(block, context, state.grid, state.boundary_conditions)
-                    max_delta = max(max_delta, delta)
-                
-                # Performance optimization: Exit PPE loop if tolerance met
-                if max_delta < context.config.ppe_tolerance:
-                    break
+                # B. ITERATIVE SOLVER (PPE)
+                # Selected backend solves for P_NEXT, then one velocity correction.
+                # Ghost P_NEXT is refreshed by the Step 4 pass above and held fixed
+                # by every backend during the solve.
+                ppe_iterations, _ = orchestrate_step3_projection(
+                    core_block, sweep_blocks, ppe_backend, context, elasticity, executor
+                )
             
-            # C. VALIDATE & COMMIT (Transactional Gate)
-            # Rule 4/9: Merges trial buffers only if the time-step is numerically valid
-            if not elasticity.validate_and_commit(state):
-                raise ArithmeticError("Numerical instability detected in trial buffers.")
+                # C. VALIDATE & COMMIT (Transactional Gate)
+                # Rule 4/9: Merges trial buffers only if the time-step is numerically valid
+                if executor is None:
+                    committed = elasticity.validate_and_commit(state)
+                else:
+                    committed = executor.validate_and_commit(elasticity, state)
+                if not committed:
+                    raise ArithmeticError("Numerical instability detected in trial buffers.")
         
-            # D. ADVANCE (Physical & Temporal)
-            state.iteration += 1
-            state.time += elasticity.dt 
-            state = orchestrate_step5(state, context)
+                # D. ADVANCE (Physical & Temporal)
+                state.iteration += 1
+                state.time += elasticity.dt 
+                state = orchestrate_step5(state, context, writer, archive)
+                elasticity.checkpoint(state)
             
-            # Heal parameters if simulation is running smoothly
-            elasticity.gradual_recovery()
+                # Heal parameters if simulation is running smoothly
+                elasticity.record_solve(ppe_iterations)
+                elasticity.gradual_recovery()
 
-            if DEBUG and state.iteration % 10 == 0:
-                print(f"DEBUG [Main]: Step {state.iteration} | Time {state.time:.4f} | dt {elasticity.dt:.2e}")
+                if DEBUG and state.iteration % 10 == 0:
+                    print(f"DEBUG [Main]: Step {state.iteration} | Time {state.time:.4f} | dt {elasticity.dt:.2e}")
 
-        except ArithmeticError as e:
-            logger.warning(f"PANIC: Numerical instability detected ({str(e)}). Triggering Elastic Recovery.")
+            except ArithmeticError as e:
+                logger.warning(f"PANIC: Numerical instability detected ({str(e)}). Triggering Elastic Recovery.")
+
+                # Back to the last committed Foundation, not the half-written trials
+                if elasticity.checkpoint_depth > 0:
+                    elasticity.rollback(state)
             
-            # --- CIRCUIT BREAKER ---
-            if elasticity.dt < elasticity.dt_floor: 
-                raise RuntimeError(f"FATAL: dt ({elasticity.dt}) dropped below limit.") from e
+                # --- CIRCUIT BREAKER ---
+                if elasticity.dt < elasticity.dt_floor: 
+                    raise RuntimeError(f"FATAL: dt ({elasticity.dt}) dropped below limit.") from e
 
-            elasticity.apply_panic_mode()
-            continue # Retry the same time-step with safer parameters
+                elasticity.apply_panic_mode()
+                continue # Retry the same time-step with safer parameters
         
-        # Termination check
-        if state.time >= context.input_data.simulation_parameters.total_time:
-            state.ready_for_time_loop = False
+            # Termination check
+            if state.time >= context.input_data.simulation_parameters.total_time:
+                state.ready_for_time_loop = False
+    except BaseException:
+        # Views of the shared Foundation live on in the traceback: release its name only
+        if foundation is not None:
+            foundation.unlink()
+        raise
+    finally:
+        try:
+            if executor is not None:
+                executor.shutdown()
+        finally:
+            # Every queued snapshot is on disk (and in the manifest) before archiving
+            if writer is not None:
+                writer.close()
+
+    if foundation is not None:
+        # The loop's views go first: the segment can only be closed once nothing maps it
+        del core_block, sweep_blocks, executor
+        release_foundation(state, foundation)
+
+    # Opt-in controller trace, archived with the snapshots
+    if elasticity.target_iterations is not None:
+        elasticity.export_history(Path(state.manifest.output_directory) / "controller_history.json")
+
+    return state
 
-    # 6. ARCHIVING TRIGGER (Rule 4: Atomic lifecycle completion)
-    return archive_simulation_artifacts(state)
+def run_solver(input_path: str) -> str:
+    """Main Orchestrator with Elastic Stability."""
+    
+    context = _load_simulation_context(input_path)
+    state, foundation = assemble_simulation(context, load_input_schema())
+
+    # Snapshots are appended to the final ZIP as they are produced;
+    # any failure up to the final rename removes the partial archive
+    archive = StreamingArchive()
+    try:
+        state = execute_time_loop(state, context, foundation, archive)
+
+        # 6. ARCHIVING TRIGGER (Rule 4: Atomic lifecycle completion)
+        return archive_simulation_artifacts(state, archive)
+    except BaseException:
+        archive.abort()
+        raise
 
 if __name__ == "__main__":
     if len(sys.argv) < 2:
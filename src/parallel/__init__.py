@@ -0,0 +1,35 @@
+# src/parallel/__init__.py
+
+"""
+Parallel Execution Package.
+
+Opt-in executors that run the vectorized Step 3 kernels over partitions of 
+the Core Domain, on threads (SlabExecutor) or on forked worker processes 
+over a shared-memory Foundation (ProcessSlabExecutor). Results are 
+identical to the serial path. Communicator is the rank/halo layer for 
+decompositions whose ranks do not share memory. EnsembleSolver advances 
+a batch of same-topology cases along a leading case axis.
+
+Compliance:
+- Rule 8 (API Minimalism): Only the executors are exposed.
+"""
+
+from src.parallel.communicator import Communicator, SocketCommunicator
+from src.parallel.ensemble import EnsembleSolver, allocate_batch
+from src.parallel.process_executor import (
+    ProcessSlabExecutor,
+    release_foundation,
+    share_foundation,
+)
+from src.parallel.slab_executor import SlabExecutor
+
+__all__ = [
+    "Communicator",
+    "EnsembleSolver",
+    "ProcessSlabExecutor",
+    "SlabExecutor",
+    "SocketCommunicator",
+    "allocate_batch",
+    "release_foundation",
+    "share_foundation",
+]
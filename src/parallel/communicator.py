@@ -0,0 +1,244 @@
+# src/parallel/communicator.py
+
+"""
+Rank topology and halo exchange for a z-decomposed Core.
+
+Each rank holds its own padded Foundation over core planes [k_start, k_stop)
+of the global grid (see get_slab_bounds). Ghost ownership:
+- x/y ghost faces, and the z faces on the global boundary, belong to
+  Step 4: assemble_simulation(..., communicator=...) compiles boundary
+  rules only for physical_faces;
+- a z ghost plane facing another rank is a halo, filled from that rank's
+  adjacent core plane by exchange_halos.
+
+A per-rank time loop (halo exchange each step, allreduce of the PPE and
+commit audits) is not wired into main_solver yet; ranks are driven by the
+caller.
+
+Compliance:
+- Rule 0 (Law of Performance): z-planes are contiguous rows of the
+  Foundation, so halos are sent and received in place, without packing.
+- Rule 5 (Explicit or Error): Message sizes are checked against the
+  receiving buffer; a mismatch raises instead of truncating.
+"""
+
+import abc
+import os
+import socket
+import struct
+import time
+
+import numpy as np
+
+from src.common.grid_math import get_slab_bounds
+from src.step4.boundary_dispatcher import DOMAIN_FACES
+
+# Rule 7: Granular Traceability
+DEBUG = False
+
+# Message header: payload length in bytes
+_HEADER = struct.Struct("<Q")
+
+
+class Communicator(abc.ABC):
+    """
+    Transport-agnostic rank communicator for a 1D decomposition along z.
+
+    Subclasses provide point-to-point send/recv of contiguous arrays (and close);
+    neighbor topology, halo exchange and allreduce are built on top of them.
+    """
+    __slots__ = ['rank', 'size']
+
+    def __init__(self, rank: int, size: int):
+        if not (0 <= rank < size):
+            raise ValueError(f"Communicator: rank {rank} outside [0, {size}).")
+        self.rank = rank
+        self.size = size
+
+    # --- Topology ---
+    @property
+    def lower(self) -> int | None:
+        """Rank owning the planes below this one (None on the global z_min face)."""
+        return self.rank - 1 if self.rank > 0 else None
+
+    @property
+    def upper(self) -> int | None:
+        """Rank owning the planes above this one (None on the global z_max face)."""
+        return self.rank + 1 if self.rank < self.size - 1 else None
+
+    @property
+    def neighbors(self) -> dict[str, int | None]:
+        """Neighbor rank across each z face of the local block (None on the global boundary)."""
+        return {"z_min": self.lower, "z_max": self.upper}
+
+    def local_bounds(self, nz: int) -> tuple[int, int]:
+        """Global core z-range [k_start, k_stop) owned by this rank."""
+        bounds = get_slab_bounds(nz, self.size)
+        if len(bounds) != self.size:
+            raise ValueError(f"Cannot split nz={nz} core planes over {self.size} ranks.")
+        return bounds[self.rank]
+
+    def physical_faces(self) -> tuple[str, ...]:
+        """Domain faces of the local block that lie on the global boundary (no neighbor rank)."""
+        neighbors = self.neighbors
+        return tuple(face for face in DOMAIN_FACES if neighbors.get(face) is None)
+
+    # --- Transport (backend specific) ---
+    @abc.abstractmethod
+    def send(self, dest: int, array: np.ndarray) -> None:
+        """Sends a contiguous array to rank 'dest' (blocking)."""
+
+    @abc.abstractmethod
+    def recv(self, source: int, out: np.ndarray) -> None:
+        """Receives a message from rank 'source' into 'out' (blocking)."""
+
+    @abc.abstractmethod
+    def close(self) -> None:
+        """Releases the transport's connections."""
+
+    # --- Collectives ---
+    def exchange_halos(self, data: np.ndarray, nx_buf: int, ny_buf: int) -> None:
+        """
+        Fills the z ghost planes facing other ranks with their adjacent core
+        planes, all fields at once. Even ranks send first and odd ranks
+        receive first, so blocking transports never wait on each other.
+        """
+        plane = nx_buf * ny_buf
+        nz_buf = data.shape[0] // plane
+
+        def rows(k: int) -> np.ndarray:
+            return data[k * plane:(k + 1) * plane]
+
+        # Upward pass: top core plane -> upper's low ghost plane
+        # Downward pass: bottom core plane -> lower's high ghost plane
+        passes = (
+            (self.upper, rows(nz_buf - 2), self.lower, rows(0)),
+            (self.lower, rows(1), self.upper, rows(nz_buf - 1)),
+        )
+        for dest, outgoing, source, incoming in passes:
+            if self.rank % 2 == 0:
+                if dest is not None:
+                    self.send(dest, outgoing)
+                if source is not None:
+                    self.recv(source, incoming)
+            else:
+                if source is not None:
+                    self.recv(source, incoming)
+                if dest is not None:
+                    self.send(dest, outgoing)
+
+    def allreduce(self, values, op: str = "max") -> np.ndarray:
+        """
+        Element-wise reduction over all ranks ('max' or 'min'), returned on
+        every rank. NaN propagates, so a divergent rank fails every audit
+        (e.g. the PPE max_delta or the validate_and_commit bounds).
+        """
+        reduce = {"max": np.maximum, "min": np.minimum}.get(op)
+        if reduce is None:
+            raise ValueError(f"Unsupported allreduce op '{op}'.")
+
+        result = np.array(values, dtype=np.float64).ravel()
+        if self.rank == 0:
+            incoming = np.empty_like(result)
+            for source in range(1, self.size):
+                self.recv(source, incoming)
+                result = reduce(result, incoming)
+            for dest in range(1, self.size):
+                self.send(dest, result)
+        else:
+            self.send(0, result)
+            self.recv(0, result)
+        return result
+
+
+class SocketCommunicator(Communicator):
+    """
+    Communicator over stream sockets, one connection per rank pair.
+
+    'addresses[r]' is where rank r listens: a (host, port) tuple for TCP or
+    a filesystem path for a Unix socket. Rank r accepts connections from
+    higher ranks and connects to lower ones, retrying until 'timeout'.
+    """
+    __slots__ = ['_listener', '_peers', '_address']
+
+    def __init__(self, rank: int, addresses: list, timeout: float = 30.0):
+        super().__init__(rank, len(addresses))
+        self._peers = {}
+        self._address = addresses[rank]
+
+        family = socket.AF_UNIX if isinstance(addresses[rank], str) else socket.AF_INET
+        self._listener = socket.socket(family, socket.SOCK_STREAM)
+        if family == socket.AF_INET:
+            self._listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._listener.bind(addresses[rank])
+        self._listener.listen(self.size)
+        self._listener.settimeout(timeout)
+
+        # 1. Connect down: lower ranks are (or will soon be) listening
+        deadline = time.monotonic() + timeout
+        for peer in range(rank):
+            self._peers[peer] = self._connect(addresses[peer], deadline)
+            self._peers[peer].sendall(_HEADER.pack(rank))
+
+        # 2. Accept up: each higher rank announces itself
+        for _ in range(rank + 1, self.size):
+            conn, _ = self._listener.accept()
+            conn.settimeout(None)
+            peer = _HEADER.unpack(self._read_exact(conn, _HEADER.size))[0]
+            self._peers[peer] = conn
+
+        for conn in self._peers.values():
+            if conn.family == socket.AF_INET:
+                conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+        if DEBUG:
+            print(f"DEBUG [Parallel]: rank {rank}/{self.size} connected to {sorted(self._peers)}")
+
+    @staticmethod
+    def _connect(address, deadline: float) -> socket.socket:
+        family = socket.AF_UNIX if isinstance(address, str) else socket.AF_INET
+        while True:
+            sock = socket.socket(family, socket.SOCK_STREAM)
+            try:
+                sock.connect(address)
+                return sock
+            except (ConnectionRefusedError, FileNotFoundError):
+                sock.close()
+                if time.monotonic() > deadline:
+                    raise
+                time.sleep(0.01)
+
+    @staticmethod
+    def _read_exact(conn: socket.socket, n_bytes: int, out: memoryview = None) -> bytes | None:
+        buffer = out if out is not None else memoryview(bytearray(n_bytes))
+        received = 0
+        while received < n_bytes:
+            chunk = conn.recv_into(buffer[received:], n_bytes - received)
+            if chunk == 0:
+                raise ConnectionError("Peer closed the connection mid-message.")
+            received += chunk
+        return None if out is not None else bytes(buffer)
+
+    def send(self, dest: int, array: np.ndarray) -> None:
+        payload = np.ascontiguousarray(array)
+        conn = self._peers[dest]
+        conn.sendall(_HEADER.pack(payload.nbytes))
+        conn.sendall(memoryview(payload).cast("B"))
+
+    def recv(self, source: int, out: np.ndarray) -> None:
+        """Receives straight into 'out', which must be C-contiguous."""
+        if not out.flags.c_contiguous:
+            raise ValueError("recv target must be C-contiguous.")
+        conn = self._peers[source]
+        n_bytes = _HEADER.unpack(self._read_exact(conn, _HEADER.size))[0]
+        if n_bytes != out.nbytes:
+            raise ValueError(f"Message from rank {source} has {n_bytes} bytes, expected {out.nbytes}.")
+        self._read_exact(conn, n_bytes, memoryview(out).cast("B"))
+
+    def close(self) -> None:
+        for conn in self._peers.values():
+            conn.close()
+        self._peers = {}
+        self._listener.close()
+        if isinstance(self._address, str):
+            os.unlink(self._address)
@@ -0,0 +1,316 @@
+# src/parallel/ensemble.py
+
+"""
+Batched multi-case solver over a Foundation with a leading case axis.
+
+Cases that share grid and mask are stored as rows of one
+(n_cases, n_cells, n_fields) buffer. Per-case rho, mu, body force, grid
+spacing, dt and omega are (n_cases, 1, 1, 1) arrays that broadcast against
+the batched padded view, so the predictor, PPE source term, red-black SOR
+sweeps and velocity correction advance every case in the same NumPy calls.
+The formulas and their evaluation order are those of src/step3/ops, so every
+case matches its serial SOR run bit for bit.
+
+Each case keeps its own ElasticManager, time and iteration count. Diverged
+cases retry with their own Panic Mode while the others commit, and a case
+stops sweeping the PPE once its own max delta converges.
+
+Compliance:
+- Rule 0 (Law of Performance): One kernel call per batch, not per case.
+- Rule 7 (Traceability): Non-finite values are audited per case at commit
+  instead of raised mid-kernel, so one divergent case cannot stall the batch.
+"""
+
+from pathlib import Path
+
+import numpy as np
+
+from src.common.elasticity import VELOCITY, VELOCITY_STAR, ElasticManager
+from src.common.field_schema import FI
+from src.common.grid_math import get_padded_view, get_red_black_indices, shift_index
+from src.step3.ppe_dispatcher import select_ppe_backend
+from src.step4.orchestrate_step4 import orchestrate_step4_plan
+from src.step5.orchestrate_step5 import orchestrate_step5
+
+# Rule 7: Granular Traceability
+DEBUG = False
+
+VELOCITY_FIELDS = ((FI.VX, FI.VX_STAR), (FI.VY, FI.VY_STAR), (FI.VZ, FI.VZ_STAR))
+
+
+def allocate_batch(n_cases: int, n_cells: int) -> np.ndarray:
+    """Zeroed ensemble Foundation; row c is handed to case c as its fields_buffer."""
+    return np.zeros((n_cases, n_cells, FI.num_fields()), dtype=np.float64)
+
+
+class EnsembleSolver:
+    """
+    Advances assembled cases whose Foundations are the rows of 'batch'.
+
+    'states[c]' and 'contexts[c]' describe row c; a None state marks a row
+    that never runs (e.g. a case whose input failed to assemble). The PPE is
+    red-black SOR, with each case's ppe_tolerance and its Elastic Manager's
+    omega and max_iter, so every case must configure the 'sor' backend; any
+    other raises rather than silently switching solvers. An all-fluid case
+    keeps SOR instead of the spectral shortcut of its serial run
+    (select_ppe_backend with auto_spectral=False): both solve the same
+    system, to ppe_tolerance rather than bit for bit.
+    """
+    __slots__ = [
+        'batch', 'states', 'contexts', 'elasticities', 'padded', 'errors',
+        '_core', '_colors', '_rho', '_mu', '_force', '_dx', '_dy', '_dz',
+        '_dx2', '_dy2', '_dz2', '_stencil_denom', '_tolerance', '_limit'
+    ]
+
+    def __init__(self, batch: np.ndarray, states: list, contexts: list):
+        if not (batch.shape[0] == len(states) == len(contexts)):
+            raise ValueError("EnsembleSolver: one state and context per batch row required.")
+        live = [c for c, state in enumerate(states) if state is not None]
+        if not live:
+            raise ValueError("EnsembleSolver: no assembled case in the batch.")
+
+        grid = states[live[0]].grid
+        nx, ny, nz = grid.nx, grid.ny, grid.nz
+        for c in live:
+            state = states[c]
+            if (state.grid.nx, state.grid.ny, state.grid.nz) != (nx, ny, nz):
+                raise ValueError(f"EnsembleSolver: case {c} has a different grid resolution.")
+            if state.fields.data.ctypes.data != batch[c].ctypes.data or state.fields.data.shape != batch[c].shape:
+                raise ValueError(f"EnsembleSolver: case {c} Foundation is not batch row {c}.")
+            # Rule 5: the configured PPE backend is the one that runs (no spectral shortcut)
+            backend = select_ppe_backend(contexts[c].config, state.mask, auto_spectral=False)
+            if backend != "sor":
+                raise ValueError(f"EnsembleSolver: case {c} resolves to the '{backend}' PPE backend; "
+                                 "batched cases support 'sor' only.")
+
+        self.batch = batch
+        self.states = states
+        self.contexts = contexts
+        self.elasticities = [
+            None if states[c] is None
+            else ElasticManager(contexts[c].config, contexts[c].input_data.simulation_parameters.time_step)
+            for c in range(len(states))
+        ]
+        self.errors = [None if state is not None else "Case was not assembled." for state in states]
+        # Opt-in panic rollback target (config 'checkpoint_depth'): the initial state
+        for c in live:
+            self.elasticities[c].checkpoint(states[c])
+        self.padded = get_padded_view(batch, nx + 2, ny + 2, nz + 2)
+
+        # Spatial regions (buffer coordinates): whole core, then parity sub-lattices
+        self._core = (slice(1, nx + 1, 1), slice(1, ny + 1, 1), slice(1, nz + 1, 1))
+        self._colors = get_red_black_indices(nx, ny, nz)
+
+        # Per-case physics, broadcast over (case, i, j, k); unused rows take live[0]'s values.
+        # Squares are taken on Python floats, exactly as the serial StencilBlock does.
+        rows = [states[c] if states[c] is not None else states[live[0]] for c in range(len(states))]
+        self._rho = self._per_case([s.fluid_properties.density for s in rows])
+        self._mu = self._per_case([s.fluid_properties.viscosity for s in rows])
+        self._force = tuple(
+            self._per_case([float(s.external_forces.force_vector[n]) for s in rows]) for n in range(3)
+        )
+        self._dx = self._per_case([s.grid.dx for s in rows])
+        self._dy = self._per_case([s.grid.dy for s in rows])
+        self._dz = self._per_case([s.grid.dz for s in rows])
+        self._dx2 = self._per_case([s.grid.dx**2 for s in rows])
+        self._dy2 = self._per_case([s.grid.dy**2 for s in rows])
+        self._dz2 = self._per_case([s.grid.dz**2 for s in rows])
+        self._stencil_denom = self._per_case(
+            [2.0 * (1.0 / s.grid.dx**2 + 1.0 / s.grid.dy**2 + 1.0 / s.grid.dz**2) for s in rows]
+        )
+
+        configs = [contexts[c].config if states[c] is not None else contexts[live[0]].config for c in range(len(states))]
+        self._tolerance = np.array([config.ppe_tolerance for config in configs], dtype=np.float64)
+        self._limit = np.array([config.divergence_threshold for config in configs], dtype=np.float64)
+
+    @staticmethod
+    def _per_case(values) -> np.ndarray:
+        return np.asarray(values, dtype=np.float64).reshape(-1, 1, 1, 1)
+
+    # --- Field access over (case, region) ---
+    def _get(self, index: tuple, field_id: int) -> np.ndarray:
+        return self.padded[(slice(None), *index, field_id)]
+
+    def _set(self, index: tuple, field_id: int, value, where=None) -> None:
+        if where is None:
+            self.padded[(slice(None), *index, field_id)] = value
+        else:
+            np.copyto(self.padded[(slice(None), *index, field_id)], value, where=where)
+
+    def _neighbors(self, index: tuple, field_id: int, axis: int) -> tuple[np.ndarray, np.ndarray]:
+        return (self._get(shift_index(index, axis, 1), field_id),
+                self._get(shift_index(index, axis, -1), field_id))
+
+    # --- Batched src/step3/ops ---
+    def _laplacian(self, index: tuple, field_id: int) -> np.ndarray:
+        f_c = self._get(index, field_id)
+        f_ip, f_im = self._neighbors(index, field_id, 0)
+        f_jp, f_jm = self._neighbors(index, field_id, 1)
+        f_kp, f_km = self._neighbors(index, field_id, 2)
+        return (
+            (f_ip - 2.0 * f_c + f_im) / self._dx2 +
+            (f_jp - 2.0 * f_c + f_jm) / self._dy2 +
+            (f_kp - 2.0 * f_c + f_km) / self._dz2
+        )
+
+    def _gradient(self, index: tuple, field_id: int) -> tuple:
+        (f_ip, f_im), (f_jp, f_jm), (f_kp, f_km) = (self._neighbors(index, field_id, axis) for axis in range(3))
+        return (
+            (f_ip - f_im) / (2.0 * self._dx),
+            (f_jp - f_jm) / (2.0 * self._dy),
+            (f_kp - f_km) / (2.0 * self._dz),
+        )
+
+    def _advection(self, index: tuple, field_id: int) -> np.ndarray:
+        df_dx, df_dy, df_dz = self._gradient(index, field_id)
+        u_c, v_c, w_c = (self._get(index, f) for f in (FI.VX, FI.VY, FI.VZ))
+        return (u_c * df_dx) + (v_c * df_dy) + (w_c * df_dz)
+
+    def predict(self, dt: np.ndarray) -> None:
+        """Batched compute_local_predictor_step: v* for every case."""
+        core = self._core
+        grad_p = self._gradient(core, FI.P)
+        dt_over_rho = dt / self._rho
+        for n, (field_id, star_id) in enumerate(VELOCITY_FIELDS):
+            lap = self._laplacian(core, field_id)
+            adv = self._advection(core, field_id)
+            v_star = self._get(core, field_id) + dt_over_rho * (
+                self._mu * lap - self._rho * adv + self._force[n] - grad_p[n]
+            )
+            self._set(core, star_id, v_star)
+
+    def ppe_rhs(self, dt: np.ndarray) -> np.ndarray:
+        """Batched compute_local_ppe_rhs, shaped (n_cases, nx, ny, nz)."""
+        core = self._core
+        lap_p_n = self._laplacian(core, FI.P)
+        rhie_chow_term = dt * lap_p_n
+        (u_ip, u_im), (v_jp, v_jm), (w_kp, w_km) = (
+            self._neighbors(core, star_id, axis) for axis, (_, star_id) in enumerate(VELOCITY_FIELDS)
+        )
+        div_v_star = (u_ip - u_im) / (2.0 * self._dx) + (v_jp - v_jm) / (2.0 * self._dy) + (w_kp - w_km) / (2.0 * self._dz)
+        return (self._rho / dt) * (div_v_star - rhie_chow_term)
+
+    def sweep(self, omega: np.ndarray, rhs: np.ndarray, running: np.ndarray) -> np.ndarray:
+        """
+        One red-black SOR sweep; only cases flagged in 'running' are written.
+        Returns each case's max |p_new - p_old|.
+        """
+        where = running.reshape(-1, 1, 1, 1)
+        max_delta = np.zeros(len(running))
+        for index in self._colors:
+            (p_ip, p_im), (p_jp, p_jm), (p_kp, p_km) = (self._neighbors(index, FI.P_NEXT, axis) for axis in range(3))
+            sum_neighbors = (p_ip + p_im) / self._dx2 + (p_jp + p_jm) / self._dy2 + (p_kp + p_km) / self._dz2
+            p_old = self._get(index, FI.P_NEXT)
+            core_index = tuple(slice(s.start - 1, s.stop - 1, s.step) for s in index)
+            p_new = (1.0 - omega) * p_old + (omega / self._stencil_denom) * (sum_neighbors - rhs[(slice(None), *core_index)])
+            delta = abs(p_new - p_old)
+            max_delta = np.maximum(max_delta, delta.max(axis=(1, 2, 3)))
+            self._set(index, FI.P_NEXT, p_new, where=where)
+        return max_delta
+
+    def solve_pressure(self, omega: np.ndarray, rhs: np.ndarray, max_iter: np.ndarray, active: np.ndarray) -> np.ndarray:
+        """
+        Batched solve_pressure_poisson_sor: a case leaves the convergence mask
+        after the sweep where its max delta drops below its tolerance or its
+        max_iter sweeps are spent. Returns the sweeps each case performed and
+        each case's last two sweep deltas (convergence factor telemetry).
+        """
+        running = active.copy()
+        sweeps = np.zeros(len(active), dtype=np.int64)
+        deltas = np.zeros((len(active), 2))
+        while running.any():
+            max_delta = self.sweep(omega, rhs, running)
+            sweeps += running
+            deltas[running] = np.column_stack((deltas[running, 1], max_delta[running]))
+            running &= ~(max_delta < self._tolerance) & (sweeps < max_iter)
+        return sweeps, deltas
+
+    def correct(self, dt: np.ndarray) -> None:
+        """Batched apply_local_velocity_correction on P_NEXT."""
+        core = self._core
+        grad_p = self._gradient(core, FI.P_NEXT)
+        scaling = dt / self._rho
+        for n, (_, star_id) in enumerate(VELOCITY_FIELDS):
+            self._set(core, star_id, self._get(core, star_id) - (scaling * grad_p[n]))
+
+    def validate_and_commit(self, active: np.ndarray) -> np.ndarray:
+        """
+        Per-case ElasticManager.validate_and_commit: the same fused min/max
+        audit reduced per row, then one masked commit of the passing cases.
+        """
+        trial_velocity = self.batch[:, :, VELOCITY_STAR]
+        trial_pressure = self.batch[:, :, FI.P_NEXT]
+        lo = np.minimum(trial_velocity.min(axis=(1, 2)), trial_pressure.min(axis=1))
+        hi = np.maximum(trial_velocity.max(axis=(1, 2)), trial_pressure.max(axis=1))
+        ok = active & (-self._limit <= lo) & (hi <= self._limit)
+
+        np.copyto(self.batch[:, :, VELOCITY], trial_velocity, where=ok.reshape(-1, 1, 1))
+        np.copyto(self.batch[:, :, FI.P], trial_pressure, where=ok.reshape(-1, 1))
+        return ok
+
+    # --- Time loop ---
+    def _active(self) -> np.ndarray:
+        return np.array([
+            state is not None and error is None and state.ready_for_time_loop
+            for state, error in zip(self.states, self.errors, strict=True)
+        ])
+
+    def step(self) -> np.ndarray:
+        """
+        One attempt at the next time step of every active case. Returns the
+        mask of cases that committed; the rest entered Panic Mode (or failed).
+        """
+        active = self._active()
+        for c in np.flatnonzero(active):
+            self.elasticities[c].adapt_dt(self.states[c])
+        live = [e if e is not None else self.elasticities[np.flatnonzero(active)[0]] for e in self.elasticities]
+        dt = self._per_case([e.dt for e in live])
+        omega = self._per_case([e.omega for e in live])
+        max_iter = np.array([e.max_iter for e in live], dtype=np.int64)
+
+        # Rows of finished or failed cases are computed and discarded: masking
+        # the batch would cost more than the idle arithmetic.
+        with np.errstate(all="ignore"):
+            self.predict(dt)
+            for c in np.flatnonzero(active):
+                orchestrate_step4_plan(self.states[c])
+            rhs = self.ppe_rhs(dt)
+            sweeps, deltas = self.solve_pressure(omega, rhs, max_iter, active)
+            self.correct(dt)
+            committed = self.validate_and_commit(active)
+
+        for c in np.flatnonzero(active):
+            state, context, elasticity = self.states[c], self.contexts[c], self.elasticities[c]
+            if committed[c]:
+                state.iteration += 1
+                state.time += elasticity.dt
+                orchestrate_step5(state, context)
+                elasticity.sweep_deltas.extend(deltas[c])
+                elasticity.record_solve(int(sweeps[c]))
+                elasticity.gradual_recovery()
+                elasticity.checkpoint(state)
+                if state.time >= context.input_data.simulation_parameters.total_time:
+                    state.ready_for_time_loop = False
+                    # Opt-in controller trace, archived with the case's snapshots as in the serial loop
+                    if elasticity.target_iterations is not None:
+                        elasticity.export_history(Path(state.manifest.output_directory) / "controller_history.json")
+                continue
+            # Back to the last committed Foundation, not the half-written trials
+            if elasticity.checkpoint_depth > 0:
+                elasticity.rollback(state)
+            if elasticity.dt < elasticity.dt_floor:
+                # Circuit breaker of the serial loop, for this case only
+                self.errors[c] = f"RuntimeError: FATAL: dt ({elasticity.dt}) dropped below limit."
+            else:
+                elasticity.apply_panic_mode()
+
+        if DEBUG:
+            print(f"DEBUG [Ensemble]: {int(committed.sum())}/{int(active.sum())} committed, "
+                  f"PPE sweeps {sweeps[active].tolist()}")
+        return committed
+
+    def run(self) -> list:
+        """Steps until every case finished or failed; returns the per-case errors (None on success)."""
+        while self._active().any():
+            self.step()
+        return self.errors
@@ -0,0 +1,216 @@
+# src/parallel/process_executor.py
+
+"""
+Multiprocess execution of the Step 3 kernels over z-slabs of the Core.
+
+Compliance:
+- Rule 0 (Law of Performance): The Foundation lives in one 
+  multiprocessing.shared_memory segment; workers are forked onto it and 
+  read their neighbors' halo planes in place, so a halo exchange is a 
+  phase barrier rather than a copy.
+- Rule 4 (SSoT): Reductions (PPE max delta, trial-field audit) are taken 
+  across every worker before the main process decides.
+- Rule 7 (Traceability): A worker's ArithmeticError is re-raised in the 
+  main process as ArithmeticError, so Panic Mode retries all workers.
+"""
+
+import multiprocessing
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from src.common.elasticity import VELOCITY, VELOCITY_STAR, ElasticManager
+from src.common.field_schema import FI
+from src.common.grid_math import get_slab_bounds
+from src.common.solver_state import SolverState
+from src.common.stencil_table import LazyStencilMatrix
+from src.step2.stencil_assembler import assemble_slab_blocks
+from src.step3.corrector import apply_local_velocity_correction
+from src.step3.ppe_solver import compute_local_ppe_rhs, solve_pressure_poisson_step
+from src.step3.predictor import compute_local_predictor_step
+
+# Rule 7: Granular Traceability
+DEBUG = False
+
+
+def _shared_array(shape: tuple) -> tuple[shared_memory.SharedMemory, np.ndarray]:
+    segment = shared_memory.SharedMemory(create=True, size=int(np.prod(shape)) * np.dtype(np.float64).itemsize)
+    return segment, np.ndarray(shape, dtype=np.float64, buffer=segment.buf)
+
+def share_foundation(state: SolverState) -> shared_memory.SharedMemory:
+    """
+    Moves the Foundation into a shared memory segment, in place of 
+    FieldManager.data. Must run before Step 2 so every view, table and 
+    plan is assembled over the shared buffer. Returns the segment; the 
+    caller owns it (see release_foundation).
+    """
+    segment, shared = _shared_array(state.fields.data.shape)
+    shared[...] = state.fields.data
+    state.fields.data = shared
+    return segment
+
+def release_foundation(state: SolverState, segment: shared_memory.SharedMemory) -> None:
+    """
+    Inverse of share_foundation once the run is over: the Foundation (and 
+    the stencil matrix over it) moves back to private memory, then the 
+    segment is unlinked and closed. close() unmaps the buffer even under 
+    live NumPy views, so every other view of it must be gone first; a 
+    failed run (views alive in its traceback) only unlinks the segment.
+    """
+    state.fields.data = np.array(state.fields.data)
+    state.stencil_matrix = LazyStencilMatrix(state.stencil_table, state.fields.data)
+    segment.unlink()
+    segment.close()
+
+def _worker_loop(conn, core_block, colors, rhs, rows, data) -> None:
+    """Executes commands for one slab until 'stop'; replies ('ok'|'arithmetic'|'error', payload)."""
+    def predict(dt):
+        core_block.dt = dt
+        compute_local_predictor_step(core_block)
+
+    def ppe_rhs(dt):
+        core_block.dt = dt
+        rhs[core_block.center.core_index] = compute_local_ppe_rhs(core_block)
+
+    def sweep(omega, color):
+        max_delta = 0.0
+        for block in colors[color]:
+            delta = solve_pressure_poisson_step(block, omega, rhs[block.center.core_index])
+            max_delta = max(max_delta, float(delta.max()))
+        return max_delta
+
+    def correct(dt):
+        core_block.dt = dt
+        apply_local_velocity_correction(core_block)
+
+    def audit():
+        # Same fused reduction as ElasticManager.validate_and_commit, on owned rows
+        trial_velocity, trial_pressure = data[rows, VELOCITY_STAR], data[rows, FI.P_NEXT]
+        lo = np.minimum(trial_velocity.min(), trial_pressure.min())
+        hi = np.maximum(trial_velocity.max(), trial_pressure.max())
+        return float(lo), float(hi)
+
+    def commit():
+        np.copyto(data[rows, VELOCITY], data[rows, VELOCITY_STAR])
+        np.copyto(data[rows, FI.P], data[rows, FI.P_NEXT])
+
+    commands = {
+        "predict": predict, "ppe_rhs": ppe_rhs, "sweep": sweep,
+        "correct": correct, "audit": audit, "commit": commit,
+    }
+
+    while True:
+        command, args = conn.recv()
+        if command == "stop":
+            break
+        try:
+            conn.send(("ok", commands[command](*args)))
+        except ArithmeticError as e:
+            conn.send(("arithmetic", str(e)))
+        except Exception as e:
+            conn.send(("error", f"{type(e).__name__}: {e}"))
+    conn.close()
+
+
+class ProcessSlabExecutor:
+    """
+    Drop-in counterpart of SlabExecutor with one forked worker process per 
+    z-slab of the Core. Each worker owns its slab's CellView blocks and a 
+    contiguous row range of the Foundation for the audit and commit.
+
+    Every call is a barrier: the command is broadcast, then every reply is 
+    collected before anything is raised, so the workers stay in lock-step 
+    across Panic Mode retries.
+    """
+    __slots__ = ['_rhs_segment', '_rhs', '_workers', '_connections']
+
+    def __init__(self, state: SolverState, num_processes: int, foundation: shared_memory.SharedMemory):
+        if "fork" not in multiprocessing.get_all_start_methods():
+            raise ValueError("num_processes > 1 requires the 'fork' start method on this platform.")
+
+        grid = state.grid
+        if not np.shares_memory(state.fields.data, np.ndarray(state.fields.data.shape, buffer=foundation.buf)):
+            raise ValueError("ProcessSlabExecutor: the Foundation must be the shared segment (see share_foundation).")
+
+        bounds = get_slab_bounds(grid.nz, num_processes)
+        n_slabs = len(bounds)
+        row_chunks = np.array_split(np.arange(state.fields.data.shape[0]), n_slabs)
+
+        self._rhs_segment, self._rhs = _shared_array((grid.nx, grid.ny, grid.nz))
+
+        context = multiprocessing.get_context("fork")
+        self._workers, self._connections = [], []
+        for (k0, k1), chunk in zip(bounds, row_chunks, strict=True):
+            core_block, red, black = assemble_slab_blocks(state, k0, k1)
+            rows = slice(int(chunk[0]), int(chunk[-1]) + 1)
+            parent, child = context.Pipe()
+            worker = context.Process(
+                target=_worker_loop,
+                args=(child, core_block, (red, black), self._rhs, rows, state.fields.data),
+                daemon=True
+            )
+            worker.start()
+            child.close()
+            self._workers.append(worker)
+            self._connections.append(parent)
+
+        if DEBUG:
+            print(f"DEBUG [Parallel]: {n_slabs} worker processes with z-bounds {bounds}")
+
+    def _broadcast(self, command: str, *args) -> list:
+        """Sends 'command' to every worker and gathers all replies (barrier + reduction input)."""
+        for conn in self._connections:
+            conn.send((command, args))
+        replies = [conn.recv() for conn in self._connections]
+
+        failures = [(status, payload) for status, payload in replies if status != "ok"]
+        if failures:
+            status, payload = failures[0]
+            if status == "arithmetic":
+                raise ArithmeticError(payload)
+            raise RuntimeError(f"Worker failure during '{command}': {payload}")
+        return [payload for _, payload in replies]
+
+    def predict(self, dt: float) -> None:
+        """compute_local_predictor_step over the whole core."""
+        self._broadcast("predict", dt)
+
+    def ppe_rhs(self, dt: float) -> np.ndarray:
+        """compute_local_ppe_rhs over the whole core, in the shared rhs array (valid until shutdown)."""
+        self._broadcast("ppe_rhs", dt)
+        return self._rhs
+
+    def sweep(self, omega: float, rhs: np.ndarray) -> float:
+        """One red-black SOR sweep; returns the max delta reduced across workers."""
+        if rhs is not self._rhs:
+            np.copyto(self._rhs, rhs)
+        red = self._broadcast("sweep", omega, 0)
+        black = self._broadcast("sweep", omega, 1)
+        return max(red + black)
+
+    def correct(self, dt: float) -> None:
+        """apply_local_velocity_correction over the whole core."""
+        self._broadcast("correct", dt)
+
+    def validate_and_commit(self, elasticity: ElasticManager, state: SolverState) -> bool:
+        """ElasticManager.validate_and_commit with the audit reduced across workers."""
+        limit = elasticity.config.divergence_threshold
+        bounds = np.array(self._broadcast("audit"))
+        # NaN-propagating reductions across workers
+        lo, hi = bounds[:, 0].min(), bounds[:, 1].max()
+        if not (-limit <= lo and hi <= limit):
+            return False
+        self._broadcast("commit")
+        return True
+
+    def shutdown(self) -> None:
+        for conn in self._connections:
+            conn.send(("stop", ()))
+        for worker in self._workers:
+            worker.join()
+        for conn in self._connections:
+            conn.close()
+        # The workers' arguments are the last views of the rhs segment besides our own
+        self._workers, self._connections, self._rhs = [], [], None
+        self._rhs_segment.unlink()
+        self._rhs_segment.close()
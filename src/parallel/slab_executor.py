@@ -0,0 +1,106 @@
+# src/parallel/slab_executor.py
+
+"""
+Thread-pool execution of the Step 3 kernels over z-slabs of the Core.
+
+Compliance:
+- Rule 0 (Law of Performance): Slabs are CellView blocks over the shared 
+  Foundation; NumPy releases the GIL inside the kernels, so threads scale 
+  without copying data.
+- Rule 4 (SSoT): Every slab writes only its own center cells; phases are 
+  separated by a barrier, so the result equals the serial pass bit for bit.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from src.common.elasticity import ElasticManager
+from src.common.grid_math import get_slab_bounds
+from src.common.solver_state import SolverState
+from src.step2.stencil_assembler import assemble_slab_blocks
+from src.step3.corrector import apply_local_velocity_correction
+from src.step3.ppe_solver import compute_local_ppe_rhs, solve_pressure_poisson_step
+from src.step3.predictor import compute_local_predictor_step
+
+# Rule 7: Granular Traceability
+DEBUG = False
+
+
+class SlabExecutor:
+    """
+    Runs the predictor, the PPE source term, red-black SOR half-sweeps and 
+    the corrector on a ThreadPoolExecutor, one task per z-slab.
+
+    Each phase submits every slab and waits for all of them before the next 
+    one starts (for the SOR: red on every slab, then black), which is the 
+    only synchronization the 7-point stencil needs.
+    """
+    __slots__ = ['_pool', '_core_blocks', '_colors', '_core_shape']
+
+    def __init__(self, state: SolverState, num_threads: int):
+        grid = state.grid
+        bounds = get_slab_bounds(grid.nz, num_threads)
+        n_slabs = len(bounds)
+
+        slabs = [assemble_slab_blocks(state, k0, k1) for k0, k1 in bounds]
+        self._core_blocks = [core for core, _, _ in slabs]
+        self._colors = ([red for _, red, _ in slabs], [black for _, _, black in slabs])
+        self._core_shape = (grid.nx, grid.ny, grid.nz)
+        self._pool = ThreadPoolExecutor(max_workers=n_slabs, thread_name_prefix="slab")
+
+        if DEBUG:
+            print(f"DEBUG [Parallel]: {n_slabs} z-slabs with bounds {bounds}")
+
+    def _run(self, task, items) -> list:
+        """Submits one task per slab and blocks until all finish (phase barrier)."""
+        futures = [self._pool.submit(task, item) for item in items]
+        # result() re-raises a slab's ArithmeticError for Panic Mode
+        return [future.result() for future in futures]
+
+    def _sync_dt(self, dt: float) -> None:
+        # Rule 4: slab blocks follow the Elastic Manager's dt
+        for block in self._core_blocks:
+            block.dt = dt
+
+    def predict(self, dt: float) -> None:
+        """compute_local_predictor_step over the whole core."""
+        self._sync_dt(dt)
+        self._run(compute_local_predictor_step, self._core_blocks)
+
+    def ppe_rhs(self, dt: float) -> np.ndarray:
+        """compute_local_ppe_rhs over the whole core, as one core-shaped array."""
+        self._sync_dt(dt)
+        rhs = np.empty(self._core_shape)
+
+        def fill(block):
+            rhs[block.center.core_index] = compute_local_ppe_rhs(block)
+
+        self._run(fill, self._core_blocks)
+        return rhs
+
+    def sweep(self, omega: float, rhs: np.ndarray) -> float:
+        """One red-black SOR sweep (see solve_pressure_poisson_sweep); returns the max delta."""
+        def relax(blocks):
+            max_delta = 0.0
+            for block in blocks:
+                delta = solve_pressure_poisson_step(block, omega, rhs[block.center.core_index])
+                max_delta = max(max_delta, float(delta.max()))
+            return max_delta
+
+        max_delta = 0.0
+        for color in self._colors:
+            max_delta = max(max_delta, *self._run(relax, color))
+        return max_delta
+
+    def correct(self, dt: float) -> None:
+        """apply_local_velocity_correction over the whole core."""
+        self._sync_dt(dt)
+        self._run(apply_local_velocity_correction, self._core_blocks)
+
+    def validate_and_commit(self, elasticity: ElasticManager, state: SolverState) -> bool:
+        """Threads share the process: the Elastic Manager audits and commits directly."""
+        return elasticity.validate_and_commit(state)
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=True)
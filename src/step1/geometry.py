@@ -0,0 +1,74 @@
+# src/step1/geometry.py
+
+import numpy as np
+
+from src.common.solver_state import GridManager
+
+# Rule 7: Granular Traceability
+DEBUG = False
+
+# Mask value painted by each primitive tag (unpainted cells stay fluid)
+TAG_VALUES = {"solid": 0, "wall": -1}
+FLUID = 1
+AXES = {"x": 0, "y": 1, "z": 2}
+
+
+def _box(centers, p):
+    # Separable test: three 1-D range checks, combined by broadcasting
+    lo, hi = p["min"], p["max"]
+    inside = [(lo[n] <= c) & (c <= hi[n]) for n, c in enumerate(centers)]
+    return inside[0] & inside[1] & inside[2]
+
+def _sphere(centers, p):
+    x, y, z = (c - p["center"][n] for n, c in enumerate(centers))
+    return x * x + y * y + z * z <= p["radius"] ** 2
+
+def _cylinder(centers, p):
+    axis = AXES[p["axis"]]
+    radial = [(c - p["center"][n]) for n, c in enumerate(centers) if n != axis]
+    inside = radial[0] * radial[0] + radial[1] * radial[1] <= p["radius"] ** 2
+    if "extent" in p:
+        lo, hi = p["extent"]
+        inside = inside & (lo <= centers[axis]) & (centers[axis] <= hi)
+    return inside
+
+def _half_space(centers, p):
+    # The outward normal points away from the painted side
+    return sum(n * (c - x0) for n, c, x0 in zip(p["normal"], centers, p["point"], strict=True)) <= 0.0
+
+PRIMITIVES = {"box": _box, "sphere": _sphere, "cylinder": _cylinder, "half_space": _half_space}
+
+
+def rasterize_geometry(geometry: list[dict], grid: GridManager) -> np.ndarray:
+    """
+    Paints procedural primitives onto the (nx, ny, nz) int8 mask.
+
+    Every cell starts as fluid (1); each primitive, in list order, paints
+    the cells whose center lies inside it with its tag (solid 0, wall -1),
+    so later primitives win where shapes overlap. Predicates are evaluated
+    by broadcasting the 1-D cell-center axes of the GridManager, never
+    materializing coordinate grids.
+
+    Compliance:
+    - Rule 5 (Explicit or Error): Unknown primitive types, axes or tags raise.
+    """
+    nx, ny, nz = grid.nx, grid.ny, grid.nz
+    x, y, z = grid.cell_centers()
+    centers = (x.reshape(-1, 1, 1), y.reshape(1, -1, 1), z.reshape(1, 1, -1))
+
+    mask_3d = np.full((nx, ny, nz), FLUID, dtype=np.int8)
+    for n, primitive in enumerate(geometry):
+        kind, tag = primitive.get("type"), primitive.get("tag")
+        if kind not in PRIMITIVES:
+            raise ValueError(f"Geometry primitive {n}: unknown type '{kind}'")
+        if tag not in TAG_VALUES:
+            raise ValueError(f"Geometry primitive {n}: tag must be 'solid' or 'wall', got '{tag}'")
+        if kind == "cylinder" and primitive.get("axis") not in AXES:
+            raise ValueError(f"Geometry primitive {n}: cylinder axis must be 'x', 'y' or 'z'")
+        inside = np.broadcast_to(PRIMITIVES[kind](centers, primitive), mask_3d.shape)
+        mask_3d[inside] = TAG_VALUES[tag]
+
+    if DEBUG:
+        print(f"DEBUG [Step 1.2]: Rasterized {len(geometry)} primitives, "
+              f"{int(np.sum(mask_3d == FLUID))} fluid cells")
+    return mask_3d
@@ -2,14 +2,13 @@
 
 import numpy as np
 
-from src.common.grid_math import get_coords_from_index
 from src.common.solver_input import GridInput
 
 # Rule 7: Granular Traceability
 DEBUG = False
 
 
-def generate_3d_masks(mask_data: list[int], grid: GridInput) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+def generate_3d_masks(mask_data: list[int] | np.ndarray, grid: GridInput) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
     """
     Transforms flat input into 3D topology arrays via explicit SSoT mapping.
     
@@ -25,19 +24,12 @@ def generate_3d_masks(mask_data: list[int], grid: GridInput) -> tuple[np.ndarray
     if len(mask_data) != expected_size:
         raise ValueError(f"Mask data size mismatch: Expected {expected_size} cells, got {len(mask_data)}")
     
-    # 2. Initialize empty buffer
-    mask_3d = np.zeros((nx, ny, nz), dtype=np.int8)
+    # 2. One int8 conversion (no copy for MaskInput.array)
+    flat_mask = np.asarray(mask_data, dtype=np.int8)
     
-    # 3. Explicit mapping (Eliminating "Black Box" reshape)
-    # We map the flat input list to the 3D grid using our SSoT logic.
-    for idx, value in enumerate(mask_data):
-        i, j, k = get_coords_from_index(idx, nx, ny) 
-        
-        # Guard against index drift (Deterministic validation)
-        if 0 <= i < nx and 0 <= j < ny and 0 <= k < nz:
-            mask_3d[i, j, k] = value
-        else:
-            raise ValueError(f"Mask mapping overflow at index {idx} -> ({i}, {j}, {k})")
+    # 3. Explicit mapping: get_flat_index puts i fastest, then j, then k, 
+    # which is exactly a Fortran-order reshape to (nx, ny, nz)
+    mask_3d = flat_mask.reshape((nx, ny, nz), order="F")
 
     # 4. Logic-Layer: Identify fluid and boundary regions via vectorized masks
     is_fluid = (mask_3d == 1)
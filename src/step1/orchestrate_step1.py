@@ -20,15 +20,19 @@ from src.common.solver_state import (
     SolverState,
 )
 
+from .geometry import rasterize_geometry
 from .helpers import generate_3d_masks
 
 # Rule 7: Granular Traceability
 DEBUG = False
 
-def orchestrate_step1(context: SimulationContext) -> SolverState:
+def orchestrate_step1(context: SimulationContext, mask_3d: np.ndarray | None = None) -> SolverState:
     """
     Direct Ingestion Orchestrator (Phase C Compliant).
     Assembles the SolverState via strict container initialization and attribute assignment.
+
+    'mask_3d' is an already generated mask of the same input (shared by the
+    cases of an ensemble sweep); it is generated from input_data when None.
     """
     if DEBUG:
         print(f"DEBUG [Step 1]: Starting State Assembly...")
@@ -69,12 +73,18 @@ def orchestrate_step1(context: SimulationContext) -> SolverState:
     state.simulation_parameters.output_interval = int(input_data.simulation_parameters.output_interval)
 
     # --- 5. Topology & Foundation ---
-    mask_3d, _, _ = generate_3d_masks(input_data.mask.data, input_data.grid)
+    if mask_3d is None and input_data.mask.geometry is not None:
+        mask_3d = rasterize_geometry(input_data.mask.geometry, state.grid)
+    elif mask_3d is None:
+        mask_3d, _, _ = generate_3d_masks(input_data.mask.array, input_data.grid)
+    elif mask_3d.shape != (state.grid.nx, state.grid.ny, state.grid.nz):
+        raise ValueError(f"Pre-built mask shape {mask_3d.shape} does not match the grid.")
     state.fields = FieldManager()
     n_cells = (state.grid.nx + 2) * (state.grid.ny + 2) * (state.grid.nz + 2)
     state.fields.allocate(n_cells)
     padded_mask = np.pad(mask_3d, pad_width=1, mode="constant", constant_values=0)
-    state.fields.data[:, FI.MASK] = padded_mask.flatten()
+    # Buffer order of get_flat_index (i fastest)
+    state.fields.data[:, FI.MASK] = padded_mask.flatten(order="F")
 
     state.mask = MaskManager()
     state.mask.mask = mask_3d
@@ -1,7 +1,10 @@
 # src/step2/factory.py
 
+import numpy as np
+
 from src.common.cell import Cell
-from src.common.grid_math import get_flat_index
+from src.common.field_schema import FI
+from src.common.grid_math import get_flat_index, get_padded_view
 from src.common.solver_state import SolverState
 
 # Rule 7: Granular Traceability
@@ -73,4 +76,36 @@ def _build_ghost_cell(i: int, j: int, k: int, state: SolverState) -> Cell:
     cell.p = GHOST_PRESSURE
     cell.mask = GHOST_MASK
     
-    return cell
\ No newline at end of file
+    return cell
+
+def initialize_foundation(state: SolverState) -> None:
+    """
+    Writes the factory initial values into the Foundation in one pass.
+
+    Vectorized counterpart of get_cell over every cell a core stencil 
+    touches: Core cells receive the initial conditions and the mask, the 
+    six Ghost faces receive the ghost constants. Buffer edges and corners 
+    (never part of a 7-point stencil) are left untouched, as before.
+    """
+    grid = state.grid
+    nx, ny, nz = grid.nx, grid.ny, grid.nz
+    padded = get_padded_view(state.fields.data, nx + 2, ny + 2, nz + 2)
+    init = state.initial_conditions
+
+    # 1. Core Domain: buffer coordinates [1, n] on every axis
+    core = padded[1:-1, 1:-1, 1:-1]
+    core[..., [FI.VX, FI.VY, FI.VZ]] = np.asarray(init.velocity, dtype=np.float64)
+    core[..., FI.P] = init.pressure
+    core[..., FI.MASK] = np.asarray(state.mask.mask)
+
+    # 2. Ghost faces: buffer coordinate 0 or n+1 on exactly one axis
+    inner = (slice(1, -1), slice(1, -1), slice(1, -1))
+    for axis in range(3):
+        for layer in (0, -1):
+            face = padded[inner[:axis] + (layer,) + inner[axis + 1:]]
+            face[..., [FI.VX, FI.VY, FI.VZ]] = GHOST_VELOCITY
+            face[..., FI.P] = GHOST_PRESSURE
+            face[..., FI.MASK] = GHOST_MASK
+
+    if DEBUG:
+        print(f"DEBUG [Factory]: Foundation initialized for {nx}x{ny}x{nz} Core + Ghost faces")
@@ -1,25 +1,45 @@
 # src/step2/orchestrate_step2.py
 
 from src.common.solver_state import SolverState
-from src.step2.stencil_assembler import assemble_stencil_matrix
+from src.common.stencil_table import LazyStencilMatrix, StencilTable
+from src.step2.factory import initialize_foundation
+from src.step2.stencil_assembler import assemble_stencil_table
+from src.step4.boundary_dispatcher import DOMAIN_FACES, compile_boundary_plan
 
 # Rule 7: Granular Traceability
 DEBUG = False
 
-def orchestrate_step2(state: SolverState) -> SolverState:
+def orchestrate_step2(state: SolverState, stencil_table: StencilTable | None = None,
+                      physical_faces: tuple = DOMAIN_FACES) -> SolverState:
     """
     Orchestrates the construction of the Stencil Matrix.
+
+    The Foundation is initialized in one vectorized pass, the topology is 
+    stored once as a compact neighbor-index table, and stencil_matrix is a 
+    lazy sequence of flyweight StencilBlocks over that table. The boundary 
+    plan applied by Step 4 is compiled from the same table. A 'stencil_table'
+    built for the same grid (e.g. by another case of a sweep) lends its 
+    index arrays instead of rebuilding them. 'physical_faces' are the 
+    domain faces that get boundary rules (see compile_boundary_plan).
     """
     if DEBUG:
         print(f"DEBUG [Step 2.0]: Orchestration Started")
 
-    # The registry is now encapsulated within the assembler, 
-    # ensuring a clean lifecycle for every simulation run.
-    state.stencil_matrix = assemble_stencil_matrix(state)
+    # Initial values the per-cell factory used to write on allocation
+    initialize_foundation(state)
+
+    # Compact topology: neighbor indices as arrays, physics stored once
+    state.stencil_table = assemble_stencil_table(state, topology=stencil_table)
+
+    # Per-block access for existing consumers, without one object per cell
+    state.stencil_matrix = LazyStencilMatrix(state.stencil_table, state.fields.data)
+
+    # Boundary rules resolved once per run; Step 4 only performs the writes
+    state.boundary_plan = compile_boundary_plan(state, physical_faces)
     
     state.ready_for_time_loop = True
     
     if DEBUG:
         print(f"DEBUG [Step 2.0]: Orchestration Finalized.")
     
-    return state
\ No newline at end of file
+    return state
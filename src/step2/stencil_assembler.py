@@ -1,7 +1,16 @@
+import numpy as np
+
+from src.common.cell_view import CellView
 from src.common.field_schema import FI
-from src.common.grid_math import get_flat_index
+from src.common.grid_math import (
+    get_flat_index,
+    get_padded_view,
+    get_red_black_indices,
+    shift_index,
+)
 from src.common.solver_state import SolverState
 from src.common.stencil_block import StencilBlock
+from src.common.stencil_table import StencilTable
 
 from .factory import get_cell
 
@@ -36,6 +45,153 @@ class CellRegistry:
         
         return self._cache[idx]
 
+def _collect_physics_params(state: SolverState) -> dict:
+    """Physics attributes cached on every StencilBlock at assembly (Rule 4: SSoT)."""
+    grid = state.grid
+    return {
+        "dx": grid.dx,
+        "dy": grid.dy,
+        "dz": grid.dz,
+        "dt": state.simulation_parameters.time_step,
+        "rho": state.fluid_properties.density,
+        "mu": state.fluid_properties.viscosity,
+        "f_vals": tuple(state.external_forces.force_vector)
+    }
+
+def _build_view_block(padded: np.ndarray, index: tuple, physics_params: dict) -> StencilBlock:
+    """Wires a StencilBlock whose seven members are CellViews over 'padded'."""
+    return StencilBlock(
+        center=CellView(index, padded),
+        i_minus=CellView(shift_index(index, 0, -1), padded),
+        i_plus=CellView(shift_index(index, 0, 1), padded),
+        j_minus=CellView(shift_index(index, 1, -1), padded),
+        j_plus=CellView(shift_index(index, 1, 1), padded),
+        k_minus=CellView(shift_index(index, 2, -1), padded),
+        k_plus=CellView(shift_index(index, 2, 1), padded),
+        **physics_params
+    )
+
+def assemble_core_block(state: SolverState) -> StencilBlock:
+    """
+    Assembles a single StencilBlock spanning the whole Core Domain.
+
+    Every member is a CellView over the padded [i, j, k, field] view of the 
+    Foundation, shifted by one buffer cell per neighbor. The src/step3/ops 
+    formulas therefore run once over the entire core with shifted NumPy 
+    slices instead of once per cell, while neighbors at the core edge still 
+    read the ghost layer exactly as the per-cell blocks do.
+    """
+    if state.fields.data.shape[-1] != FI.num_fields():
+        raise RuntimeError(f"Foundation Mismatch: Buffer width {state.fields.data.shape[-1]} "
+                           f"!= Schema requirement {FI.num_fields()}.")
+
+    grid = state.grid
+    nx, ny, nz = grid.nx, grid.ny, grid.nz
+    padded = get_padded_view(state.fields.data, nx + 2, ny + 2, nz + 2)
+
+    # Core occupies buffer coordinates [1, n] on every axis
+    core = (slice(1, nx + 1, 1), slice(1, ny + 1, 1), slice(1, nz + 1, 1))
+
+    if DEBUG:
+        print(f"DEBUG [Step 2.3]: Core view block assembled over {nx}x{ny}x{nz} cells")
+
+    return _build_view_block(padded, core, _collect_physics_params(state))
+
+def assemble_red_black_blocks(state: SolverState) -> list[StencilBlock]:
+    """
+    Splits the Core Domain into its eight parity sub-lattices (stride 2 on 
+    every axis) and returns them as CellView blocks, red ((i+j+k) even) 
+    first, then black.
+
+    No cell has a neighbor of its own color, so sweeping the list in order 
+    and updating each block in one vectorized call is an exact red-black 
+    Gauss-Seidel pass over the core.
+    """
+    grid = state.grid
+    nx, ny, nz = grid.nx, grid.ny, grid.nz
+    padded = get_padded_view(state.fields.data, nx + 2, ny + 2, nz + 2)
+    physics_params = _collect_physics_params(state)
+
+    return [_build_view_block(padded, index, physics_params) for index in get_red_black_indices(nx, ny, nz)]
+
+def assemble_slab_blocks(state: SolverState, k_start: int, k_stop: int) -> tuple[StencilBlock, list, list]:
+    """
+    View blocks of the core z-slab k_start <= k < k_stop (core coordinates): 
+    the slab counterpart of assemble_core_block, plus the red and the black 
+    parity sub-lattice blocks of assemble_red_black_blocks clipped to the 
+    slab. Colors are global, so the slabs of one color never touch.
+    """
+    grid = state.grid
+    nx, ny, nz = grid.nx, grid.ny, grid.nz
+    padded = get_padded_view(state.fields.data, nx + 2, ny + 2, nz + 2)
+    physics_params = _collect_physics_params(state)
+
+    # Slab occupies buffer coordinates [k_start + 1, k_stop] along z
+    slab = (slice(1, nx + 1, 1), slice(1, ny + 1, 1), slice(k_start + 1, k_stop + 1, 1))
+    core_block = _build_view_block(padded, slab, physics_params)
+
+    red, black = [], []
+    for index in get_red_black_indices(nx, ny, nz):
+        i, j, k = index
+        # First buffer plane of this sub-lattice's k parity inside the slab
+        start = k_start + 1 + (k.start - 1 - k_start) % 2
+        if start > k_stop:
+            continue
+        color = red if (i.start + j.start + k.start - 3) % 2 == 0 else black
+        color.append(_build_view_block(padded, (i, j, slice(start, k_stop + 1, 2)), physics_params))
+
+    return core_block, red, black
+
+def assemble_stencil_table(state: SolverState, topology: StencilTable | None = None) -> StencilTable:
+    """
+    Builds the compact neighbor-index table of the Core Domain with NumPy.
+
+    Centers come from get_flat_index over every core coordinate (in the 
+    k, j, i loop order of assemble_stencil_matrix); neighbors are the same 
+    indices shifted by the get_flat_index stride of each axis. int32 is 
+    used whenever the Foundation is small enough to be addressed with it.
+
+    When 'topology' is a table of the same grid, its (read-only) index 
+    arrays are shared and only the physics parameters are taken from state.
+    """
+    if state.fields.data.shape[-1] != FI.num_fields():
+        raise RuntimeError(f"Foundation Mismatch: Buffer width {state.fields.data.shape[-1]} "
+                           f"!= Schema requirement {FI.num_fields()}.")
+
+    grid = state.grid
+    nx, ny, nz = grid.nx, grid.ny, grid.nz
+    nx_buf, ny_buf = nx + 2, ny + 2
+
+    if topology is not None:
+        if (topology.nx_buf, topology.ny_buf, len(topology)) != (nx_buf, ny_buf, nx * ny * nz):
+            raise ValueError("Shared stencil topology was built for a different grid.")
+        members = {name: getattr(topology, name) for name in StencilTable.MEMBERS}
+        return StencilTable(**members, nx_buf=nx_buf, ny_buf=ny_buf, **_collect_physics_params(state))
+
+    n_cells = state.fields.data.shape[0]
+    dtype = np.int32 if n_cells <= np.iinfo(np.int32).max else np.int64
+
+    # Core coordinates shifted past the ghost layer, i fastest
+    k, j, i = np.meshgrid(np.arange(1, nz + 1), np.arange(1, ny + 1), np.arange(1, nx + 1), indexing="ij")
+    center = get_flat_index(i.ravel(), j.ravel(), k.ravel(), nx_buf, ny_buf).astype(dtype)
+
+    # Per-axis strides of the flat index
+    sx = get_flat_index(1, 0, 0, nx_buf, ny_buf)
+    sy = get_flat_index(0, 1, 0, nx_buf, ny_buf)
+    sz = get_flat_index(0, 0, 1, nx_buf, ny_buf)
+
+    if DEBUG:
+        print(f"DEBUG [Step 2.4]: Stencil table built for {center.size} core cells ({dtype.__name__})")
+
+    return StencilTable(
+        center=center,
+        i_minus=center - sx, i_plus=center + sx,
+        j_minus=center - sy, j_plus=center + sy,
+        k_minus=center - sz, k_plus=center + sz,
+        nx_buf=nx_buf, ny_buf=ny_buf,
+        **_collect_physics_params(state)
+    )
+
 def assemble_stencil_matrix(state: SolverState) -> list:
     """
     Assembles a flattened list of StencilBlocks restricted to the Core Domain
@@ -49,16 +205,7 @@ def assemble_stencil_matrix(state: SolverState) -> list:
     nx, ny, nz = grid.nx, grid.ny, grid.nz
     
     registry = CellRegistry(nx, ny, nz)
-    
-    physics_params = {
-        "dx": grid.dx,
-        "dy": grid.dy,
-        "dz": grid.dz,
-        "dt": state.simulation_parameters.time_step,
-        "rho": state.fluid_properties.density,
-        "mu": state.fluid_properties.viscosity,
-        "f_vals": tuple(state.external_forces.force_vector)
-    }
+    physics_params = _collect_physics_params(state)
 
     if DEBUG:
         print(f"DEBUG [Step 2.2]: Stencil Assembly Started for {nx}x{ny}x{nz} Core Domain")
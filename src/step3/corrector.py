@@ -1,9 +1,8 @@
 # src/step3/corrector.py
 
-import math
-
 from src.common.field_schema import FI
 from src.common.stencil_block import StencilBlock
+from src.step3.ops.audit import is_finite, worst
 from src.step3.ops.gradient import compute_local_gradient_p
 from src.step3.ops.scaling import get_dt_over_rho
 
@@ -41,9 +40,9 @@ def apply_local_velocity_correction(block: StencilBlock) -> None:
     
     # 5. Rule 7: Numerical Integrity Audit
     # We check the first component; if one is NaN, the whole vector usually is.
-    if not all(math.isfinite(v) for v in v_new):
+    if not all(is_finite(v) for v in v_new):
         raise ArithmeticError(
-            f"Velocity correction resulted in non-finite values: {v_new}"
+            f"Velocity correction resulted in non-finite values: {tuple(worst(v) for v in v_new)}"
         )
     
     # 6. Apply velocity correction in-place to the STAR buffer
@@ -1,9 +1,8 @@
 # src/step3/ops/advection.py
 
-import math
-
 from src.common.field_schema import FI
 from src.common.stencil_block import StencilBlock
+from src.step3.ops.audit import is_finite, worst
 
 
 def compute_local_advection(block: StencilBlock, field_id: FI) -> float:
@@ -46,11 +45,11 @@ def compute_local_advection(block: StencilBlock, field_id: FI) -> float:
     advection_val = (u_c * df_dx) + (v_c * df_dy) + (w_c * df_dz)
 
     # 4. Rule 7: Immediate Numerical Audit
-    if not math.isfinite(advection_val):
+    if not is_finite(advection_val):
         raise ArithmeticError(
-            f"Advection divergence for {field_id.name}: val={advection_val} | "
-            f"Gradients: [{df_dx:.2e}, {df_dy:.2e}, {df_dz:.2e}]"
-            f"Derivatives: ({df_dx:.2e}, {df_dy:.2e}, {df_dz:.2e})"
+            f"Advection divergence for {field_id.name}: val={worst(advection_val)} | "
+            f"Gradients: [{worst(df_dx):.2e}, {worst(df_dy):.2e}, {worst(df_dz):.2e}]"
+            f"Derivatives: ({worst(df_dx):.2e}, {worst(df_dy):.2e}, {worst(df_dz):.2e})"
         )
 
     return advection_val
@@ -0,0 +1,31 @@
+# src/step3/ops/audit.py
+
+import math
+
+import numpy as np
+
+
+def is_finite(value) -> bool:
+    """
+    Rule 7 audit shared by both stencil flavours: a Cell-wired StencilBlock 
+    yields Python/NumPy scalars, a CellView-wired one yields whole arrays.
+    Scalars keep the cheap math.isfinite path.
+    """
+    if isinstance(value, float):
+        return math.isfinite(value)
+    return bool(np.isfinite(value).all())
+
+def worst(value) -> float:
+    """
+    Collapses an operator result to a single float for telemetry.
+    Arrays report their first non-finite entry, otherwise the largest magnitude.
+    """
+    if isinstance(value, float):
+        return value
+    flat = np.asarray(value, dtype=float).ravel()
+    if flat.size == 0:
+        return 0.0
+    bad = np.flatnonzero(~np.isfinite(flat))
+    if bad.size:
+        return float(flat[bad[0]])
+    return float(flat[np.argmax(np.abs(flat))])
@@ -1,9 +1,8 @@
 # src/step3/ops/divergence.py
 
-import math
-
 from src.common.field_schema import FI
 from src.common.stencil_block import StencilBlock
+from src.step3.ops.audit import is_finite, worst
 
 
 def compute_local_divergence_v_star(block: StencilBlock) -> float:
@@ -43,11 +42,11 @@ def compute_local_divergence_v_star(block: StencilBlock) -> float:
     divergence_val = div_x + div_y + div_z
 
     # 3. Rule 7: Numerical Integrity Audit
-    if not math.isfinite(divergence_val):
+    if not is_finite(divergence_val):
         # We log the specific components to see which axis exploded
         raise ArithmeticError(
-            f"Divergence explosion: val={divergence_val} | "
-            f"Components: [dx:{div_x:.2e}, dy:{div_y:.2e}, dz:{div_z:.2e}]"
+            f"Divergence explosion: val={worst(divergence_val)} | "
+            f"Components: [dx:{worst(div_x):.2e}, dy:{worst(div_y):.2e}, dz:{worst(div_z):.2e}]"
         )
     
     return divergence_val
\ No newline at end of file
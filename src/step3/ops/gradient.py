@@ -1,9 +1,8 @@
 # src/step3/ops/gradient.py
 
-import math
-
 from src.common.field_schema import FI
 from src.common.stencil_block import StencilBlock
+from src.step3.ops.audit import is_finite, worst
 
 
 def compute_local_gradient_p(block: StencilBlock, field_id: FI = FI.P) -> tuple[float, float, float]:
@@ -39,9 +38,9 @@ def compute_local_gradient_p(block: StencilBlock, field_id: FI = FI.P) -> tuple[
 
     # 3. Rule 7: Numerical Integrity Audit
     # If the pressure field diverges, it manifests as a massive gradient.
-    if not all(math.isfinite(g) for g in grad):
+    if not all(is_finite(g) for g in grad):
         raise ArithmeticError(
-            f"Pressure Gradient explosion for {field_id.name}: {grad} | "
+            f"Pressure Gradient explosion for {field_id.name}: {tuple(worst(g) for g in grad)} | "
             f"Cell: ({block.center.i}, {block.center.j}, {block.center.k})"
         )
     
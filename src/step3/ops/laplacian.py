@@ -1,9 +1,8 @@
 # src/step3/ops/laplacian.py
 
-import math
-
 from src.common.field_schema import FI
 from src.common.stencil_block import StencilBlock
+from src.step3.ops.audit import is_finite, worst
 
 
 def compute_local_laplacian(block: StencilBlock, field_id: FI) -> float:
@@ -37,9 +36,9 @@ def compute_local_laplacian(block: StencilBlock, field_id: FI) -> float:
     )
 
     # 4. Rule 7: Numerical Integrity Audit
-    if not math.isfinite(lap_val):
+    if not is_finite(lap_val):
         raise ArithmeticError(
-            f"Laplacian explosion for {field_id.name}: val={lap_val} | "
+            f"Laplacian explosion for {field_id.name}: val={worst(lap_val)} | "
             f"Cell: ({block.center.i}, {block.center.j}, {block.center.k})"
         )
 
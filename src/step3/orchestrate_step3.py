@@ -6,7 +6,8 @@ from src.common.elasticity import ElasticManager
 from src.common.simulation_context import SimulationContext
 from src.common.stencil_block import StencilBlock
 from src.step3.corrector import apply_local_velocity_correction
-from src.step3.ppe_solver import solve_pressure_poisson_step
+from src.step3.ppe_dispatcher import solve_pressure_poisson
+from src.step3.ppe_solver import compute_local_ppe_rhs, solve_pressure_poisson_step
 from src.step3.predictor import compute_local_predictor_step
 
 # Rule 7: Granular Traceability for GitHub Actions
@@ -70,4 +71,63 @@ def orchestrate_step3(
     
     finally:
         # Mandatory Restoration of block state integrity
-        block.dt = original_dt
\ No newline at end of file
+        block.dt = original_dt
+
+def orchestrate_step3_projection(
+    core_block: StencilBlock,
+    sweep_blocks: list[StencilBlock],
+    ppe_backend: str,
+    context: SimulationContext,
+    elasticity: ElasticManager,
+    executor=None
+) -> tuple[int, float]:
+    """
+    Step 3 Projection over the whole core: PPE solve + single correction.
+
+    The PPE source term is evaluated once on the core view block and handed 
+    to 'ppe_backend' (red-black SOR sweeps, preconditioned CG, geometric 
+    multigrid or the spectral direct solve; see select_ppe_backend). The 
+    velocity correction is applied once on the converged P_NEXT. With a 
+    SlabExecutor (config 'num_threads' > 1) the source term, SOR sweeps and 
+    correction run slab-parallel with identical results.
+
+    Compliance:
+    - Rule 4 (SSoT): core_block.dt is synced with elasticity.dt and restored 
+      in 'finally'; the sweep blocks only consume the precomputed RHS.
+    - Rule 7 (Traceability): ArithmeticError propagates for Panic Mode.
+
+    Returns (PPE iterations performed, final convergence measure).
+    """
+    original_dt = core_block.dt
+    core_block.dt = elasticity.dt
+
+    try:
+        # 1. RHS: constant across PPE iterations (depends on v* and p^n only)
+        if executor is None:
+            rhs = compute_local_ppe_rhs(core_block)
+        else:
+            rhs = executor.ppe_rhs(elasticity.dt)
+
+        # 2. SOLVE: Selected PPE backend on FI.P_NEXT
+        iterations, residual = solve_pressure_poisson(
+            ppe_backend, core_block, sweep_blocks, rhs, context.config, elasticity, executor
+        )
+
+        if DEBUG:
+            print(f"DEBUG [Step 3]: PPE ({ppe_backend}) iterations={iterations} residual={residual:.3e}")
+
+        # 3. CORRECT: Final velocity projection
+        if executor is None:
+            apply_local_velocity_correction(core_block)
+        else:
+            executor.correct(elasticity.dt)
+
+        return iterations, residual
+
+    except ArithmeticError as e:
+        if DEBUG:
+            print(f"DEBUG [Step 3]: Math instability in projection -> {e}")
+        raise
+
+    finally:
+        core_block.dt = original_dt
@@ -0,0 +1,88 @@
+# src/step3/ppe_dispatcher.py
+
+import logging
+
+import numpy as np
+
+from src.common.elasticity import ElasticManager
+from src.common.solver_config import SolverConfig
+from src.common.solver_state import MaskManager
+from src.common.stencil_block import StencilBlock
+from src.step3.ppe_krylov import solve_pressure_poisson_pcg
+from src.step3.ppe_multigrid import solve_pressure_poisson_multigrid
+from src.step3.ppe_solver import solve_pressure_poisson_sor
+from src.step3.ppe_spectral import solve_pressure_poisson_spectral
+
+logger = logging.getLogger("Solver.PPE")
+
+def select_ppe_backend(config: SolverConfig, mask: MaskManager, auto_spectral: bool = True) -> str:
+    """
+    Resolves the PPE backend for the run, once, from config and topology.
+
+    An all-fluid mask (no solid or wall cells from generate_3d_masks) leaves 
+    a constant-coefficient box, so the direct spectral solver replaces any 
+    iterative backend, unless 'auto_spectral' is False (a caller that can 
+    only run the configured backend, e.g. the batched ensemble). Requesting 
+    'spectral' for a masked domain is an error.
+    """
+    all_fluid = bool(np.all(mask.mask == 1))
+
+    if all_fluid and auto_spectral:
+        if config.ppe_solver != "spectral":
+            logger.info(f"All-fluid domain: spectral PPE selected over '{config.ppe_solver}'.")
+        return "spectral"
+
+    # Rule 5: Explicit or Error
+    if config.ppe_solver == "spectral":
+        raise ValueError("ppe_solver 'spectral' requires an all-fluid mask (no solid or wall cells).")
+
+    return config.ppe_solver
+
+def solve_pressure_poisson(
+    backend: str,
+    core_block: StencilBlock,
+    sweep_blocks: list[StencilBlock],
+    rhs,
+    config: SolverConfig,
+    elasticity: ElasticManager,
+    executor=None
+) -> tuple[int, float]:
+    """
+    Unified PPE backend dispatcher, keyed on the select_ppe_backend result.
+
+    Every backend solves the same 7-point system for FI.P_NEXT over the core 
+    and returns (iterations, convergence measure). An optional SlabExecutor 
+    parallelizes the SOR sweeps; the other backends run on the core block.
+
+    Compliance:
+    - Rule 4 (SSoT): omega and max_iter come from the Elastic Manager, so 
+      Panic Mode reaches every backend.
+    - Rule 5 (Explicit or Error): An unknown backend raises instead of 
+      falling back to SOR.
+    """
+    # 1. Red-Black SOR: max |delta p| < ppe_tolerance
+    if backend == "sor":
+        return solve_pressure_poisson_sor(
+            sweep_blocks, rhs, elasticity.omega, config.ppe_tolerance, elasticity.max_iter, executor,
+            elasticity.sweep_deltas
+        )
+
+    # 2. Preconditioned CG: ||r|| <= max(ppe_tolerance * ||b||, ppe_atol)
+    if backend == "cg":
+        return solve_pressure_poisson_pcg(
+            core_block, rhs, config.ppe_preconditioner, elasticity.omega,
+            config.ppe_tolerance, config.ppe_atol, elasticity.max_iter
+        )
+
+    # 3. Geometric Multigrid: same criterion, one cycle per iteration
+    if backend == "mg":
+        return solve_pressure_poisson_multigrid(
+            core_block, rhs, config.ppe_mg_cycle,
+            config.ppe_tolerance, config.ppe_atol, elasticity.max_iter
+        )
+
+    # 4. Spectral: direct DST solve, exact to round-off
+    if backend == "spectral":
+        return solve_pressure_poisson_spectral(core_block, rhs)
+
+    raise ValueError(f"Unknown PPE backend: '{backend}'")
@@ -0,0 +1,124 @@
+# src/step3/ppe_krylov.py
+
+import numpy as np
+
+from src.common.field_schema import FI
+from src.common.grid_math import get_red_black_indices, weighted_neighbor_sum
+from src.common.stencil_block import StencilBlock
+
+# Rule 7: Granular Traceability
+DEBUG = False
+
+def _ssor_apply(r: np.ndarray, scratch: np.ndarray, core: tuple, weights: tuple, diag: float, omega: float) -> np.ndarray:
+    """
+    z = M_SSOR^{-1} r for the red-black ordered operator: one symmetric SOR
+    pass (red, black, black, red) on A z = r from z = 0 with zero ghosts.
+    The ordering is symmetric, so M stays SPD and CG remains valid.
+    """
+    scratch.fill(0.0)
+    colors = get_red_black_indices(*r.shape)
+    for index in colors + colors[::-1]:
+        # Buffer coordinates -> core-shaped 'r' coordinates
+        rhs_index = tuple(slice(s.start - 1, s.stop - 1, s.step) for s in index)
+        z_old = scratch[index]
+        z_gs = (weighted_neighbor_sum(scratch, index, weights) + r[rhs_index]) / diag
+        scratch[index] = (1.0 - omega) * z_old + omega * z_gs
+    return scratch[core].copy()
+
+def solve_pressure_poisson_pcg(
+    core_block: StencilBlock,
+    rhs: np.ndarray,
+    preconditioner: str,
+    omega: float,
+    rtol: float,
+    atol: float,
+    max_iter: int
+) -> tuple[int, float]:
+    """
+    Matrix-free Preconditioned Conjugate Gradient for the Pressure Poisson Equation.
+
+    Solves the same 7-point system as solve_pressure_poisson_step,
+    lap(p) = rhs over the core with ghost P_NEXT held fixed, written in
+    SPD form A p = b with A = -lap restricted to the core. A is applied
+    with shifted slices of a zero-ghost padded scratch; the ghost layer
+    only enters through b.
+
+    Convergence: ||r||_2 <= max(rtol * ||b||_2, atol). The converged
+    pressure is written back into FI.P_NEXT.
+
+    Compliance:
+    - Rule 7: Non-finite residuals or curvature raise ArithmeticError for
+      Panic Mode retry.
+
+    Returns (iterations performed, final residual norm).
+    """
+    dx2, dy2, dz2 = core_block.dx**2, core_block.dy**2, core_block.dz**2
+
+    # Guard against ZeroDivision in geometry (Physical/Code Bug)
+    if dx2 == 0 or dy2 == 0 or dz2 == 0:
+        raise ValueError("Grid spacing (dx, dy, or dz) cannot be zero.")
+
+    weights = (1.0 / dx2, 1.0 / dy2, 1.0 / dz2)
+    diag = 2.0 * sum(weights)
+
+    # Padded P_NEXT view of the Foundation and the core it spans
+    padded = core_block.center.fields_buffer[..., FI.P_NEXT]
+    core = core_block.center.index
+    scratch = np.zeros(padded.shape)
+
+    def apply_operator(p: np.ndarray) -> np.ndarray:
+        scratch[core] = p
+        return diag * p - weighted_neighbor_sum(scratch, core, weights)
+
+    if preconditioner == "jacobi":
+        def apply_preconditioner(r: np.ndarray) -> np.ndarray:
+            return r / diag
+    elif preconditioner == "ssor":
+        ssor_scratch = np.zeros(padded.shape)
+        def apply_preconditioner(r: np.ndarray) -> np.ndarray:
+            return _ssor_apply(r, ssor_scratch, core, weights, diag, omega)
+    else:
+        raise ValueError(f"Unknown PPE preconditioner: {preconditioner!r}")
+
+    # b = ghost contributions - rhs (core zeroed); r0 = full stencil residual of the guess
+    x = padded[core].copy()
+    scratch[...] = padded
+    scratch[core] = 0.0
+    b_norm = np.linalg.norm(weighted_neighbor_sum(scratch, core, weights) - rhs)
+    r = weighted_neighbor_sum(padded, core, weights) - diag * x - rhs
+    scratch.fill(0.0)
+
+    threshold = max(rtol * b_norm, atol)
+    r_norm = np.linalg.norm(r)
+    z = apply_preconditioner(r)
+    d = z.copy()
+    rz = np.vdot(r, z)
+
+    iterations = 0
+    while r_norm > threshold and iterations < max_iter:
+        iterations += 1
+        q = apply_operator(d)
+        curvature = np.vdot(d, q)
+
+        # Rule 7: Numerical Integrity Audit
+        if not np.isfinite(curvature) or not np.isfinite(rz) or curvature <= 0.0:
+            raise ArithmeticError(f"PCG breakdown: d.Ad={curvature}, r.z={rz} at iteration {iterations}")
+
+        alpha = rz / curvature
+        x += alpha * d
+        r -= alpha * q
+        r_norm = np.linalg.norm(r)
+
+        z = apply_preconditioner(r)
+        rz_next = np.vdot(r, z)
+        d = z + (rz_next / rz) * d
+        rz = rz_next
+
+    if not np.isfinite(r_norm):
+        raise ArithmeticError(f"PCG Divergence: residual={r_norm} after {iterations} iterations")
+
+    if DEBUG:
+        print(f"DEBUG [Step 3]: PCG({preconditioner}) iterations={iterations} residual={r_norm:.3e}")
+
+    core_block.center.set_field(FI.P_NEXT, x)
+    return iterations, float(r_norm)
@@ -0,0 +1,208 @@
+# src/step3/ppe_multigrid.py
+
+import logging
+
+import numpy as np
+
+from src.common.field_schema import FI
+from src.common.grid_math import get_red_black_indices, weighted_neighbor_sum
+from src.common.stencil_block import StencilBlock
+
+# Rule 7: Granular Traceability
+DEBUG = False
+logger = logging.getLogger("Solver.PPE")
+
+# Red-black Gauss-Seidel sweeps per level (pre/post) and on the coarsest level
+PRE_SMOOTH = 2
+POST_SMOOTH = 2
+COARSE_SWEEPS = 30
+
+class _MultigridLevel:
+    """Geometry, active-cell mask and zero-ghost work buffer of one grid level."""
+    __slots__ = ['shape', 'weights', 'diag', 'active', 'factors', 'colors', 'core', 'pad']
+
+    def __init__(self, shape: tuple, spacing: tuple, fine_spacing: tuple, active: np.ndarray):
+        self.shape = shape
+        self.weights = tuple(1.0 / h**2 for h in spacing)
+        self.diag = np.full(shape, 2.0 * sum(self.weights))
+        # The fine Dirichlet point sits half a FINE cell outside the core. A coarse 
+        # ghost linearly extrapolated to vanish there equals -s/(1-s) * interior, 
+        # s = (1 - h/H)/2, which folds into the diagonal of boundary-adjacent cells.
+        for axis, (h, H, w) in enumerate(zip(fine_spacing, spacing, self.weights, strict=True)):
+            s = 0.5 * (1.0 - h / H)
+            faces = np.moveaxis(self.diag, axis, 0)
+            faces[0] += w * s / (1.0 - s)
+            faces[-1] += w * s / (1.0 - s)
+        self.active = active
+        # Axes of extent 1 are never coarsened
+        self.factors = tuple(2 if n > 1 else 1 for n in shape)
+        self.colors = get_red_black_indices(*shape)
+        self.core = tuple(slice(1, n + 1, 1) for n in shape)
+        self.pad = np.zeros(tuple(n + 2 for n in shape))
+
+def _build_levels(shape: tuple, spacing: tuple, active: np.ndarray) -> list[_MultigridLevel]:
+    """Halves every axis (rounding up) until the coarsest level holds at most 8 cells."""
+    fine_spacing = spacing
+    levels = [_MultigridLevel(shape, spacing, fine_spacing, active)]
+    while np.prod(levels[-1].shape) > 8:
+        fine = levels[-1]
+        spacing = tuple(h * f for h, f in zip(spacing, fine.factors, strict=True))
+        active = _restrict(fine.active.astype(float), fine.factors) > 0.0
+        levels.append(_MultigridLevel(active.shape, spacing, fine_spacing, active))
+    return levels
+
+def _restrict(fine: np.ndarray, factors: tuple) -> np.ndarray:
+    """Cell-centered averaging over each coarse cell's children (odd extents zero-padded)."""
+    padded_shape = tuple(n + (-n) % f for n, f in zip(fine.shape, factors, strict=True))
+    padded = np.zeros(padded_shape)
+    padded[tuple(slice(0, n) for n in fine.shape)] = fine
+    (n0, n1, n2), (f0, f1, f2) = padded_shape, factors
+    blocks = padded.reshape(n0 // f0, f0, n1 // f1, f1, n2 // f2, f2)
+    return blocks.sum(axis=(1, 3, 5)) / (f0 * f1 * f2)
+
+def _prolong(coarse: np.ndarray, factors: tuple, shape: tuple) -> np.ndarray:
+    """
+    Cell-centered trilinear interpolation of a coarse correction: along each 
+    coarsened axis, child 2i takes 3/4 of parent i and 1/4 of parent i-1, 
+    child 2i+1 takes 3/4 of i and 1/4 of i+1 (zero beyond the boundary).
+    """
+    fine = coarse
+    for axis, f in enumerate(factors):
+        if f == 1:
+            continue
+        moved = np.moveaxis(fine, axis, 0)
+        padded = np.concatenate([np.zeros_like(moved[:1]), moved, np.zeros_like(moved[:1])])
+        children = np.empty((2 * moved.shape[0],) + moved.shape[1:])
+        children[0::2] = 0.75 * moved + 0.25 * padded[:-2]
+        children[1::2] = 0.75 * moved + 0.25 * padded[2:]
+        fine = np.moveaxis(children, 0, axis)
+    return fine[tuple(slice(0, n) for n in shape)]
+
+def _smooth(level: _MultigridLevel, e: np.ndarray, r: np.ndarray, sweeps: int) -> None:
+    """Red-black Gauss-Seidel on A e = r; inactive (solid) cells stay at zero."""
+    level.pad[level.core] = e
+    for _ in range(sweeps):
+        for index in level.colors:
+            local = tuple(slice(s.start - 1, s.stop - 1, s.step) for s in index)
+            gs = (weighted_neighbor_sum(level.pad, index, level.weights) + r[local]) / level.diag[local]
+            level.pad[index] = np.where(level.active[local], gs, 0.0)
+    e[...] = level.pad[level.core]
+
+def _residual(level: _MultigridLevel, e: np.ndarray, r: np.ndarray) -> np.ndarray:
+    """r - A e over active cells, A = -lap with homogeneous ghosts."""
+    level.pad[level.core] = e
+    res = r - level.diag * e + weighted_neighbor_sum(level.pad, level.core, level.weights)
+    return np.where(level.active, res, 0.0)
+
+def _v_cycle(levels: list[_MultigridLevel], depth: int, e: np.ndarray, r: np.ndarray) -> None:
+    """One V-cycle on the error equation of level 'depth', updating e in place."""
+    level = levels[depth]
+    if depth == len(levels) - 1:
+        _smooth(level, e, r, COARSE_SWEEPS)
+        return
+
+    _smooth(level, e, r, PRE_SMOOTH)
+    coarse = levels[depth + 1]
+    r_coarse = np.where(coarse.active, _restrict(_residual(level, e, r), level.factors), 0.0)
+    e_coarse = np.zeros(coarse.shape)
+    _v_cycle(levels, depth + 1, e_coarse, r_coarse)
+    e += np.where(level.active, _prolong(e_coarse, level.factors, level.shape), 0.0)
+    _smooth(level, e, r, POST_SMOOTH)
+
+def _full_multigrid(levels: list[_MultigridLevel], r: np.ndarray) -> np.ndarray:
+    """FMG: solve on the coarsest level, then prolong and V-cycle on every finer level."""
+    residuals = [r]
+    for depth in range(len(levels) - 1):
+        residuals.append(np.where(levels[depth + 1].active, _restrict(residuals[-1], levels[depth].factors), 0.0))
+
+    e = np.zeros(levels[-1].shape)
+    _smooth(levels[-1], e, residuals[-1], COARSE_SWEEPS)
+    for depth in range(len(levels) - 2, -1, -1):
+        level = levels[depth]
+        e = np.where(level.active, _prolong(e, level.factors, level.shape), 0.0)
+        _v_cycle(levels, depth, e, residuals[depth])
+    return e
+
+def solve_pressure_poisson_multigrid(
+    core_block: StencilBlock,
+    rhs: np.ndarray,
+    cycle: str,
+    rtol: float,
+    atol: float,
+    max_cycles: int
+) -> tuple[int, float]:
+    """
+    Geometric Multigrid for the Pressure Poisson Equation.
+
+    Solves the 7-point system of solve_pressure_poisson_step for FI.P_NEXT
+    with ghost values held fixed, as correction cycles on the error
+    equation A e = b - A p (A = -lap). Levels halve every axis; residuals
+    are restricted by averaging, corrections prolonged trilinearly,
+    and every level is smoothed with red-black Gauss-Seidel on a
+    homogeneous rediscretized operator.
+
+    Solid cells (mask 0) are not unknowns: like ghosts, their P_NEXT is
+    held fixed and only enters the residual of their fluid neighbors. A
+    coarse cell is active if any of its children is.
+
+    'cycle' is "v" (V-cycles only) or "fmg" (one full-multigrid cycle,
+    then V-cycles). Convergence: ||r||_2 <= max(rtol * ||b||_2, atol),
+    with the residual logged on "Solver.PPE" after every cycle.
+
+    Compliance:
+    - Rule 7: A non-finite residual raises ArithmeticError for Panic Mode retry.
+
+    Returns (cycles performed, final residual norm).
+    """
+    if cycle not in ("v", "fmg"):
+        raise ValueError(f"Unknown multigrid cycle: {cycle!r}")
+
+    spacing = (core_block.dx, core_block.dy, core_block.dz)
+
+    # Guard against ZeroDivision in geometry (Physical/Code Bug)
+    if 0.0 in spacing:
+        raise ValueError("Grid spacing (dx, dy, or dz) cannot be zero.")
+
+    padded = core_block.center.fields_buffer[..., FI.P_NEXT]
+    core = core_block.center.index
+    active = core_block.center.mask != 0
+    levels = _build_levels(rhs.shape, spacing, active)
+    fine = levels[0]
+
+    def fine_residual() -> np.ndarray:
+        # b - A p with the real ghost and solid values of the Foundation
+        res = weighted_neighbor_sum(padded, core, fine.weights) - fine.diag * padded[core] - rhs
+        return np.where(active, res, 0.0)
+
+    # ||b||: residual of p = 0 on the unknowns, fixed values kept
+    saved = padded[core].copy()
+    padded[core] = np.where(active, 0.0, saved)
+    b_norm = np.linalg.norm(fine_residual())
+    padded[core] = saved
+
+    threshold = max(rtol * b_norm, atol)
+    r = fine_residual()
+    r_norm = np.linalg.norm(r)
+
+    cycles = 0
+    while np.isfinite(r_norm) and r_norm > threshold and cycles < max_cycles:
+        if cycles == 0 and cycle == "fmg":
+            e = _full_multigrid(levels, r)
+        else:
+            e = np.zeros(fine.shape)
+            _v_cycle(levels, 0, e, r)
+        cycles += 1
+
+        padded[core] += e
+        r = fine_residual()
+        r_prev, r_norm = r_norm, np.linalg.norm(r)
+        logger.debug(f"MG cycle {cycles}: residual={r_norm:.3e} factor={r_norm / r_prev if r_prev else 0.0:.3f}")
+
+    # Rule 7: Numerical Integrity Audit
+    if not np.isfinite(r_norm):
+        raise ArithmeticError(f"Multigrid Divergence: residual={r_norm} after {cycles} cycles")
+
+    if DEBUG:
+        print(f"DEBUG [Step 3]: MG({cycle}) cycles={cycles} residual={r_norm:.3e} levels={len(levels)}")
+
+    return cycles, float(r_norm)
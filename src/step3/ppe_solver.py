@@ -1,14 +1,39 @@
 # src/step3/ppe_solver.py
 
-import math
-
 from src.common.field_schema import FI
 from src.common.stencil_block import StencilBlock
+from src.step3.ops.audit import is_finite, worst
 from src.step3.ops.divergence import compute_local_divergence_v_star
 from src.step3.ops.scaling import get_rho_over_dt
 
 
-def solve_pressure_poisson_step(block: StencilBlock, omega: float) -> float:
+def compute_local_ppe_rhs(block: StencilBlock):
+    """
+    Source term of the Pressure Poisson Equation, Rhie-Chow stabilized:
+    rhs = (rho/dt) * (div(v*) - dt * lap(p^n))
+
+    Depends only on FI.P and the star-velocities, so it is constant across 
+    the sweeps of a single projection and may be computed once per step.
+    """
+    dx2, dy2, dz2 = block.dx**2, block.dy**2, block.dz**2
+    
+    # Guard against ZeroDivision in geometry (Physical/Code Bug)
+    if dx2 == 0 or dy2 == 0 or dz2 == 0:
+        raise ValueError("Grid spacing (dx, dy, or dz) cannot be zero.")
+
+    # 1. Compute Rhie-Chow Stabilization (Access FI.P Foundation)
+    lap_p_n = (
+        (block.i_plus.get_field(FI.P) - 2.0 * block.center.get_field(FI.P) + block.i_minus.get_field(FI.P)) / dx2 +
+        (block.j_plus.get_field(FI.P) - 2.0 * block.center.get_field(FI.P) + block.j_minus.get_field(FI.P)) / dy2 +
+        (block.k_plus.get_field(FI.P) - 2.0 * block.center.get_field(FI.P) + block.k_minus.get_field(FI.P)) / dz2
+    )
+    rhie_chow_term = block.dt * lap_p_n
+    
+    # 2. Compute RHS
+    div_v_star = compute_local_divergence_v_star(block)
+    return get_rho_over_dt(block) * (div_v_star - rhie_chow_term)
+
+def solve_pressure_poisson_step(block: StencilBlock, omega: float, rhs=None) -> float:
     """
     Consolidated PPE Solver using SOR iteration with Fail-Fast Math.
     
@@ -16,6 +41,9 @@ def solve_pressure_poisson_step(block: StencilBlock, omega: float) -> float:
     - Rule 7: Immediate math audit. If p_new or delta is non-finite, 
       raises ArithmeticError to signal Elasticity Manager for a retry.
     - Rule 9: Performs in-place updates via schema-locked accessors.
+
+    'rhs' may carry a precomputed compute_local_ppe_rhs result; when omitted 
+    it is evaluated from the block.
     """
     # 1. Geometry Setup
     dx2, dy2, dz2 = block.dx**2, block.dy**2, block.dz**2
@@ -26,17 +54,9 @@ def solve_pressure_poisson_step(block: StencilBlock, omega: float) -> float:
 
     stencil_denom = 2.0 * (1.0/dx2 + 1.0/dy2 + 1.0/dz2)
     
-    # 2. Compute Rhie-Chow Stabilization (Access FI.P Foundation)
-    lap_p_n = (
-        (block.i_plus.get_field(FI.P) - 2.0 * block.center.get_field(FI.P) + block.i_minus.get_field(FI.P)) / dx2 +
-        (block.j_plus.get_field(FI.P) - 2.0 * block.center.get_field(FI.P) + block.j_minus.get_field(FI.P)) / dy2 +
-        (block.k_plus.get_field(FI.P) - 2.0 * block.center.get_field(FI.P) + block.k_minus.get_field(FI.P)) / dz2
-    )
-    rhie_chow_term = block.dt * lap_p_n
-    
-    # 3. Compute RHS
-    div_v_star = compute_local_divergence_v_star(block)
-    rhs = get_rho_over_dt(block) * (div_v_star - rhie_chow_term)
+    # 2-3. Rhie-Chow stabilized RHS
+    if rhs is None:
+        rhs = compute_local_ppe_rhs(block)
     
     # 4. SOR Update (using FI.P_NEXT Trial Buffer)
     sum_neighbors = (
@@ -53,13 +73,62 @@ def solve_pressure_poisson_step(block: StencilBlock, omega: float) -> float:
 
     # 5. Rule 7: Numerical Integrity Audit
     # We check both p_new (stability) and delta (convergence health)
-    if not math.isfinite(p_new) or not math.isfinite(delta):
+    if not is_finite(p_new) or not is_finite(delta):
         raise ArithmeticError(
-            f"PPE Divergence: p_new={p_new}, delta={delta} "
+            f"PPE Divergence: p_new={worst(p_new)}, delta={worst(delta)} "
             f"at cell ({block.center.i}, {block.center.j}, {block.center.k})"
         )
     
     # 6. Direct write-back via schema-locked accessor
     block.center.set_field(FI.P_NEXT, p_new)
     
-    return delta
\ No newline at end of file
+    return delta
+
+def solve_pressure_poisson_sweep(sweep_blocks: list[StencilBlock], omega: float, rhs) -> float:
+    """
+    One red-black ordered SOR sweep over the whole core.
+
+    'sweep_blocks' are the CellView sub-lattice blocks from 
+    assemble_red_black_blocks (all red, then all black) and 'rhs' is the 
+    core-shaped compute_local_ppe_rhs of the core block. Cells of one color 
+    never touch each other, so each sub-lattice is updated with a single 
+    vectorized call and the result equals a cell-by-cell Gauss-Seidel pass 
+    in red-black order.
+
+    Returns the max |p_new - p_old| over the core for the ppe_tolerance exit.
+    """
+    max_delta = 0.0
+    for block in sweep_blocks:
+        delta = solve_pressure_poisson_step(block, omega, rhs[block.center.core_index])
+        max_delta = max(max_delta, float(delta.max()))
+    return max_delta
+
+def solve_pressure_poisson_sor(
+    sweep_blocks: list[StencilBlock],
+    rhs,
+    omega: float,
+    tolerance: float,
+    max_iter: int,
+    executor=None,
+    deltas=None
+) -> tuple[int, float]:
+    """
+    Red-black SOR backend: sweeps until the max delta drops below 
+    'tolerance' or 'max_iter' sweeps are spent. With a SlabExecutor, each 
+    sweep runs its color half-sweeps slab-parallel instead. Each sweep's max 
+    delta is appended to 'deltas' when given (convergence factor telemetry).
+
+    Returns (sweeps performed, last max delta).
+    """
+    sweeps, max_delta = 0, 0.0
+    while sweeps < max_iter:
+        sweeps += 1
+        if executor is None:
+            max_delta = solve_pressure_poisson_sweep(sweep_blocks, omega, rhs)
+        else:
+            max_delta = executor.sweep(omega, rhs)
+        if deltas is not None:
+            deltas.append(max_delta)
+        if max_delta < tolerance:
+            break
+    return sweeps, max_delta
@@ -0,0 +1,88 @@
+# src/step3/ppe_spectral.py
+
+import numpy as np
+
+from src.common.field_schema import FI
+from src.common.grid_math import weighted_neighbor_sum
+from src.common.stencil_block import StencilBlock
+
+# Rule 7: Granular Traceability
+DEBUG = False
+
+def _dst1(x: np.ndarray, axis: int) -> np.ndarray:
+    """
+    Unnormalized DST-I along 'axis' built from a real FFT:
+    X_k = sum_j x_j sin(pi (j+1)(k+1) / (n+1)).
+    The odd extension [0, x, 0, -x reversed] has spectrum -2i X.
+    """
+    moved = np.moveaxis(x, axis, -1)
+    n = moved.shape[-1]
+    zero = np.zeros(moved.shape[:-1] + (1,))
+    extended = np.concatenate([zero, moved, zero, -moved[..., ::-1]], axis=-1)
+    spectrum = np.fft.rfft(extended, axis=-1)[..., 1:n + 1]
+    return np.moveaxis(-0.5 * spectrum.imag, -1, axis)
+
+def _dirichlet_eigenvalues(n: int, h: float) -> np.ndarray:
+    """Eigenvalues of the 1D 3-point Laplacian with fixed values at both ghost centers."""
+    k = np.arange(1, n + 1)
+    return -(4.0 / h**2) * np.sin(np.pi * k / (2.0 * (n + 1)))**2
+
+def solve_pressure_poisson_spectral(core_block: StencilBlock, rhs: np.ndarray) -> tuple[int, float]:
+    """
+    Direct spectral solve of the Pressure Poisson Equation on an obstacle-free box.
+
+    The 7-point system of solve_pressure_poisson_step holds every ghost
+    P_NEXT fixed, i.e. Dirichlet data at the ghost centers on all six
+    faces. Moving the ghost terms to the right-hand side leaves a
+    constant-coefficient operator diagonalized by DST-I on each axis, so
+    p = DST^-1[ DST(rhs - ghosts) / (lx + ly + lz) ] in one O(N log N) pass.
+
+    Only valid when every core cell is an unknown of the same stencil,
+    which the dispatcher guarantees by selecting it for all-fluid masks.
+
+    Compliance:
+    - Rule 7: A non-finite solution raises ArithmeticError for Panic Mode retry.
+
+    Returns (1, residual norm of the written solution).
+    """
+    dx2, dy2, dz2 = core_block.dx**2, core_block.dy**2, core_block.dz**2
+
+    # Guard against ZeroDivision in geometry (Physical/Code Bug)
+    if dx2 == 0 or dy2 == 0 or dz2 == 0:
+        raise ValueError("Grid spacing (dx, dy, or dz) cannot be zero.")
+
+    weights = (1.0 / dx2, 1.0 / dy2, 1.0 / dz2)
+    padded = core_block.center.fields_buffer[..., FI.P_NEXT]
+    core = core_block.center.index
+    nx, ny, nz = rhs.shape
+
+    # 1. Ghost contributions: neighbor sum with the core zeroed
+    ghosts_only = padded.copy()
+    ghosts_only[core] = 0.0
+    source = rhs - weighted_neighbor_sum(ghosts_only, core, weights)
+
+    # 2. Forward transform, divide by the separable spectrum, inverse transform
+    spectrum = _dst1(_dst1(_dst1(source, 0), 1), 2)
+    eigen = (
+        _dirichlet_eigenvalues(nx, core_block.dx)[:, None, None] +
+        _dirichlet_eigenvalues(ny, core_block.dy)[None, :, None] +
+        _dirichlet_eigenvalues(nz, core_block.dz)[None, None, :]
+    )
+    # DST-I is its own inverse up to 2/(n+1) per axis
+    scale = 8.0 / ((nx + 1) * (ny + 1) * (nz + 1))
+    p = scale * _dst1(_dst1(_dst1(spectrum / eigen, 0), 1), 2)
+
+    # 3. Rule 7: Numerical Integrity Audit
+    if not np.isfinite(p).all():
+        raise ArithmeticError("Spectral PPE produced non-finite pressure.")
+
+    core_block.center.set_field(FI.P_NEXT, p)
+
+    # Residual of the full stencil, reported like the iterative backends
+    residual = weighted_neighbor_sum(padded, core, weights) - 2.0 * sum(weights) * p - rhs
+    r_norm = float(np.linalg.norm(residual))
+
+    if DEBUG:
+        print(f"DEBUG [Step 3]: Spectral PPE {nx}x{ny}x{nz} residual={r_norm:.3e}")
+
+    return 1, r_norm
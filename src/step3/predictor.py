@@ -1,10 +1,9 @@
 # src/step3/predictor.py
 
-import math
-
 from src.common.field_schema import FI
 from src.common.stencil_block import StencilBlock
 from src.step3.ops.advection import compute_local_advection_vector
+from src.step3.ops.audit import is_finite, worst
 from src.step3.ops.forces import get_local_body_force
 from src.step3.ops.gradient import compute_local_gradient_p
 from src.step3.ops.laplacian import compute_local_laplacian_v_n
@@ -49,14 +48,14 @@ def compute_local_predictor_step(block: StencilBlock) -> None:
         )
         
         # Rule 7: Immediate Numerical Audit
-        if not math.isfinite(v_star_val):
+        if not is_finite(v_star_val):
             # Provide high-res telemetry for GitHub Actions
             physics_context = (
-                f"lap={lap_v[i]:.2e}, adv={adv_v[i]:.2e}, "
-                f"force={force[i]:.2e}, grad_p={grad_p[i]:.2e}"
+                f"lap={worst(lap_v[i]):.2e}, adv={worst(adv_v[i]):.2e}, "
+                f"force={force[i]:.2e}, grad_p={worst(grad_p[i]):.2e}"
             )
             raise ArithmeticError(
-                f"Predictor Divergence at {field_id.name}: value={v_star_val} | "
+                f"Predictor Divergence at {field_id.name}: value={worst(v_star_val)} | "
                 f"Context: {physics_context}"
             )
 
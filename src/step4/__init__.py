@@ -12,8 +12,8 @@ Compliance:
   access paths and ensure the Foundation remains the exclusive source of state.
 """
 
-from src.step4.orchestrate_step4 import orchestrate_step4
+from src.step4.orchestrate_step4 import orchestrate_step4, orchestrate_step4_plan
 
 # By explicitly defining __all__, we ensure that internal logic (dispatcher 
 # and applier) is protected from external, non-orchestrated access.
-__all__ = ["orchestrate_step4"]
\ No newline at end of file
+__all__ = ["orchestrate_step4", "orchestrate_step4_plan"]
\ No newline at end of file
@@ -1,5 +1,8 @@
 # src/step4/boundary_applier.py
 
+import numpy as np
+
+from src.common.boundary_plan import BoundaryPlan
 from src.common.field_schema import FI
 from src.common.stencil_block import StencilBlock
 
@@ -11,6 +14,17 @@ BC_FIELD_MAP = {
     "p": FI.P
 }
 
+# Domain face -> (normal axis, ghost layer, adjacent core layer) in the padded view
+GHOST_FACES = {
+    "x_min": (0, 0, 1), "x_max": (0, -1, -2),
+    "y_min": (1, 0, 1), "y_max": (1, -1, -2),
+    "z_min": (2, 0, 1), "z_max": (2, -1, -2),
+}
+
+# Ghost fields per velocity component (committed + trial) and for pressure
+GHOST_VELOCITY_FIELDS = ([FI.VX, FI.VX_STAR], [FI.VY, FI.VY_STAR], [FI.VZ, FI.VZ_STAR])
+GHOST_PRESSURE_FIELDS = [FI.P, FI.P_NEXT]
+
 def apply_boundary_values(block: StencilBlock, rule: dict) -> None:
     """
     Applies boundary values to the StencilBlock.
@@ -35,4 +49,54 @@ def apply_boundary_values(block: StencilBlock, rule: dict) -> None:
             block.center.set_field(field_id, value)
         else:
             # Rule 5: Immediate failure for invalid configurations
-            raise KeyError(f"Unsupported boundary key '{key}' at {location}")
\ No newline at end of file
+            raise KeyError(f"Unsupported boundary key '{key}' at {location}")
+
+def apply_boundary_plan(plan: BoundaryPlan, fields_buffer: np.ndarray) -> None:
+    """
+    Applies a compiled BoundaryPlan to the Foundation.
+
+    One fancy-indexed assignment per field per group; the same values 
+    apply_boundary_values writes block by block.
+    """
+    for _, _, indices, field_values in plan.groups:
+        for field_id, value in field_values:
+            # Rule 9: Direct in-place update to Foundation
+            fields_buffer[indices, field_id] = value
+
+def _face_slab(padded: np.ndarray, axis: int, layer: int) -> np.ndarray:
+    """One buffer layer normal to 'axis', restricted to the core extent of the other axes."""
+    index = [slice(1, -1)] * 3
+    index[axis] = layer
+    return padded[tuple(index)]
+
+def apply_ghost_faces(plan: BoundaryPlan, padded: np.ndarray) -> None:
+    """
+    Fills the ghost layer of every domain face with whole-slab NumPy writes.
+
+    - no-slip / inflow / free-stream: Dirichlet velocity (an inflow
+      component the rule omits stays zero-gradient).
+    - free-slip: normal component mirrored (zero at the face), tangential 
+      components copied (zero gradient).
+    - outflow / pressure: velocity copied from the adjacent core layer.
+    Pressure is Dirichlet where the rule gives 'p' (always for 'pressure'), 
+    zero-gradient otherwise. Both the committed and the trial fields are 
+    written, so every Step 3 kernel reads consistent ghosts; the PPE keeps 
+    them fixed during a solve, i.e. zero-gradient pressure lags one pass.
+    """
+    for location, bc_type, velocity, pressure in plan.faces:
+        axis, ghost_layer, core_layer = GHOST_FACES[location]
+        ghost = _face_slab(padded, axis, ghost_layer)
+        adjacent = _face_slab(padded, axis, core_layer)
+
+        for component, fields in enumerate(GHOST_VELOCITY_FIELDS):
+            if velocity is not None and velocity[component] is not None:
+                ghost[..., fields] = velocity[component]
+            elif bc_type == "free-slip" and component == axis:
+                ghost[..., fields] = -adjacent[..., fields]
+            else:
+                ghost[..., fields] = adjacent[..., fields]
+
+        if pressure is not None:
+            ghost[..., GHOST_PRESSURE_FIELDS] = pressure
+        else:
+            ghost[..., GHOST_PRESSURE_FIELDS] = adjacent[..., GHOST_PRESSURE_FIELDS]
@@ -1,6 +1,20 @@
 # src/step4/boundary_dispatcher.py
 
+from src.common.boundary_plan import BoundaryPlan
+from src.common.field_schema import FI
+from src.common.grid_math import get_coords_from_index
+from src.common.solver_state import SolverState
 from src.common.stencil_block import StencilBlock
+from src.step4.boundary_applier import BC_FIELD_MAP
+
+# Domain faces in the precedence order of _get_domain_location_type
+DOMAIN_FACES = ("x_min", "x_max", "y_min", "y_max", "z_min", "z_max")
+
+# Fixed rule for solid cells (Mask 0)
+SOLID_VALUES = {'u': 0.0, 'v': 0.0, 'w': 0.0}
+
+# Ghost-layer velocity is Dirichlet for these types (mirrored or copied otherwise)
+DIRICHLET_VELOCITY_TYPES = ("no-slip", "inflow", "free-stream")
 
 
 def get_applicable_boundary_configs(block: StencilBlock, boundary_cfg: list, grid, domain_cfg: dict) -> list:
@@ -65,4 +79,127 @@ def _get_domain_location_type(block, grid) -> str:
     if y == grid.ny - 1: return "y_max"
     if z == 0: return "z_min"
     if z == grid.nz - 1: return "z_max"
-    return "none"
\ No newline at end of file
+    return "none"
+
+def compile_boundary_plan(state: SolverState, physical_faces: tuple = DOMAIN_FACES) -> BoundaryPlan:
+    """
+    Vectorized get_applicable_boundary_configs over every core cell, run once.
+
+    Cells are grouped by the rule the per-block dispatcher would return for 
+    them (wall, solid, then the first matching domain face), using the 
+    Foundation mask at the stencil table centers. Rule values are validated 
+    and mapped to FI ids here, so a sweep only performs the writes.
+
+    The ghost-layer rule of each of the six domain faces is compiled as well 
+    (see apply_ghost_faces).
+
+    'physical_faces' limits both to the faces of the local block that lie on 
+    the global domain boundary (see Communicator.physical_faces); the other 
+    faces are halos owned by a neighboring rank.
+    """
+    table = state.stencil_table
+    grid = state.grid
+    centers = table.center
+    mask = state.fields.data[centers, FI.MASK]
+    plan = BoundaryPlan()
+
+    # Configs are resolved lazily: a location with no cells needs no entry
+    boundary_cfg = None
+
+    def _rule(location: str) -> dict:
+        nonlocal boundary_cfg
+        if boundary_cfg is None:
+            boundary_cfg = state.boundary_conditions.to_dict()
+        return _find_config(boundary_cfg, location)[0]
+
+    def _configured(location: str) -> bool:
+        try:
+            _rule(location)
+        except KeyError:
+            return False
+        return True
+
+    # 1. Wall Boundary (Mask -1)
+    wall = mask == -1
+    if wall.any():
+        rule = _rule("wall")
+        plan.add_group("wall", rule["type"], centers[wall], _map_values(rule))
+
+    # 2. Solid Boundary (Mask 0)
+    plan.add_group("solid", "no-slip", centers[mask == 0], _map_values({'location': 'solid', 'values': SOLID_VALUES}))
+
+    # 3. Domain Boundaries, first matching face wins (core coordinates)
+    i, j, k = get_coords_from_index(centers, table.nx_buf, table.ny_buf)
+    i, j, k = i - 1, j - 1, k - 1
+    on_face = {
+        "x_min": i == 0, "x_max": i == grid.nx - 1,
+        "y_min": j == 0, "y_max": j == grid.ny - 1,
+        "z_min": k == 0, "z_max": k == grid.nz - 1,
+    }
+    remaining = (mask != -1) & (mask != 0)
+    domain = state.domain_configuration
+
+    for location in (face for face in DOMAIN_FACES if face in physical_faces):
+        selected = remaining & on_face[location]
+        remaining &= ~on_face[location]
+        if not selected.any():
+            continue
+
+        # Strategy: EXTERNAL flow uses far-field reference velocity
+        if domain.type == "EXTERNAL":
+            ref_v = domain.reference_velocity
+            values = {'u': ref_v[0], 'v': ref_v[1], 'w': ref_v[2]}
+            plan.add_group(location, "free-stream", centers[selected], _map_values({'location': location, 'values': values}))
+        else:
+            rule = _rule(location)
+            plan.add_group(location, rule["type"], centers[selected], _map_values(rule))
+
+    # 4. Ghost layer: every physical face with a rule, whether or not fluid cells touch it.
+    # A face without one (e.g. a solid shell with only a 'wall' rule) keeps its ghosts;
+    # faces that do touch fluid already required their rule in section 3.
+    for location in (face for face in DOMAIN_FACES if face in physical_faces):
+        if domain.type == "EXTERNAL":
+            # Far field: free-stream velocity, pressure gauge fixed at zero
+            plan.add_face(location, "free-stream", tuple(float(v) for v in domain.reference_velocity), 0.0)
+        elif _configured(location):
+            rule = _rule(location)
+            plan.add_face(location, rule["type"], *_ghost_values(rule))
+
+    return plan
+
+def _ghost_values(rule: dict) -> tuple:
+    """(Dirichlet velocity components or None, Dirichlet pressure or None) of a face rule."""
+    values = rule.get("values")
+
+    # Rule 5: Explicit or Error. No fallbacks.
+    if values is None:
+        raise ValueError(f"Boundary rule missing fields: location={rule.get('location')!r}")
+
+    velocity = None
+    if rule["type"] in DIRICHLET_VELOCITY_TYPES:
+        # Components the schema lets a rule omit: a no-slip wall is at rest,
+        # any other omitted component stays zero-gradient (None)
+        default = 0.0 if rule["type"] == "no-slip" else None
+        velocity = tuple(float(values[key]) if key in values else default for key in ("u", "v", "w"))
+
+    if rule["type"] == "pressure" and "p" not in values:
+        raise ValueError(f"'pressure' at {rule['location']} requires a 'p' value.")
+    pressure = float(values["p"]) if "p" in values else None
+
+    return velocity, pressure
+
+def _map_values(rule: dict) -> dict:
+    """Rule values keyed by FI id, with the applier's validation."""
+    values = rule.get("values")
+
+    # Rule 5: Explicit or Error. No fallbacks.
+    if values is None:
+        raise ValueError(f"Boundary rule missing fields: location={rule.get('location')!r}")
+
+    field_values = {}
+    for key, value in values.items():
+        field_id = BC_FIELD_MAP.get(key)
+        if field_id is None:
+            raise KeyError(f"Unsupported boundary key '{key}' at {rule.get('location')}")
+        field_values[field_id] = float(value)
+    return field_values
@@ -1,8 +1,14 @@
 # src/step4/orchestrate_step4.py
 
+from src.common.grid_math import get_padded_view
 from src.common.simulation_context import SimulationContext
+from src.common.solver_state import SolverState
 from src.common.stencil_block import StencilBlock
-from src.step4.boundary_applier import apply_boundary_values
+from src.step4.boundary_applier import (
+    apply_boundary_plan,
+    apply_boundary_values,
+    apply_ghost_faces,
+)
 from src.step4.boundary_dispatcher import get_applicable_boundary_configs
 
 
@@ -34,4 +40,24 @@ def orchestrate_step4(
     for rule in rules:
         apply_boundary_values(block, rule)
         
-    return block
\ No newline at end of file
+    return block
+
+def orchestrate_step4_plan(state: SolverState) -> SolverState:
+    """
+    Step 4 over the whole core: applies the boundary plan compiled in Step 2.
+
+    Equivalent to orchestrate_step4 on every block of the stencil_matrix, 
+    without per-block dispatch or configuration serialization, followed by 
+    the ghost-layer fill of the six domain faces (after the core writes, so 
+    zero-gradient faces copy the boundary values just applied).
+
+    Compliance:
+    - Rule 4 (SSoT): Rules were resolved once from the state's BC manager.
+    - Rule 9 (Hybrid Memory): In-place mutation of the Foundation buffer.
+    """
+    apply_boundary_plan(state.boundary_plan, state.fields.data)
+
+    grid = state.grid
+    padded = get_padded_view(state.fields.data, grid.nx + 2, grid.ny + 2, grid.nz + 2)
+    apply_ghost_faces(state.boundary_plan, padded)
+    return state
@@ -1,5 +1,7 @@
 # src/step5/io_archivist.py
 
+import queue
+import threading
 from pathlib import Path
 
 import h5py
@@ -7,40 +9,38 @@ import numpy as np
 
 from src.common.field_schema import FI
 
+# Rule 7: Granular Traceability
+DEBUG = False
 
-def save_snapshot(state) -> None:
-    """
-    Exports the physical 3D domain state to HDF5.
-    
-    Compliance:
-    - Rule 4 (SSoT): Accesses grid and state data from authorized sub-containers.
-    - Rule 8 (Law of Singular Access): Coordinates computed locally to avoid 'God Object' properties in GridManager.
-    - Rule 9 (Hybrid Memory): Direct Foundation slicing via FI schema.
-    """
-    output_dir = Path("output")
+# Physical fields exported per snapshot, in dataset order
+SNAPSHOT_FIELDS = (("vx", FI.VX), ("vy", FI.VY), ("vz", FI.VZ), ("p", FI.P))
+
+
+def _core_field(data: np.ndarray, field_id: int, nx: int, ny: int, nz: int) -> np.ndarray:
+    """Direct, schema-locked view of one field over the Core (Rule 9)."""
+    return data[:, field_id].reshape(nx+2, ny+2, nz+2)[1:-1, 1:-1, 1:-1]
+
+def _snapshot_path(state) -> Path:
+    output_dir = Path(state.manifest.output_directory)
     output_dir.mkdir(parents=True, exist_ok=True)
-    
+
     # Rule 5: Explicit derivation of state properties.
-    filename = output_dir / f"snapshot_{state.iteration:04d}.h5"
-    
+    return output_dir / f"snapshot_{state.iteration:04d}.h5"
+
+def _write_snapshot(filename: Path, fields, grid, mask: np.ndarray, time: float, iteration: int) -> None:
+    """Writes one HDF5 snapshot; 'fields' are the Core arrays in SNAPSHOT_FIELDS order."""
     # Retrieve dimensions from the authorized Grid container
-    nx, ny, nz = state.grid.nx, state.grid.ny, state.grid.nz
-    
+    nx, ny, nz = grid.nx, grid.ny, grid.nz
+
     # Compute coordinate meshes on-the-fly (Rule 8 compliance)
-    x = np.linspace(state.grid.x_min, state.grid.x_max, nx)
-    y = np.linspace(state.grid.y_min, state.grid.y_max, ny)
-    z = np.linspace(state.grid.z_min, state.grid.z_max, nz)
-    
-    # Access the contiguous Foundation buffer (The "Sink") 
-    # via the authorized FieldManager (Rule 9 compliance)
-    data = state.fields.data 
+    x = np.linspace(grid.x_min, grid.x_max, nx)
+    y = np.linspace(grid.y_min, grid.y_max, ny)
+    z = np.linspace(grid.z_min, grid.z_max, nz)
 
     with h5py.File(filename, 'w') as h5f:
         # Physical Fields: Direct, schema-locked slicing (Rule 9)
-        h5f.create_dataset("vx", data=data[:, FI.VX].reshape(nx+2, ny+2, nz+2)[1:-1, 1:-1, 1:-1])
-        h5f.create_dataset("vy", data=data[:, FI.VY].reshape(nx+2, ny+2, nz+2)[1:-1, 1:-1, 1:-1])
-        h5f.create_dataset("vz", data=data[:, FI.VZ].reshape(nx+2, ny+2, nz+2)[1:-1, 1:-1, 1:-1])
-        h5f.create_dataset("p",  data=data[:, FI.P].reshape(nx+2, ny+2, nz+2)[1:-1, 1:-1, 1:-1])
+        for (name, _), values in zip(SNAPSHOT_FIELDS, fields, strict=True):
+            h5f.create_dataset(name, data=values)
         
         # Spatial metadata: Using computed arrays
         h5f.create_dataset('x', data=x)
@@ -48,14 +48,120 @@ def save_snapshot(state) -> None:
         h5f.create_dataset('z', data=z)
         
         # Grid mask retrieved from MaskManager
-        h5f.create_dataset('mask', data=state.mask.mask)
-        
+        h5f.create_dataset('mask', data=mask)
+
         # Global Metadata: Explicit attribution
-        h5f.attrs['time'] = state.time
-        h5f.attrs['iteration'] = state.iteration
-        h5f.attrs['dx'] = (state.grid.x_max - state.grid.x_min) / nx
-        h5f.attrs['dy'] = (state.grid.y_max - state.grid.y_min) / ny
-        h5f.attrs['dz'] = (state.grid.z_max - state.grid.z_min) / nz
-    
+        h5f.attrs['time'] = time
+        h5f.attrs['iteration'] = iteration
+        h5f.attrs['dx'] = (grid.x_max - grid.x_min) / nx
+        h5f.attrs['dy'] = (grid.y_max - grid.y_min) / ny
+        h5f.attrs['dz'] = (grid.z_max - grid.z_min) / nz
+
+def save_snapshot(state, archive=None) -> None:
+    """
+    Exports the physical 3D domain state to HDF5.
+
+    Compliance:
+    - Rule 4 (SSoT): Accesses grid and state data from authorized sub-containers.
+    - Rule 8 (Law of Singular Access): Coordinates computed locally to avoid 'God Object' properties in GridManager.
+    - Rule 9 (Hybrid Memory): Direct Foundation slicing via FI schema.
+
+    The finished file is appended to 'archive' (a StreamingArchive) if given.
+    """
+    filename = _snapshot_path(state)
+    grid = state.grid
+
+    # Access the contiguous Foundation buffer (The "Sink") 
+    # via the authorized FieldManager (Rule 9 compliance)
+    data = state.fields.data 
+    fields = [_core_field(data, field_id, grid.nx, grid.ny, grid.nz) for _, field_id in SNAPSHOT_FIELDS]
+
+    _write_snapshot(filename, fields, grid, state.mask.mask, state.time, state.iteration)
+    if archive is not None:
+        archive.add(filename)
+
     # Update manifest via the state object
-    state.manifest.saved_snapshots.append(str(filename))
\ No newline at end of file
+    state.manifest.saved_snapshots.append(str(filename))
+
+
+class SnapshotWriter:
+    """
+    Asynchronous save_snapshot with reusable staging buffers.
+
+    submit() copies the Core fields into a free staging buffer and queues 
+    the write for a background thread, so the time loop continues at once; 
+    with all 'depth' buffers in flight it blocks until one is written 
+    (backpressure). Files are identical to save_snapshot's, and each is 
+    appended to state.manifest.saved_snapshots (and to 'archive', if given) 
+    when its write completes.
+
+    Compliance:
+    - Rule 5 (Explicit or Error): A failed write is re-raised in the solver 
+      thread by the next submit() or by flush().
+    - Rule 9 (Hybrid Memory): Staging is allocated once, never per snapshot.
+    """
+    __slots__ = ['_state', '_archive', '_free', '_jobs', '_thread', '_error']
+
+    def __init__(self, state, depth: int = 2, archive=None):
+        if depth < 1:
+            raise ValueError(f"SnapshotWriter depth must be >= 1, got {depth}.")
+        grid = state.grid
+        self._state = state
+        self._archive = archive
+        self._free = queue.Queue()
+        for _ in range(depth):
+            self._free.put(np.empty((len(SNAPSHOT_FIELDS), grid.nx, grid.ny, grid.nz)))
+        self._jobs = queue.Queue(maxsize=depth)
+        self._error = None
+        self._thread = threading.Thread(target=self._write_loop, name="SnapshotWriter", daemon=True)
+        self._thread.start()
+
+    def _raise_pending(self) -> None:
+        error, self._error = self._error, None
+        if error is not None:
+            raise error
+
+    def submit(self, state) -> None:
+        """Stages the current Core fields and queues their snapshot."""
+        self._raise_pending()
+        grid = state.grid
+
+        # Backpressure: wait for a staging buffer the writer has released
+        staging = self._free.get()
+        for n, (_, field_id) in enumerate(SNAPSHOT_FIELDS):
+            np.copyto(staging[n], _core_field(state.fields.data, field_id, grid.nx, grid.ny, grid.nz))
+
+        self._jobs.put((_snapshot_path(state), staging, state.time, state.iteration))
+
+    def _write_loop(self) -> None:
+        state = self._state
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                self._jobs.task_done()
+                return
+            filename, staging, time, iteration = job
+            try:
+                _write_snapshot(filename, staging, state.grid, state.mask.mask, time, iteration)
+                if self._archive is not None:
+                    self._archive.add(filename)
+                state.manifest.saved_snapshots.append(str(filename))
+                if DEBUG:
+                    print(f"DEBUG [Step 5]: Snapshot {filename} written")
+            except Exception as e:
+                self._error = e
+            finally:
+                self._free.put(staging)
+                self._jobs.task_done()
+
+    def flush(self) -> None:
+        """Blocks until every queued snapshot is written."""
+        self._jobs.join()
+        self._raise_pending()
+
+    def close(self) -> None:
+        """Flushes and stops the writer thread."""
+        self._jobs.join()
+        self._jobs.put(None)
+        self._thread.join()
+        self._raise_pending()
@@ -2,10 +2,11 @@
 
 from src.common.simulation_context import SimulationContext
 from src.common.solver_state import SolverState
-from src.step5.io_archivist import save_snapshot
+from src.step5.io_archivist import SnapshotWriter, save_snapshot
 
 
-def orchestrate_step5(state: SolverState, context: SimulationContext) -> SolverState:
+def orchestrate_step5(state: SolverState, context: SimulationContext,
+                      writer: SnapshotWriter | None = None, archive=None) -> SolverState:
     """
     Step 5: The Archivist Orchestration.
     
@@ -13,6 +14,11 @@ def orchestrate_step5(state: SolverState, context: SimulationContext) -> SolverS
     - Rule 4 (SSoT): Accesses output interval exclusively via simulation_parameters.
     - Rule 5 (Deterministic Init): Relies on explicit iteration counts from the input schema.
     - Rule 9 (Hybrid Memory): Logic-layer remains thin; archiving is delegated.
+
+    With a SnapshotWriter (config 'snapshot_queue_depth' > 0) the snapshot 
+    is staged and written in the background; the manifest entry follows 
+    when the write completes. Inline snapshots are appended to 'archive' 
+    (a StreamingArchive) when given; a writer carries its own.
     """
     
     # Rule 4: SSoT Compliance
@@ -25,6 +31,9 @@ def orchestrate_step5(state: SolverState, context: SimulationContext) -> SolverS
     if state.iteration % interval == 0:
         # Rule 4: Data persistence delegated to the Archivist.
         # No serialization logic here; orchestration stays thin and focused.
-        save_snapshot(state)
+        if writer is None:
+            save_snapshot(state, archive)
+        else:
+            writer.submit(state)
         
     return state
\ No newline at end of file
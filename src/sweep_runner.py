@@ -0,0 +1,349 @@
+# src/sweep_runner.py
+
+"""
+Ensemble / parameter-sweep entry point.
+
+Runs many variants of one simulation on a process pool instead of one
+'python src/main_solver.py' invocation per variant. A case is a complete
+solver input: either a base input with dotted-path overrides taken from a
+parameter grid, or one line of a JSONL file.
+
+Compliance:
+- Rule 0 (Law of Performance): imports, the input schema and config are
+  loaded once per worker; Step 1 masks and Step 2 stencil indices are built
+  once per distinct (grid, mask) and shared by every case that uses them.
+  Optionally, such cases are batched along an ensemble axis (EnsembleSolver).
+- Rule 5 (Explicit or Error): a failing case is recorded with its error in
+  the summary; the other cases still run.
+"""
+
+import argparse
+import copy
+import hashlib
+import itertools
+import json
+import multiprocessing
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+from src.common.mask_io import anchor_mask_path, decode_mask, is_procedural
+from src.common.simulation_context import SimulationContext
+from src.main_solver import (
+    BASE_DIR,
+    assemble_simulation,
+    execute_time_loop,
+    load_input_schema,
+)
+from src.parallel.ensemble import EnsembleSolver, allocate_batch
+from src.step1.orchestrate_step1 import orchestrate_step1
+from src.step2.stencil_assembler import assemble_stencil_table
+
+# Rule 7: Granular Traceability
+DEBUG = False
+
+SUMMARY_FILE = "sweep_summary.json"
+
+# Per-process worker context, filled by _init_worker
+_WORKER = {}
+
+
+# --- Case expansion ---
+def set_by_path(document: dict, path: str, value) -> None:
+    """
+    Assigns 'value' at a dotted path; integer components index lists
+    (e.g. 'boundary_conditions.0.values.u'). Every parent must exist.
+    """
+    *parents, leaf = path.split(".")
+    node = document
+    try:
+        for key in parents:
+            node = node[int(key)] if isinstance(node, list) else node[key]
+        if isinstance(node, list):
+            node[int(leaf)] = value
+        elif leaf in node:
+            node[leaf] = value
+        else:
+            raise KeyError(leaf)
+    except (KeyError, IndexError, ValueError, TypeError) as e:
+        raise ValueError(f"Sweep parameter '{path}' does not address the base input.") from e
+
+
+def expand_parameter_grid(base_input: dict, parameter_grid: dict) -> list[tuple[dict, dict]]:
+    """
+    Cartesian product of 'parameter_grid' ({dotted path: [values]}) applied
+    to copies of 'base_input'. Returns (parameters, input) pairs, the last
+    path varying fastest.
+    """
+    paths = list(parameter_grid)
+    for path in paths:
+        if not isinstance(parameter_grid[path], list) or not parameter_grid[path]:
+            raise ValueError(f"Sweep parameter '{path}' needs a non-empty list of values.")
+
+    cases = []
+    for values in itertools.product(*(parameter_grid[path] for path in paths)):
+        case_input = copy.deepcopy(base_input)
+        for path, value in zip(paths, values, strict=True):
+            set_by_path(case_input, path, value)
+        cases.append((dict(zip(paths, values, strict=True)), case_input))
+    return cases
+
+
+def load_cases_jsonl(path) -> list[tuple[dict, dict]]:
+    """One complete solver input per non-empty line, as (parameters, input) pairs."""
+    with open(path) as f:
+        return [({}, json.loads(line)) for line in f if line.strip()]
+
+
+# --- Shared topology ---
+def topology_key(input_dict: dict) -> str:
+    """Cases with equal grid resolution and mask share their Step 1/2 topology."""
+    grid = input_dict["grid"]
+    digest = hashlib.sha1(np.asarray([grid["nx"], grid["ny"], grid["nz"]], dtype=np.int64).tobytes())
+    mask = input_dict["mask"]
+    if is_procedural(mask):
+        # Rasterized on the grid: the primitives and the domain bounds define the topology
+        bounds = [grid[k] for k in ("x_min", "x_max", "y_min", "y_max", "z_min", "z_max")]
+        digest.update(json.dumps([bounds, mask], sort_keys=True).encode())
+    else:
+        digest.update(decode_mask(mask).astype(np.int8).tobytes())
+    return digest.hexdigest()
+
+
+def build_topologies(cases: list[tuple[dict, dict]], config_dict: dict) -> dict:
+    """
+    Pre-builds (mask_3d, stencil_table) once per topology key. Arrays are
+    frozen because every case of the key reads the same memory. A key whose
+    first case cannot be assembled is skipped: its cases rebuild and report
+    the error themselves.
+    """
+    topologies = {}
+    for _, case_input in cases:
+        key = topology_key(case_input)
+        if key in topologies:
+            continue
+        try:
+            state = orchestrate_step1(SimulationContext.create(case_input, dict(config_dict)))
+            table = assemble_stencil_table(state)
+        except Exception as e:
+            if DEBUG:
+                print(f"DEBUG [Sweep]: topology {key[:8]} not shared ({e})")
+            continue
+        mask_3d = state.mask.mask
+        for array in (mask_3d, *(getattr(table, name) for name in table.MEMBERS)):
+            array.flags.writeable = False
+        topologies[key] = (mask_3d, table)
+    return topologies
+
+
+# --- Workers ---
+def _init_worker(config_dict: dict, topologies: dict) -> None:
+    _WORKER["config"] = config_dict
+    _WORKER["schema"] = load_input_schema()
+    _WORKER["topologies"] = topologies
+
+
+def _assemble_case(case_input: dict, output_directory: str, fields_buffer=None):
+    """Steps 1-2 of one case on the worker's shared topology; returns (state, context)."""
+    context = SimulationContext.create(case_input, dict(_WORKER["config"]))
+    if context.config.num_processes > 1:
+        raise ValueError("Sweep cases run inside pool workers; set 'num_processes' to 1.")
+
+    mask_3d, table = _WORKER["topologies"].get(topology_key(case_input), (None, None))
+    state, _ = assemble_simulation(
+        context, _WORKER["schema"], mask_3d=mask_3d, stencil_table=table, fields_buffer=fields_buffer
+    )
+    state.manifest.output_directory = output_directory
+    return state, context
+
+
+def _completed(record: dict, state) -> dict:
+    record.update(
+        status="completed",
+        iterations=state.iteration,
+        time=state.time,
+        snapshots=list(state.manifest.saved_snapshots),
+    )
+    return record
+
+
+def run_case(case_id: str, case_input: dict, output_directory: str) -> dict:
+    """Runs one case to total_time, writing its snapshots to 'output_directory'."""
+    record = {"case_id": case_id, "output_directory": output_directory}
+    start = time.perf_counter()
+    try:
+        state, context = _assemble_case(case_input, output_directory)
+        _completed(record, execute_time_loop(state, context))
+    except Exception as e:
+        record.update(status="failed", error=f"{type(e).__name__}: {e}")
+    record["wall_time"] = time.perf_counter() - start
+
+    if DEBUG:
+        print(f"DEBUG [Sweep]: {case_id} {record['status']} in {record['wall_time']:.2f}s")
+    return record
+
+
+def run_case_batch(cases: list[tuple[str, dict, str]]) -> list[dict]:
+    """
+    Runs (case_id, input, output_directory) cases of one topology together
+    on an EnsembleSolver. Cases that fail to assemble are reported and left
+    out of the batch; 'wall_time' is that of the whole batch.
+    """
+    start = time.perf_counter()
+    records = [{"case_id": case_id, "output_directory": case_dir} for case_id, _, case_dir in cases]
+    states, contexts = [None] * len(cases), [None] * len(cases)
+
+    first = cases[0][1]
+    batch = allocate_batch(len(cases), (first["grid"]["nx"] + 2) * (first["grid"]["ny"] + 2) * (first["grid"]["nz"] + 2))
+    for c, (_, case_input, case_dir) in enumerate(cases):
+        try:
+            states[c], contexts[c] = _assemble_case(case_input, case_dir, fields_buffer=batch[c])
+        except Exception as e:
+            records[c].update(status="failed", error=f"{type(e).__name__}: {e}")
+
+    if any(state is not None for state in states):
+        try:
+            errors = EnsembleSolver(batch, states, contexts).run()
+        except Exception as e:
+            # One batch-wide failure (e.g. a Step 5 write) fails its cases, not the sweep
+            errors = [f"{type(e).__name__}: {e}"] * len(cases)
+        for c, state in enumerate(states):
+            if state is None:
+                continue
+            if errors[c] is None:
+                _completed(records[c], state)
+            else:
+                records[c].update(status="failed", error=errors[c])
+
+    wall_time = time.perf_counter() - start
+    for record in records:
+        record["wall_time"] = wall_time
+
+    if DEBUG:
+        print(f"DEBUG [Sweep]: batch of {len(cases)} cases in {wall_time:.2f}s")
+    return records
+
+
+def _batches(jobs: list, batch_size: int) -> list[list]:
+    """Consecutive chunks of at most 'batch_size' jobs sharing one topology key."""
+    groups = {}
+    for job in jobs:
+        groups.setdefault(topology_key(job[2]), []).append(job)
+    return [group[n:n + batch_size] for group in groups.values() for n in range(0, len(group), batch_size)]
+
+
+def run_sweep(cases: list[tuple[dict, dict]], output_root, workers: int, config_dict: dict | None = None,
+              batch_size: int = 1) -> dict:
+    """
+    Runs every (parameters, input) case on a pool of 'workers' processes.
+
+    With 'batch_size' > 1, cases of one topology are advanced up to 
+    'batch_size' at a time by an EnsembleSolver (red-black SOR PPE) in a 
+    single worker, instead of one case per task. This requires 
+    'ppe_solver' to be 'sor'.
+
+    Case n writes to <output_root>/case_NNNN/ (its input.json and snapshots);
+    the combined summary is returned and written to <output_root>/sweep_summary.json.
+    'config_dict' defaults to the project config.json, as for run_solver.
+    """
+    if workers < 1:
+        raise ValueError(f"Sweep needs at least one worker, got {workers}.")
+    if batch_size < 1:
+        raise ValueError(f"Sweep batch_size must be at least 1, got {batch_size}.")
+    if config_dict is None:
+        with open(BASE_DIR / "config.json") as f:
+            config_dict = json.load(f)
+    # Rule 5: batching must not swap the configured PPE backend (SolverConfig default: 'sor')
+    if batch_size > 1 and config_dict.get("ppe_solver", "sor") != "sor":
+        raise ValueError(f"Sweep batch_size > 1 runs the SOR PPE only; config sets "
+                         f"ppe_solver '{config_dict['ppe_solver']}'. Use batch_size 1 or 'sor'.")
+
+    output_root = Path(output_root)
+    start = time.perf_counter()
+    topologies = build_topologies(cases, config_dict)
+
+    jobs = []
+    for n, (parameters, case_input) in enumerate(cases):
+        case_id = f"case_{n:04d}"
+        case_dir = output_root / case_id
+        case_dir.mkdir(parents=True, exist_ok=True)
+        with open(case_dir / "input.json", "w") as f:
+            json.dump(case_input, f, indent=2)
+        jobs.append((case_id, parameters, case_input, str(case_dir)))
+
+    # Forked workers inherit the shared topology without pickling it
+    pool = ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("fork"),
+        initializer=_init_worker,
+        initargs=(config_dict, topologies),
+    )
+    with pool:
+        if batch_size == 1:
+            futures = [pool.submit(run_case, case_id, case_input, case_dir)
+                       for case_id, _, case_input, case_dir in jobs]
+            records = [future.result() for future in futures]
+        else:
+            futures = [pool.submit(run_case_batch, [(case_id, case_input, case_dir)
+                                                    for case_id, _, case_input, case_dir in batch])
+                       for batch in _batches(jobs, batch_size)]
+            by_id = {record["case_id"]: record for future in futures for record in future.result()}
+            records = [by_id[case_id] for case_id, _, _, _ in jobs]
+
+    for (_, parameters, _, _), record in zip(jobs, records, strict=True):
+        record["parameters"] = parameters
+
+    summary = {
+        "n_cases": len(records),
+        "n_completed": sum(record["status"] == "completed" for record in records),
+        "n_failed": sum(record["status"] == "failed" for record in records),
+        "workers": workers,
+        "batch_size": batch_size,
+        "shared_topologies": len(topologies),
+        "wall_time": time.perf_counter() - start,
+        "cases": records,
+    }
+    output_root.mkdir(parents=True, exist_ok=True)
+    with open(output_root / SUMMARY_FILE, "w") as f:
+        json.dump(summary, f, indent=2)
+    return summary
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Run an ensemble of solver cases on a process pool.")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--cases", help="JSONL file, one complete solver input per line")
+    source.add_argument("--base", help="Base solver input JSON (used with --grid)")
+    parser.add_argument("--grid", help="JSON file holding an object {dotted.path: [values, ...]}")
+    parser.add_argument("--workers", type=int, required=True, help="Number of worker processes")
+    parser.add_argument("--output", required=True, help="Root directory for case outputs and the summary")
+    parser.add_argument("--batch-size", type=int, default=1,
+                        help="Cases of one grid and mask advanced together per worker (ensemble axis)")
+    args = parser.parse_args(argv)
+
+    if args.cases:
+        cases = load_cases_jsonl(BASE_DIR / args.cases)
+    else:
+        if not args.grid:
+            parser.error("--base requires --grid")
+        with open(BASE_DIR / args.base) as f:
+            base_input = json.load(f)
+        with open(BASE_DIR / args.grid) as f:
+            cases = expand_parameter_grid(base_input, json.load(f))
+
+    # Relative mask file references resolve against the input file, as in run_solver
+    source_dir = (BASE_DIR / (args.cases or args.base)).parent
+    for _, case_input in cases:
+        case_input["mask"] = anchor_mask_path(case_input["mask"], source_dir)
+
+    summary = run_sweep(cases, BASE_DIR / args.output, args.workers, batch_size=args.batch_size)
+    print(f"Sweep complete: {summary['n_completed']}/{summary['n_cases']} cases. "
+          f"Summary at {BASE_DIR / args.output / SUMMARY_FILE}")
+    return 0 if summary["n_failed"] == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,81 @@
+# tests/common/test_archive_service.py
+
+import zipfile
+
+import h5py
+import numpy as np
+import pytest
+
+import src.main_solver
+from src.common.archive_service import StreamingArchive, archive_simulation_artifacts
+from src.step5.io_archivist import save_snapshot
+from tests.helpers.solver_step1_output_dummy import make_step1_output_dummy
+
+
+def _h5(path, **dataset_options):
+    with h5py.File(path, "w") as h5f:
+        h5f.create_dataset("p", data=np.zeros((8, 8, 8)), **dataset_options)
+    return path
+
+def test_members_stream_into_a_partial_archive(tmp_path):
+    plain = _h5(tmp_path / "plain.h5")
+    packed = _h5(tmp_path / "packed.h5", compression="gzip")
+    target = tmp_path / "target"
+
+    archive = StreamingArchive(target)
+    archive.add(plain)
+    archive.add(packed)
+    # Nothing is visible at the destination until finalize
+    assert not (target / "navier_stokes_output.zip").exists()
+    assert len(list(target.glob("*.partial"))) == 1
+
+    destination = archive.finalize()
+
+    assert list(target.iterdir()) == [target / "navier_stokes_output.zip"]
+    with zipfile.ZipFile(destination) as zf:
+        assert zf.getinfo("plain.h5").compress_type == zipfile.ZIP_DEFLATED
+        assert zf.getinfo("packed.h5").compress_type == zipfile.ZIP_STORED
+        assert zf.read("packed.h5") == packed.read_bytes()
+
+def test_abort_leaves_no_artifact(tmp_path):
+    archive = StreamingArchive(tmp_path)
+    archive.add(_h5(tmp_path / "a.h5"))
+    archive.abort()
+    assert list(tmp_path.iterdir()) == [tmp_path / "a.h5"]
+
+def test_streamed_archive_matches_end_of_run_zip(tmp_path, monkeypatch):
+    monkeypatch.setattr(src.main_solver, "BASE_DIR", tmp_path)
+    monkeypatch.chdir(tmp_path)
+
+    def run(name, archive):
+        state = make_step1_output_dummy(nx=3, ny=3, nz=3)
+        state.manifest.output_directory = str(tmp_path / name)
+        for iteration in (1, 2):
+            state.iteration = iteration
+            save_snapshot(state, archive)
+        # Artifacts written outside save_snapshot are still picked up at the end
+        (tmp_path / name / "notes.txt").write_text("run notes")
+        with zipfile.ZipFile(archive_simulation_artifacts(state, archive)) as zf:
+            return {member: zf.read(member) for member in zf.namelist()}
+
+    legacy = run("legacy", None)
+    streamed = run("streamed", StreamingArchive())
+
+    assert sorted(streamed) == sorted(legacy) == ["notes.txt", "snapshot_0001.h5", "snapshot_0002.h5"]
+    assert streamed == legacy
+    assert (tmp_path / "navier_stokes_output" / "snapshot_0002.h5").exists()
+
+def test_failed_archiving_removes_the_partial_archive(tmp_path, monkeypatch):
+    """No snapshot directory at archive time: the archiver raises and the open .partial is aborted."""
+    monkeypatch.setattr(src.main_solver, "BASE_DIR", tmp_path)
+    monkeypatch.chdir(tmp_path)
+    state = make_step1_output_dummy(nx=3, ny=3, nz=3)
+    state.manifest.output_directory = str(tmp_path / "never_written")
+    monkeypatch.setattr(src.main_solver, "_load_simulation_context", lambda path: None)
+    monkeypatch.setattr(src.main_solver, "load_input_schema", dict)
+    monkeypatch.setattr(src.main_solver, "assemble_simulation", lambda context, schema: (state, None))
+    monkeypatch.setattr(src.main_solver, "execute_time_loop", lambda state, *args: state)
+
+    with pytest.raises(FileNotFoundError, match="Source directory"):
+        src.main_solver.run_solver("input.json")
+    assert not list((tmp_path / "data" / "testing-input-output").iterdir())
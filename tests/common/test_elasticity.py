@@ -0,0 +1,185 @@
+# tests/common/test_elasticity.py
+
+import json
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from src.common.elasticity import ElasticManager
+from src.common.field_schema import FI
+
+
+def _manager_and_state(n_cells=50):
+    config = SimpleNamespace(dt_min_limit=1e-6, ppe_omega=1.5, ppe_max_iter=100, divergence_threshold=1e3)
+    data = np.random.default_rng(0).uniform(-1.0, 1.0, size=(n_cells, FI.num_fields()))
+    return ElasticManager(config, 0.01), SimpleNamespace(fields=SimpleNamespace(data=data))
+
+def test_commit_copies_trial_fields_in_place():
+    elasticity, state = _manager_and_state()
+    data = state.fields.data
+    expected = data.copy()
+    expected[:, [FI.VX, FI.VY, FI.VZ]] = expected[:, [FI.VX_STAR, FI.VY_STAR, FI.VZ_STAR]]
+    expected[:, FI.P] = expected[:, FI.P_NEXT]
+
+    assert elasticity.validate_and_commit(state) is True
+    assert state.fields.data is data
+    np.testing.assert_array_equal(data, expected)
+
+@pytest.mark.parametrize("field, value", [
+    (FI.VY_STAR, np.nan), (FI.P_NEXT, np.nan), (FI.P_NEXT, np.inf), (FI.VZ_STAR, -np.inf), (FI.VX_STAR, 2e3), (FI.P_NEXT, -2e3)
+])
+def test_audit_rejects_without_committing(field, value):
+    elasticity, state = _manager_and_state()
+    state.fields.data[7, field] = value
+    before = state.fields.data.copy()
+
+    assert elasticity.validate_and_commit(state) is False
+    np.testing.assert_array_equal(state.fields.data, before)
+
+def test_audit_ignores_committed_and_mask_columns():
+    elasticity, state = _manager_and_state()
+    state.fields.data[3, [FI.VX, FI.P, FI.MASK]] = 1e9
+
+    assert elasticity.validate_and_commit(state) is True
+
+def _cfl_setup(speed, viscosity, cfl_number=0.5, target_dt=0.01):
+    config = SimpleNamespace(dt_min_limit=1e-6, ppe_omega=1.5, ppe_max_iter=100, divergence_threshold=1e3,
+                             dt=target_dt, cfl_number=cfl_number)
+    data = np.zeros((8, FI.num_fields()))
+    data[3, [FI.VX, FI.VY, FI.VZ]] = [speed, -speed, 0.0]
+    state = SimpleNamespace(
+        fields=SimpleNamespace(data=data),
+        grid=SimpleNamespace(dx=0.1, dy=0.1, dz=0.2),
+        fluid_properties=SimpleNamespace(density=1.0, viscosity=viscosity),
+    )
+    return ElasticManager(config, target_dt), state
+
+def test_adapt_dt_is_off_without_cfl_number():
+    elasticity, state = _manager_and_state()
+    assert elasticity.adapt_dt(state) == elasticity.dt == 0.01
+
+@pytest.mark.parametrize("speed, viscosity, expected", [
+    (10.0, 0.0, 0.5 / 200.0),                       # convective: |u|/dx + |v|/dy = 200
+    (0.0, 1.0, 0.5 / (2.0 * (100 + 100 + 25))),     # viscous: 2 nu sum(1/dx^2)
+    (0.1, 1e-6, 0.01),                              # both loose: the target caps dt
+])
+def test_adapt_dt_picks_the_binding_limit(speed, viscosity, expected):
+    elasticity, state = _cfl_setup(speed, viscosity)
+    assert elasticity.adapt_dt(state) == pytest.approx(expected)
+    assert elasticity.dt == pytest.approx(expected)
+
+def test_panic_lowers_the_adaptive_ceiling_until_recovery():
+    elasticity, state = _cfl_setup(0.1, 1e-6)
+    elasticity.apply_panic_mode()
+    assert elasticity.adapt_dt(state) == pytest.approx(0.005)
+
+    for _ in range(elasticity.cooldown_limit):
+        elasticity.gradual_recovery()
+    assert elasticity.adapt_dt(state) == pytest.approx(0.0055)
+
+    while elasticity.is_in_panic:
+        elasticity.gradual_recovery()
+    assert elasticity.adapt_dt(state) == 0.01
+
+def test_adapt_dt_never_drops_below_the_floor():
+    elasticity, state = _cfl_setup(1e9, 0.0)
+    assert elasticity.adapt_dt(state) == elasticity.dt_floor
+
+def _controlled(target=10, omega=1.0, dt=0.01):
+    config = SimpleNamespace(dt_min_limit=1e-6, ppe_omega=omega, ppe_max_iter=100, divergence_threshold=1e3,
+                             dt=dt, ppe_target_iterations=target)
+    return ElasticManager(config, dt)
+
+def _commit_step(elasticity, iterations, deltas=()):
+    elasticity.sweep_deltas.extend(deltas)
+    elasticity.record_solve(iterations)
+    elasticity.gradual_recovery()
+
+def test_controller_steers_dt_toward_the_target_iterations():
+    elasticity = _controlled(target=10)
+    for _ in range(6):
+        _commit_step(elasticity, 40)
+    assert elasticity.dt < 0.01 * 0.5
+    shrunk = elasticity.dt
+
+    for _ in range(40):
+        _commit_step(elasticity, 2)
+    assert shrunk < elasticity.dt == 0.01   # grows back, never past the configured step
+
+def test_controller_tunes_omega_from_the_convergence_factor():
+    elasticity = _controlled(omega=1.0)
+    _commit_step(elasticity, 10, deltas=(1.0, 0.9))
+    # Gauss-Seidel factor 0.9 -> mu^2 = 0.9 -> omega_opt = 2 / (1 + sqrt(0.1)); half-step from 1.0
+    assert elasticity.omega == pytest.approx(1.0 + 0.5 * (2.0 / (1.0 + np.sqrt(0.1)) - 1.0))
+    assert elasticity.history[-1]["convergence_factor"] == pytest.approx(0.9)
+
+def test_controller_panic_falls_back_to_gauss_seidel():
+    elasticity = _controlled(omega=1.7)
+    elasticity.apply_panic_mode()
+    assert (elasticity.dt, elasticity.omega, elasticity.max_iter) == (0.005, 1.0, 5000)
+
+    for _ in range(elasticity.cooldown_limit):
+        _commit_step(elasticity, 10)
+    assert not elasticity.is_in_panic and elasticity.max_iter == 100
+
+def test_controller_history_export(tmp_path):
+    elasticity = _controlled()
+    _commit_step(elasticity, 7, deltas=(0.5, 0.25))
+    elasticity.export_history(tmp_path / "out" / "controller_history.json")
+
+    exported = json.loads((tmp_path / "out" / "controller_history.json").read_text())
+    assert exported["target_iterations"] == 10
+    assert [(s["ppe_iterations"], s["dt"]) for s in exported["steps"]] == [(7, 0.01)]
+
+def _ring_manager(depth):
+    config = SimpleNamespace(dt_min_limit=1e-6, ppe_omega=1.5, ppe_max_iter=100, divergence_threshold=1e3,
+                             checkpoint_depth=depth)
+    data = np.random.default_rng(1).uniform(-1.0, 1.0, size=(20, FI.num_fields()))
+    data[:, [FI.VX_STAR, FI.VY_STAR, FI.VZ_STAR, FI.P_NEXT]] = data[:, [FI.VX, FI.VY, FI.VZ, FI.P]]
+    return ElasticManager(config, 0.01), SimpleNamespace(fields=SimpleNamespace(data=data), iteration=0, time=0.0)
+
+def _commit_random(state, seed):
+    data = state.fields.data
+    fresh = np.random.default_rng(seed).uniform(-1.0, 1.0, size=(data.shape[0], 4))
+    data[:, [FI.VX, FI.VY, FI.VZ, FI.P]] = fresh
+    data[:, [FI.VX_STAR, FI.VY_STAR, FI.VZ_STAR, FI.P_NEXT]] = fresh
+    state.iteration += 1
+    state.time += 0.01
+
+def test_rollback_restores_the_last_committed_foundation():
+    elasticity, state = _ring_manager(depth=2)
+    elasticity.checkpoint(state)
+    _commit_random(state, 2)
+    elasticity.checkpoint(state)
+    committed = state.fields.data.copy()
+
+    # A failed attempt leaves garbage in the trial columns (and ghost writes in committed ones)
+    state.fields.data[:, [FI.VX_STAR, FI.P_NEXT, FI.VY]] = np.nan
+    elasticity.rollback(state)
+
+    np.testing.assert_array_equal(state.fields.data, committed)
+    assert (state.iteration, state.time) == (1, 0.01)
+    assert elasticity.checkpoint_nbytes == 2 * 20 * 4 * 8 + 2 * 2 * 8
+
+def test_rollback_further_back_through_the_ring():
+    elasticity, state = _ring_manager(depth=3)
+    snapshots = []
+    for seed in range(5):
+        _commit_random(state, seed)
+        elasticity.checkpoint(state)
+        snapshots.append(state.fields.data.copy())
+
+    elasticity.rollback(state, steps_back=2)
+    np.testing.assert_array_equal(state.fields.data, snapshots[2])
+    assert state.iteration == 3
+    # Newer checkpoints are gone; only the slot rolled back to remains
+    with pytest.raises(ValueError):
+        elasticity.rollback(state, steps_back=1)
+
+def test_checkpoint_ring_is_off_by_default():
+    elasticity, state = _manager_and_state()
+    elasticity.checkpoint(state)
+    assert elasticity.checkpoint_nbytes == 0
+    with pytest.raises(ValueError):
+        elasticity.rollback(state)
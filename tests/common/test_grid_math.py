@@ -3,7 +3,12 @@
 import numpy as np
 import pytest
 
-from src.common.grid_math import get_coords_from_index, get_flat_index
+from src.common.grid_math import (
+    get_coords_from_index,
+    get_flat_index,
+    get_padded_view,
+    is_mask_valued,
+)
 
 # Base configuration for standard tests
 NX, NY, NZ = 4, 4, 4
@@ -82,4 +87,41 @@ def test_exhaustive_range():
     total_cells = NX * NY * NZ
     for idx in range(total_cells):
         i, j, k = get_coords_from_index(idx, NX, NY)
-        assert get_flat_index(i, j, k, NX, NY) == idx
\ No newline at end of file
+        assert get_flat_index(i, j, k, NX, NY) == idx
+def test_padded_view_matches_flat_index():
+    """The [i, j, k, field] view must address the same memory as get_flat_index."""
+    nx_buf, ny_buf, nz_buf, n_fields = 5, 4, 3, 2
+    foundation = np.zeros((nx_buf * ny_buf * nz_buf, n_fields))
+    view = get_padded_view(foundation, nx_buf, ny_buf, nz_buf)
+
+    assert view.shape == (nx_buf, ny_buf, nz_buf, n_fields)
+    assert np.shares_memory(view, foundation)
+
+    view[3, 2, 1, 1] = 7.0
+    assert foundation[get_flat_index(3, 2, 1, nx_buf, ny_buf), 1] == 7.0
+
+def test_padded_view_keeps_leading_axes():
+    """A batch of Foundations maps to [case, i, j, k, field] with the same per-case layout."""
+    n_cells = BUF_NX * BUF_NY * BUF_NZ
+    batch = np.arange(2 * n_cells * 3, dtype=float).reshape(2, n_cells, 3)
+    padded = get_padded_view(batch, BUF_NX, BUF_NY, BUF_NZ)
+
+    assert padded.shape == (2, BUF_NX, BUF_NY, BUF_NZ, 3)
+    assert np.shares_memory(padded, batch)
+    np.testing.assert_array_equal(padded[1], get_padded_view(batch[1], BUF_NX, BUF_NY, BUF_NZ))
+
+@pytest.mark.parametrize("values, expected", [
+    ([-1, 0, 1, 1], True),
+    ([], True),
+    ([True, False], True),
+    ([1.0, -1.0, 0.0], True),
+    ([1, 2], False),
+    ([-2, 0], False),
+    ([0.5, 1.0], False),
+    ([np.nan], False),
+    ([1, None], False),
+    (["1", "0"], False),
+])
+def test_is_mask_valued_matches_set_membership(values, expected):
+    assert is_mask_valued(np.asarray(values)) is expected
+    assert expected == all(value in {-1, 0, 1} for value in values)
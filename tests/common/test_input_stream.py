@@ -0,0 +1,77 @@
+# tests/common/test_input_stream.py
+
+import json
+
+import numpy as np
+import pytest
+
+from src.common import input_stream
+from src.common.input_stream import load_input_streaming
+from src.common.solver_input import SolverInput
+from tests.helpers.solver_input_schema_dummy import get_explicit_solver_config
+
+NX, NY, NZ = 5, 4, 3
+
+
+@pytest.fixture
+def case():
+    data = get_explicit_solver_config(NX, NY, NZ)
+    data["mask"] = np.random.default_rng(0).choice([-1, 0, 1], size=NX * NY * NZ).tolist()
+    return data
+
+def _write(tmp_path, text):
+    path = tmp_path / "input.json"
+    path.write_text(text)
+    return path
+
+@pytest.mark.parametrize("chunk_size", [7, 64, 1 << 20])
+@pytest.mark.parametrize("indent", [None, 2])
+@pytest.mark.parametrize("mask_first", [False, True])
+def test_streaming_matches_json_load(tmp_path, monkeypatch, case, chunk_size, indent, mask_first):
+    # Tiny chunks split numbers, keys and separators across reads
+    monkeypatch.setattr(input_stream, "CHUNK_SIZE", chunk_size)
+    if mask_first:
+        case = {"mask": case.pop("mask"), **case}
+    path = _write(tmp_path, json.dumps(case, indent=indent))
+
+    data = load_input_streaming(path)
+
+    assert data["mask"].dtype == np.int8
+    np.testing.assert_array_equal(data["mask"], case["mask"])
+    assert {k: v for k, v in data.items() if k != "mask"} == {k: v for k, v in case.items() if k != "mask"}
+    # The streamed array feeds the usual containers and the schema view stays JSON
+    np.testing.assert_array_equal(SolverInput.from_dict(data).mask.array, case["mask"])
+
+def test_numbers_split_across_chunk_boundaries(tmp_path, monkeypatch, case):
+    """Every chunk size cuts some number after its integer digits, sign or exponent marker."""
+    # Top-level scalars: nested ones are decoded with their (then incomplete) parent object
+    text = json.dumps({"density": 1.5, **case, "viscosity": -2.25e3, "steps": 12345})
+    text = text.replace("1.5", "1.5e0").replace("-2250.0", "-2.25E+3")
+    path = _write(tmp_path, text)
+    expected = json.loads(text)
+
+    for chunk_size in range(1, 48):
+        monkeypatch.setattr(input_stream, "CHUNK_SIZE", chunk_size)
+        data = load_input_streaming(path)
+        assert {k: v for k, v in data.items() if k != "mask"} == \
+            {k: v for k, v in expected.items() if k != "mask"}, chunk_size
+
+def test_float_spelled_and_empty_masks(tmp_path, case):
+    case["mask"] = [1.0, 0.0, -1.0]
+    assert load_input_streaming(_write(tmp_path, json.dumps(case)))["mask"].tolist() == [1, 0, -1]
+    case["mask"] = []
+    assert load_input_streaming(_write(tmp_path, json.dumps(case)))["mask"].size == 0
+
+def test_non_inline_masks_decode_as_json(tmp_path, case):
+    case["mask"] = {"encoding": "rle", "values": [1], "counts": [NX * NY * NZ]}
+    assert load_input_streaming(_write(tmp_path, json.dumps(case)))["mask"] == case["mask"]
+
+@pytest.mark.parametrize("mask_text", ["[1, 2, 0]", "[1, 0.5]", "[1, , 0]", "[1, 0,]", "[1, true]", "[1, 0"])
+def test_malformed_masks_raise(tmp_path, mask_text):
+    with pytest.raises(ValueError):
+        load_input_streaming(_write(tmp_path, f'{{"grid": {{}}, "mask": {mask_text}}}'))
+
+@pytest.mark.parametrize("text", ['{"a": 1', '{"a" 1}', '{"a": 1} {}', '[1, 2]'])
+def test_malformed_documents_raise(tmp_path, text):
+    with pytest.raises(ValueError):
+        load_input_streaming(_write(tmp_path, text))
@@ -0,0 +1,81 @@
+# tests/common/test_mask_io.py
+
+import h5py
+import jsonschema
+import numpy as np
+import pytest
+
+from src.common.mask_io import decode_mask, encode_rle
+from src.common.simulation_context import SimulationContext
+from src.common.solver_input import SolverInput
+from src.main_solver import assemble_simulation, load_input_schema
+from tests.helpers.solver_input_schema_dummy import get_explicit_solver_config
+
+NX, NY, NZ = 5, 4, 3
+CONFIG = {
+    "dt_min_limit": 1e-4, "ppe_tolerance": 1e-8, "ppe_atol": 1e-10, "ppe_max_iter": 10,
+    "ppe_omega": 1.4, "divergence_threshold": 1e6, "ppe_solver": "sor",
+}
+
+
+@pytest.fixture
+def flat_mask():
+    return np.random.default_rng(0).choice([-1, 0, 1], size=NX * NY * NZ, p=[0.1, 0.2, 0.7]).astype(np.int8)
+
+def _specs(tmp_path, flat_mask):
+    """The same mask in every schema form."""
+    np.save(tmp_path / "flat.npy", flat_mask)
+    # [i, j, k] array saved in C order: flattening it back needs an explicit Fortran read
+    np.save(tmp_path / "ijk.npy", np.ascontiguousarray(flat_mask.reshape((NX, NY, NZ), order="F")))
+    with h5py.File(tmp_path / "mask.h5", "w") as h5f:
+        h5f.create_dataset("mask", data=flat_mask)
+        h5f.create_dataset("packed", data=flat_mask.reshape((NX, NY, NZ), order="F"), compression="gzip")
+    return {
+        "inline": flat_mask.tolist(),
+        "rle": encode_rle(flat_mask),
+        "npy": {"encoding": "file", "path": "flat.npy"},
+        "npy_ijk": {"encoding": "file", "path": "ijk.npy"},
+        "h5": {"encoding": "file", "path": "mask.h5"},
+        "h5_chunked": {"encoding": "file", "path": "mask.h5", "dataset": "packed"},
+    }
+
+def test_every_form_yields_the_same_step1_mask(tmp_path, flat_mask):
+    reference = None
+    for name, spec in _specs(tmp_path, flat_mask).items():
+        case = get_explicit_solver_config(NX, NY, NZ)
+        case["mask"] = spec
+        context = SimulationContext.create(case, dict(CONFIG), base_dir=tmp_path)
+        state, _ = assemble_simulation(context, load_input_schema())
+        mask_3d = state.mask.mask
+        assert mask_3d.dtype == np.int8, name
+        if reference is None:
+            reference = mask_3d.copy()
+        np.testing.assert_array_equal(mask_3d, reference, err_msg=name)
+
+def test_file_masks_are_memory_mapped(tmp_path, flat_mask):
+    specs = _specs(tmp_path, flat_mask)
+    for name in ("npy", "h5"):
+        spec = dict(specs[name], path=str(tmp_path / specs[name]["path"]))
+        assert isinstance(decode_mask(spec), np.memmap), name
+
+def test_rle_round_trip_and_schema(flat_mask):
+    spec = encode_rle(flat_mask)
+    assert sum(spec["counts"]) == flat_mask.size
+    np.testing.assert_array_equal(decode_mask(spec), flat_mask)
+    jsonschema.validate(instance=spec, schema=load_input_schema()["properties"]["mask"])
+
+@pytest.mark.parametrize("spec, error", [
+    ({"encoding": "rle", "values": [1, 0], "counts": [3]}, ValueError),
+    ({"encoding": "rle", "values": [1, 2], "counts": [3, 1]}, ValueError),
+    # Out-of-range values that an int8 cast would turn into valid ones
+    ({"encoding": "rle", "values": [255, 1], "counts": [3, 1]}, ValueError),
+    ({"encoding": "rle", "values": [257, 0], "counts": [3, 1]}, ValueError),
+    ({"encoding": "rle", "values": [1.7, 0], "counts": [3, 1]}, ValueError),
+    ({"encoding": "file", "path": "absent.npy"}, FileNotFoundError),
+    ({"encoding": "zip", "path": "mask.zip"}, ValueError),
+])
+def test_invalid_mask_specs_are_rejected(spec, error):
+    data = get_explicit_solver_config(NX, NY, NZ)
+    data["mask"] = spec
+    with pytest.raises(error):
+        SolverInput.from_dict(data)
@@ -0,0 +1,77 @@
+# tests/common/test_schema_validation.py
+
+import jsonschema
+import numpy as np
+import pytest
+
+from src.common.schema_validation import compile_schema, schema_validator
+from src.common.simulation_context import SimulationContext
+from src.common.solver_state import MaskManager
+from src.main_solver import (
+    BASE_DIR,
+    SCHEMA_FILE,
+    assemble_simulation,
+    load_input_schema,
+)
+from tests.helpers.solver_input_schema_dummy import get_explicit_solver_config
+
+NX, NY, NZ = 4, 3, 2
+CONFIG = {
+    "dt_min_limit": 1e-4, "ppe_tolerance": 1e-8, "ppe_atol": 1e-10, "ppe_max_iter": 10,
+    "ppe_omega": 1.4, "divergence_threshold": 1e6, "ppe_solver": "sor",
+}
+
+
+def _verdict(validate, instance):
+    try:
+        validate(instance)
+    except jsonschema.exceptions.ValidationError as e:
+        return e.validator
+    return None
+
+def test_schema_is_compiled_once():
+    assert compile_schema(load_input_schema()) is compile_schema(load_input_schema())
+    assert schema_validator(str(BASE_DIR / SCHEMA_FILE)) is compile_schema(load_input_schema())
+    assert {("mask",), ("initial_conditions", "velocity"), ("external_forces", "force_vector")} \
+        <= set(compile_schema(load_input_schema()).slots)
+
+@pytest.mark.parametrize("section, key, value, expected", [
+    ("mask", None, [1, 0, -1] * 8, None),
+    ("mask", None, [1.0, 0.0, -1.0] * 8, None),
+    ("mask", None, [1, 2, 0] * 8, "enum"),
+    ("mask", None, [1, 0.5, 0] * 8, "oneOf"),
+    ("mask", None, [], None),
+    ("initial_conditions", "velocity", [0.0, 1.0, 2.5], None),
+    ("initial_conditions", "velocity", [0.0, 1.0], "minItems"),
+    ("external_forces", "force_vector", [0, 0, 0, 0], "maxItems"),
+])
+def test_arrays_get_the_same_verdict_as_lists(section, key, value, expected):
+    validator = compile_schema(load_input_schema())
+    verdicts = []
+    for payload in (value, np.asarray(value)):
+        case = get_explicit_solver_config(NX, NY, NZ)
+        if key is None:
+            case[section] = payload
+        else:
+            case[section] = dict(case[section], **{key: payload})
+        verdicts.append(_verdict(validator.validate, case))
+        if isinstance(payload, list):
+            # Lists report exactly what a plain jsonschema pass reports
+            assert verdicts[0] == _verdict(lambda inst: jsonschema.validate(inst, load_input_schema()), case)
+    assert verdicts[0] == expected
+    assert (verdicts[1] is None) == (expected is None)
+
+def test_multidimensional_array_is_rejected():
+    case = get_explicit_solver_config(NX, NY, NZ)
+    case["mask"] = np.ones((NX, NY, NZ), dtype=np.int8)
+    assert _verdict(compile_schema(load_input_schema()).validate, case) == "type"
+
+def test_state_firewall_never_lists_the_mask(monkeypatch):
+    def forbidden(self):
+        raise AssertionError("mask serialized to a Python list")
+    monkeypatch.setattr(MaskManager, "to_dict", forbidden)
+
+    case = get_explicit_solver_config(NX, NY, NZ)
+    case["mask"] = np.ones(NX * NY * NZ, dtype=np.int8)
+    state, _ = assemble_simulation(SimulationContext.create(case, dict(CONFIG)), load_input_schema())
+    np.testing.assert_array_equal(state.mask.flat, case["mask"])
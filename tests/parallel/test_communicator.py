@@ -0,0 +1,136 @@
+# tests/parallel/test_communicator.py
+
+import multiprocessing
+import socket
+
+import numpy as np
+import pytest
+
+from src.common.field_schema import FI
+from src.common.simulation_context import SimulationContext
+from src.main_solver import assemble_simulation, load_input_schema
+from src.parallel.communicator import Communicator, SocketCommunicator
+from src.step4.orchestrate_step4 import orchestrate_step4_plan
+from tests.helpers.solver_input_schema_dummy import get_explicit_solver_config
+
+NX_BUF, NY_BUF, NZ = 6, 5, 7
+RANK_CONFIG = {
+    "dt_min_limit": 1e-4, "ppe_tolerance": 1e-8, "ppe_atol": 1e-10, "ppe_max_iter": 10,
+    "ppe_omega": 1.4, "divergence_threshold": 1e6,
+}
+
+
+def _rank_main(rank, addresses, queue):
+    """One rank: local Foundation tagged with global buffer planes, then halo exchange and allreduce."""
+    comm = SocketCommunicator(rank, addresses, timeout=10.0)
+    try:
+        k0, k1 = comm.local_bounds(NZ)
+        nz_buf = k1 - k0 + 2
+        planes = np.arange(nz_buf, dtype=float) + k0
+        planes[[0, -1]] = -1.0
+        data = np.repeat(planes, NX_BUF * NY_BUF)[:, None] * np.ones(FI.num_fields())
+
+        comm.exchange_halos(data, NX_BUF, NY_BUF)
+
+        local_delta = np.nan if rank == 1 else float(rank)
+        queue.put((
+            rank,
+            data.reshape(nz_buf, -1)[:, 0].tolist(),
+            comm.neighbors,
+            comm.physical_faces(),
+            comm.allreduce([rank, -rank], "max").tolist(),
+            comm.allreduce(rank, "min").tolist(),
+            comm.allreduce(local_delta, "max").tolist(),
+        ))
+    finally:
+        comm.close()
+
+def _rank_block_main(rank, addresses, queue):
+    """One rank: assembles its own block, exchanges halos, then applies Step 4."""
+    comm = SocketCommunicator(rank, addresses, timeout=10.0)
+    try:
+        k0, k1 = comm.local_bounds(NZ)
+        case = get_explicit_solver_config(NX_BUF - 2, NY_BUF - 2, k1 - k0)
+        context = SimulationContext.create(case, dict(RANK_CONFIG))
+        state, _ = assemble_simulation(context, load_input_schema(), communicator=comm)
+
+        data = state.fields.data
+        data[:, FI.P] = rank + 1.0
+        comm.exchange_halos(data, NX_BUF, NY_BUF)
+        orchestrate_step4_plan(state)
+
+        plane = NX_BUF * NY_BUF
+        # An interior (i, j) column of the low and high ghost planes
+        column = NX_BUF // 2 + NX_BUF * (NY_BUF // 2)
+        queue.put((
+            rank,
+            [location for location, *_ in state.boundary_plan.faces],
+            data[column, FI.P],
+            data[data.shape[0] - plane + column, FI.P],
+        ))
+    finally:
+        comm.close()
+
+def _run_ranks(addresses, target=_rank_main):
+    context = multiprocessing.get_context("fork")
+    queue = context.Queue()
+    ranks = [context.Process(target=target, args=(r, addresses, queue)) for r in range(len(addresses))]
+    for p in ranks:
+        p.start()
+    results = sorted(queue.get(timeout=30) for _ in ranks)
+    for p in ranks:
+        p.join(timeout=30)
+        assert p.exitcode == 0
+    return results
+
+def _free_tcp_addresses(n):
+    sockets = [socket.socket() for _ in range(n)]
+    for s in sockets:
+        s.bind(("127.0.0.1", 0))
+    addresses = [s.getsockname() for s in sockets]
+    for s in sockets:
+        s.close()
+    return addresses
+
+@pytest.mark.parametrize("transport", ["unix", "tcp"])
+def test_halo_exchange_and_allreduce_across_ranks(transport, tmp_path):
+    size = 3
+    if transport == "unix":
+        addresses = [str(tmp_path / f"rank{r}.sock") for r in range(size)]
+    else:
+        addresses = _free_tcp_addresses(size)
+
+    results = _run_ranks(addresses)
+
+    for rank, planes, neighbors, faces, maxed, minned, delta in results:
+        # Every plane now carries its global buffer index; global z ends stay untouched
+        expected = list(np.arange(len(planes), dtype=float) + planes[1] - 1)
+        if rank == 0:
+            expected[0] = -1.0
+        if rank == size - 1:
+            expected[-1] = -1.0
+        assert planes == expected
+
+        assert neighbors == {"z_min": rank - 1 if rank > 0 else None, "z_max": rank + 1 if rank < size - 1 else None}
+        assert ("z_min" in faces) == (rank == 0)
+        assert ("z_max" in faces) == (rank == size - 1)
+        assert maxed == [size - 1, 0]
+        assert minned == [0]
+        # A NaN on any rank reaches every rank
+        assert np.isnan(delta[0])
+
+def test_rank_blocks_keep_boundary_rules_off_their_halos(tmp_path):
+    """Step 4 on each rank writes the global z faces only; a halo keeps the neighbor's values."""
+    addresses = [str(tmp_path / f"rank{r}.sock") for r in range(2)]
+
+    (_, faces0, low0, high0), (_, faces1, low1, high1) = _run_ranks(addresses, _rank_block_main)
+
+    assert faces0 == ["x_min", "x_max", "y_min", "y_max", "z_min"]
+    assert faces1 == ["x_min", "x_max", "y_min", "y_max", "z_max"]
+    # Halos: the neighbor's P; global faces: the 'pressure' rules of the input (101325, 0)
+    assert (high0, low1) == (2.0, 1.0)
+    assert (low0, high1) == (101325.0, 0.0)
+
+def test_communicator_requires_a_transport():
+    with pytest.raises(TypeError, match="abstract"):
+        Communicator(0, 1)
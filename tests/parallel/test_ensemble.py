@@ -0,0 +1,135 @@
+# tests/parallel/test_ensemble.py
+
+import json
+
+import numpy as np
+import pytest
+
+from src.common.field_schema import FI
+from src.common.simulation_context import SimulationContext
+from src.main_solver import assemble_simulation, execute_time_loop, load_input_schema
+from src.parallel.ensemble import EnsembleSolver, allocate_batch
+from tests.helpers.solver_input_schema_dummy import get_explicit_solver_config
+
+CONFIG = {
+    "dt_min_limit": 1e-4,
+    "ppe_tolerance": 1e-8,
+    "ppe_atol": 1e-10,
+    "ppe_max_iter": 300,
+    "ppe_omega": 1.4,
+    "divergence_threshold": 1e6,
+    "ppe_solver": "sor",
+}
+N = 5
+
+
+def _case_input(viscosity, inflow, time_step):
+    case = get_explicit_solver_config(N, N, N)
+    # One solid cell keeps the serial run on the SOR backend (no spectral shortcut)
+    case["mask"][N * N * 2 + N * 2 + 2] = 0
+    case["fluid_properties"]["viscosity"] = viscosity
+    case["boundary_conditions"][0]["values"]["u"] = inflow
+    case["simulation_parameters"].update(time_step=time_step, total_time=0.003, output_interval=100)
+    return case
+
+def _assemble_batch(inputs, configs):
+    batch = allocate_batch(len(inputs), (N + 2) ** 3)
+    contexts = [SimulationContext.create(case, dict(config)) for case, config in zip(inputs, configs, strict=True)]
+    states = [
+        assemble_simulation(context, load_input_schema(), fields_buffer=batch[c])[0]
+        for c, context in enumerate(contexts)
+    ]
+    return batch, states, contexts
+
+def _serial(case, config):
+    context = SimulationContext.create(case, dict(config))
+    state, _ = assemble_simulation(context, load_input_schema())
+    return execute_time_loop(state, context)
+
+def test_ensemble_matches_serial_runs_bit_for_bit():
+    inputs = [_case_input(0.01, 1.0, 0.001), _case_input(0.05, 0.5, 0.001), _case_input(0.02, 2.0, 0.0015)]
+    batch, states, contexts = _assemble_batch(inputs, [CONFIG] * 3)
+
+    errors = EnsembleSolver(batch, states, contexts).run()
+
+    assert errors == [None, None, None]
+    for case, state in zip(inputs, states, strict=True):
+        reference = _serial(case, CONFIG)
+        assert (state.iteration, state.time) == (reference.iteration, reference.time)
+        for field in (FI.VX, FI.VY, FI.VZ, FI.P):
+            np.testing.assert_array_equal(state.fields.data[:, field], reference.fields.data[:, field])
+
+def test_divergent_case_does_not_stall_the_batch():
+    """A case that can never pass its audit panics down to dt_floor alone; the others commit."""
+    inputs = [_case_input(0.01, 1.0, 0.001), _case_input(0.01, 1.0, 0.001)]
+    strict = dict(CONFIG, divergence_threshold=1e-9)
+    batch, states, contexts = _assemble_batch(inputs, [CONFIG, strict])
+
+    solver = EnsembleSolver(batch, states, contexts)
+    errors = solver.run()
+
+    assert errors[0] is None and states[0].iteration == 3
+    assert errors[1].startswith("RuntimeError") and states[1].iteration == 0
+    assert solver.elasticities[1].dt < strict["dt_min_limit"]
+    reference = _serial(inputs[0], CONFIG)
+    np.testing.assert_array_equal(states[0].fields.data[:, FI.P], reference.fields.data[:, FI.P])
+
+def test_iteration_controller_tracks_serial_runs(tmp_path):
+    """The PPE-iteration controller sees the same sweeps and convergence factors in both paths."""
+    controlled = dict(CONFIG, ppe_target_iterations=20)
+    case = _case_input(0.01, 1.0, 0.001)
+    batch, states, contexts = _assemble_batch([case], [controlled])
+    states[0].manifest.output_directory = str(tmp_path / "batched")
+    solver = EnsembleSolver(batch, states, contexts)
+    assert solver.run() == [None]
+
+    context = SimulationContext.create(case, dict(controlled))
+    state, _ = assemble_simulation(context, load_input_schema())
+    state.manifest.output_directory = str(tmp_path / "serial")
+    reference = execute_time_loop(state, context)
+
+    exported = json.loads((tmp_path / "serial" / "controller_history.json").read_text())["steps"]
+    batched = json.loads((tmp_path / "batched" / "controller_history.json").read_text())["steps"]
+    assert len(exported) == len(batched) == reference.iteration == states[0].iteration
+    for key in ("dt", "omega", "ppe_iterations", "convergence_factor"):
+        assert [s[key] for s in batched] == [s[key] for s in exported]
+    assert states[0].time == reference.time
+
+def test_failed_case_rolls_back_to_its_last_commit():
+    inputs = [_case_input(0.01, 1.0, 0.001), _case_input(0.01, 1.0, 0.001)]
+    strict = dict(CONFIG, divergence_threshold=1e-9, checkpoint_depth=1)
+    batch, states, contexts = _assemble_batch(inputs, [CONFIG, strict])
+    initial = batch[1].copy()
+
+    errors = EnsembleSolver(batch, states, contexts).run()
+
+    assert errors[1].startswith("RuntimeError")
+    # Every panic, including the fatal one, restored the assembled Foundation
+    restored = [FI.VX, FI.VY, FI.VZ, FI.P]
+    np.testing.assert_array_equal(batch[1][:, restored], initial[:, restored])
+
+def test_non_sor_backends_are_rejected():
+    """Rule 5: a batch never swaps the backend its serial runs would use."""
+    krylov = dict(CONFIG, ppe_solver="cg", ppe_preconditioner="jacobi")
+    batch, states, contexts = _assemble_batch([_case_input(0.01, 1.0, 0.001)] * 2, [CONFIG, krylov])
+    with pytest.raises(ValueError, match="case 1 resolves to the 'cg'"):
+        EnsembleSolver(batch, states, contexts)
+
+    all_fluid = get_explicit_solver_config(N, N, N)
+    batch, states, contexts = _assemble_batch([all_fluid], [dict(CONFIG, ppe_solver="spectral")])
+    with pytest.raises(ValueError, match="'spectral'"):
+        EnsembleSolver(batch, states, contexts)
+
+def test_all_fluid_cases_run_sor_and_match_the_spectral_serial_run():
+    """No spectral shortcut in a batch: SOR converges to the same pressure and velocity."""
+    case = _case_input(0.01, 1.0, 0.001)
+    case["mask"] = [1] * N**3
+    batch, states, contexts = _assemble_batch([case, case], [CONFIG, CONFIG])
+
+    assert EnsembleSolver(batch, states, contexts).run() == [None, None]
+
+    reference = _serial(case, CONFIG)
+    for state in states:
+        assert (state.iteration, state.time) == (reference.iteration, reference.time)
+        for field in (FI.VX, FI.VY, FI.VZ, FI.P):
+            np.testing.assert_allclose(state.fields.data[:, field], reference.fields.data[:, field], rtol=1e-8)
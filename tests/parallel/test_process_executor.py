@@ -0,0 +1,172 @@
+# tests/parallel/test_process_executor.py
+
+import multiprocessing
+from multiprocessing import shared_memory
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+import src.main_solver
+from src.common.elasticity import ElasticManager
+from src.common.field_schema import FI
+from src.common.simulation_context import SimulationContext
+from src.main_solver import assemble_simulation, execute_time_loop, load_input_schema
+from src.parallel.process_executor import ProcessSlabExecutor, share_foundation
+from src.step2.stencil_assembler import assemble_core_block, assemble_red_black_blocks
+from src.step3.corrector import apply_local_velocity_correction
+from src.step3.ppe_solver import compute_local_ppe_rhs, solve_pressure_poisson_sweep
+from src.step3.predictor import compute_local_predictor_step
+from src.step5.io_archivist import SnapshotWriter
+from tests.helpers.solver_input_schema_dummy import get_explicit_solver_config
+from tests.helpers.solver_step1_output_dummy import make_step1_output_dummy
+
+
+def _seeded_state(nx=6, ny=5, nz=7):
+    state = make_step1_output_dummy(nx=nx, ny=ny, nz=nz)
+    rng = np.random.default_rng(3)
+    for f in (FI.VX, FI.VY, FI.VZ, FI.P, FI.P_NEXT):
+        state.fields.data[:, f] = rng.uniform(-1.0, 1.0, state.fields.data.shape[0])
+    return state
+
+def _elasticity():
+    config = SimpleNamespace(dt_min_limit=1e-6, ppe_omega=1.5, ppe_max_iter=100, divergence_threshold=1e12)
+    return ElasticManager(config, 0.01)
+
+@pytest.fixture
+def shared_run():
+    """A seeded state moved into shared memory, with a 3-worker executor."""
+    state = _seeded_state()
+    segment = share_foundation(state)
+    executor = ProcessSlabExecutor(state, 3, segment)
+    yield state, executor
+    executor.shutdown()
+    segment.unlink()
+
+def test_workers_match_serial_bit_for_bit(shared_run):
+    threaded_state, executor = shared_run
+    serial = _seeded_state()
+    dt = serial.simulation_parameters.time_step
+
+    core_block = assemble_core_block(serial)
+    compute_local_predictor_step(core_block)
+    rhs = compute_local_ppe_rhs(core_block)
+    sweep_blocks = assemble_red_black_blocks(serial)
+    deltas = [solve_pressure_poisson_sweep(sweep_blocks, 1.5, rhs) for _ in range(2)]
+    apply_local_velocity_correction(core_block)
+    assert _elasticity().validate_and_commit(serial)
+
+    executor.predict(dt)
+    shared_rhs = executor.ppe_rhs(dt)
+    shared_deltas = [executor.sweep(1.5, shared_rhs) for _ in range(2)]
+    executor.correct(dt)
+    assert executor.validate_and_commit(_elasticity(), threaded_state)
+
+    np.testing.assert_array_equal(shared_rhs, rhs)
+    assert shared_deltas == deltas
+    np.testing.assert_array_equal(threaded_state.fields.data, serial.fields.data)
+
+def test_worker_failures_surface_and_workers_stay_in_step(shared_run):
+    state, executor = shared_run
+    data = state.fields.data
+    dt = state.simulation_parameters.time_step
+
+    # Divergent trial field in one worker's rows: rejected by the cross-worker audit
+    data[-10, FI.P_NEXT] = np.nan
+    before = data.copy()
+    assert executor.validate_and_commit(_elasticity(), state) is False
+    np.testing.assert_array_equal(data, before)
+
+    # Non-finite input in the last slab: the predictor's ArithmeticError reaches the caller
+    data[:, FI.P_NEXT] = 0.0
+    core = assemble_core_block(state)
+    core.center.get_field(FI.VX)[:, :, -1] = np.inf
+    with pytest.raises(ArithmeticError):
+        executor.predict(dt)
+
+    # Panic-mode retry: the same executor runs again once the state is healed
+    core.center.get_field(FI.VX)[:, :, -1] = 0.0
+    executor.predict(dt / 2)
+    assert np.isfinite(core.center.get_field(FI.VX_STAR)).all()
+
+def test_failed_run_releases_workers_and_writer(monkeypatch, tmp_path):
+    """The FATAL dt circuit breaker must not leak worker processes, segments or the writer thread."""
+    released = []
+    for cls, method in ((ProcessSlabExecutor, "shutdown"), (SnapshotWriter, "close")):
+        original = getattr(cls, method)
+        def tracked(self, _original=original, _name=method):
+            released.append(_name)
+            return _original(self)
+        monkeypatch.setattr(cls, method, tracked)
+
+    config = {"dt_min_limit": 1e-3, "ppe_tolerance": 1e-8, "ppe_atol": 1e-10, "ppe_max_iter": 10,
+              "ppe_omega": 1.4, "divergence_threshold": 1e-12, "num_processes": 2, "snapshot_queue_depth": 1}
+    case = get_explicit_solver_config(4, 4, 4)
+    case["mask"][21] = 0
+    context = SimulationContext.create(case, config)
+    state, foundation = assemble_simulation(context, load_input_schema())
+    state.manifest.output_directory = str(tmp_path)
+
+    with pytest.raises(RuntimeError, match="FATAL"):
+        execute_time_loop(state, context, foundation)
+    assert released == ["shutdown", "close"]
+    assert not any(p.name.startswith("Process") for p in multiprocessing.active_children())
+    _assert_unlinked(foundation)
+
+PROCESS_CONFIG = {"dt_min_limit": 1e-4, "ppe_tolerance": 1e-8, "ppe_atol": 1e-10, "ppe_max_iter": 10,
+                  "ppe_omega": 1.4, "divergence_threshold": 1e6, "num_processes": 2}
+
+def _assert_unlinked(segment):
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=segment.name)
+
+def _tracked_segments(monkeypatch):
+    segments = []
+    def tracked(state):
+        segments.append(share_foundation(state))
+        return segments[-1]
+    monkeypatch.setattr(src.main_solver, "share_foundation", tracked)
+    return segments
+
+def test_failed_assembly_unlinks_the_shared_foundation(monkeypatch):
+    segments = _tracked_segments(monkeypatch)
+    def broken(*args, **kwargs):
+        raise RuntimeError("step 2 failed")
+    monkeypatch.setattr(src.main_solver, "orchestrate_step2", broken)
+
+    context = SimulationContext.create(get_explicit_solver_config(4, 4, 4), dict(PROCESS_CONFIG))
+    with pytest.raises(RuntimeError, match="step 2 failed"):
+        assemble_simulation(context, load_input_schema())
+    _assert_unlinked(segments[0])
+
+def test_writer_start_failure_stops_the_workers(monkeypatch, tmp_path):
+    def broken(*args, **kwargs):
+        raise OSError("no writer thread")
+    monkeypatch.setattr(src.main_solver, "SnapshotWriter", broken)
+
+    case = get_explicit_solver_config(4, 4, 4)
+    case["mask"][21] = 0
+    context = SimulationContext.create(case, dict(PROCESS_CONFIG, snapshot_queue_depth=1))
+    state, foundation = assemble_simulation(context, load_input_schema())
+    state.manifest.output_directory = str(tmp_path)
+
+    with pytest.raises(OSError, match="no writer thread"):
+        execute_time_loop(state, context, foundation)
+    assert not any(p.name.startswith("Process") for p in multiprocessing.active_children())
+    _assert_unlinked(foundation)
+
+def test_completed_run_closes_the_shared_foundation(tmp_path):
+    case = get_explicit_solver_config(4, 4, 4)
+    case["mask"][21] = 0
+    case["simulation_parameters"].update(time_step=0.001, total_time=0.002, output_interval=100)
+    context = SimulationContext.create(case, dict(PROCESS_CONFIG))
+    state, foundation = assemble_simulation(context, load_input_schema())
+    state.manifest.output_directory = str(tmp_path)
+
+    state = execute_time_loop(state, context, foundation)
+
+    assert foundation.buf is None
+    _assert_unlinked(foundation)
+    # The Foundation now lives in private memory, with the stencil matrix over it
+    assert state.iteration == 2 and np.isfinite(state.fields.data).all()
+    assert state.stencil_matrix[0].center.fields_buffer is state.fields.data
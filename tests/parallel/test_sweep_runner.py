@@ -0,0 +1,121 @@
+# tests/parallel/test_sweep_runner.py
+
+import json
+
+import h5py
+import numpy as np
+import pytest
+
+from src.common.simulation_context import SimulationContext
+from src.main_solver import assemble_simulation, execute_time_loop, load_input_schema
+from src.sweep_runner import (
+    expand_parameter_grid,
+    load_cases_jsonl,
+    run_sweep,
+    topology_key,
+)
+from tests.helpers.solver_input_schema_dummy import get_explicit_solver_config
+
+CONFIG = {
+    "dt_min_limit": 1e-6,
+    "ppe_tolerance": 1e-6,
+    "ppe_atol": 1e-10,
+    "ppe_max_iter": 200,
+    "ppe_omega": 1.1,
+    "divergence_threshold": 1e6,
+    "ppe_solver": "cg",
+    "ppe_preconditioner": "jacobi",
+}
+SOR_CONFIG = {key: value for key, value in CONFIG.items() if key != "ppe_preconditioner"} | {"ppe_solver": "sor"}
+
+
+def _base_input(n=4):
+    base = get_explicit_solver_config(n, n, n)
+    base["simulation_parameters"].update(time_step=0.001, total_time=0.002, output_interval=1)
+    return base
+
+def test_parameter_grid_expands_cartesian_product():
+    base = _base_input()
+    cases = expand_parameter_grid(base, {
+        "fluid_properties.viscosity": [0.01, 0.02],
+        "boundary_conditions.0.values.u": [0.5, 1.0, 1.5],
+    })
+
+    assert len(cases) == 6
+    parameters, case_input = cases[1]
+    assert parameters == {"fluid_properties.viscosity": 0.01, "boundary_conditions.0.values.u": 1.0}
+    assert case_input["boundary_conditions"][0]["values"]["u"] == 1.0
+    # Copies only: the base input is untouched
+    assert base["boundary_conditions"][0]["values"]["u"] == 1.0
+    assert base["fluid_properties"]["viscosity"] == 0.001
+    assert len({topology_key(c) for _, c in cases}) == 1
+
+    with pytest.raises(ValueError, match="does not address"):
+        expand_parameter_grid(base, {"fluid_properties.viscosty": [0.1]})
+    with pytest.raises(ValueError, match="non-empty list"):
+        expand_parameter_grid(base, {"fluid_properties.viscosity": []})
+
+def test_sweep_runs_cases_in_own_directories(tmp_path):
+    base = _base_input()
+    cases = expand_parameter_grid(base, {"fluid_properties.viscosity": [0.01, 0.05]})
+    broken = json.loads(json.dumps(base))
+    broken["mask"] = [1] * 3
+    cases.append(({}, broken))
+
+    summary = run_sweep(cases, tmp_path, workers=2, config_dict=dict(CONFIG))
+
+    assert (summary["n_cases"], summary["n_completed"], summary["n_failed"]) == (3, 2, 1)
+    assert summary["shared_topologies"] == 1
+    assert json.loads((tmp_path / "sweep_summary.json").read_text())["n_cases"] == 3
+    failed = summary["cases"][2]
+    assert failed["status"] == "failed" and "ValueError" in failed["error"]
+
+    # Each case matches a stand-alone run of the same input
+    record = summary["cases"][1]
+    assert record["parameters"] == {"fluid_properties.viscosity": 0.05}
+    assert record["iterations"] == 2
+    assert all(path.startswith(str(tmp_path / "case_0001")) for path in record["snapshots"])
+
+    context = SimulationContext.create(cases[1][1], dict(CONFIG))
+    state, _ = assemble_simulation(context, load_input_schema())
+    state.manifest.output_directory = str(tmp_path / "reference")
+    execute_time_loop(state, context)
+    with h5py.File(record["snapshots"][-1]) as swept, h5py.File(state.manifest.saved_snapshots[-1]) as alone:
+        for name in ("vx", "vy", "vz", "p"):
+            np.testing.assert_array_equal(swept[name][...], alone[name][...])
+
+def test_jsonl_cases(tmp_path):
+    path = tmp_path / "cases.jsonl"
+    path.write_text(json.dumps(_base_input()) + "\n\n" + json.dumps(_base_input(3)) + "\n")
+
+    cases = load_cases_jsonl(path)
+    assert [c["grid"]["nx"] for _, c in cases] == [4, 3]
+    assert topology_key(cases[0][1]) != topology_key(cases[1][1])
+
+def _masked_input(n=4):
+    """A solid cell keeps the serial run on the SOR backend (no spectral shortcut)."""
+    base = _base_input(n)
+    base["mask"][n * n + n + 1] = 0
+    return base
+
+def test_batched_sweep_groups_cases_by_topology(tmp_path):
+    cases = expand_parameter_grid(_masked_input(), {"fluid_properties.viscosity": [0.01, 0.02, 0.05]})
+    cases += expand_parameter_grid(_masked_input(3), {"fluid_properties.viscosity": [0.01]})
+    broken = _masked_input()
+    broken["fluid_properties"]["density"] = "heavy"
+    cases.append(({}, broken))
+    # All-fluid: batched with SOR, not its serial run's spectral shortcut
+    cases += expand_parameter_grid(_base_input(3), {"fluid_properties.viscosity": [0.01, 0.02]})
+
+    summary = run_sweep(cases, tmp_path, workers=2, config_dict=SOR_CONFIG, batch_size=2)
+
+    assert summary["batch_size"] == 2
+    assert [record["case_id"] for record in summary["cases"]] == [f"case_{n:04d}" for n in range(7)]
+    assert [record["status"] for record in summary["cases"]] == ["completed"] * 4 + ["failed"] + ["completed"] * 2
+    assert all(record["iterations"] == 2 for n, record in enumerate(summary["cases"]) if n != 4)
+    assert (tmp_path / "case_0003" / "snapshot_0002.h5").exists()
+    assert (tmp_path / "case_0006" / "snapshot_0002.h5").exists()
+
+def test_batched_sweep_rejects_other_ppe_backends(tmp_path):
+    with pytest.raises(ValueError, match="ppe_solver 'cg'"):
+        run_sweep([({}, _masked_input())], tmp_path, workers=1, config_dict=dict(CONFIG), batch_size=2)
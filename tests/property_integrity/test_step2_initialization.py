@@ -1,5 +1,7 @@
 # tests/property_integrity/test_step2_initialization.py
 
+from collections.abc import Sequence
+
 import pytest
 
 from src.step2.orchestrate_step2 import orchestrate_step2
@@ -24,7 +26,7 @@ class TestStep2Initialization:
     def test_stencil_matrix_existence(self, assembled_state):
         """Rule 9: Verifies that the matrix was successfully assigned."""
         assert assembled_state.stencil_matrix is not None
-        assert isinstance(assembled_state.stencil_matrix, list)
+        assert isinstance(assembled_state.stencil_matrix, Sequence)
         assert len(assembled_state.stencil_matrix) > 0
 
     def test_readiness_sentinel_activation(self, assembled_state):
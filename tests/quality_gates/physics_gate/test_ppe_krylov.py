@@ -0,0 +1,61 @@
+# tests/quality_gates/physics_gate/test_ppe_krylov.py
+
+import numpy as np
+import pytest
+
+from src.common.field_schema import FI
+from src.common.solver_config import SolverConfig
+from src.step2.stencil_assembler import assemble_core_block, assemble_red_black_blocks
+from src.step3.ppe_krylov import solve_pressure_poisson_pcg
+from src.step3.ppe_solver import compute_local_ppe_rhs, solve_pressure_poisson_sor
+from tests.helpers.solver_step1_output_dummy import make_step1_output_dummy
+
+
+def setup_ppe_problem(nx=12, ny=10, nz=8, seed=3):
+    """Random v*, p^n and ghost P_NEXT over a non-cubic grid; returns (state, core_block, rhs)."""
+    state = make_step1_output_dummy(nx=nx, ny=ny, nz=nz)
+    core_block = assemble_core_block(state)
+
+    rng = np.random.default_rng(seed)
+    data = state.fields.data
+    for field_id in (FI.VX_STAR, FI.VY_STAR, FI.VZ_STAR, FI.P, FI.P_NEXT):
+        data[:, field_id] = rng.uniform(-1.0, 1.0, data.shape[0])
+
+    return state, core_block, compute_local_ppe_rhs(core_block)
+
+@pytest.mark.parametrize("preconditioner", ["jacobi", "ssor"])
+def test_pcg_matches_sor_solution_in_fewer_iterations(preconditioner):
+    """PCG must converge to the SOR fixed point (ghost P_NEXT held fixed) in far fewer iterations."""
+    state, core_block, rhs = setup_ppe_problem()
+    data = state.fields.data
+    p_next_initial = data[:, FI.P_NEXT].copy()
+
+    sor_sweeps, _ = solve_pressure_poisson_sor(assemble_red_black_blocks(state), rhs, 1.1, 1e-9, 100000)
+    expected = data[:, FI.P_NEXT].copy()
+
+    data[:, FI.P_NEXT] = p_next_initial
+    iterations, residual = solve_pressure_poisson_pcg(core_block, rhs, preconditioner, 1.1, 1e-12, 0.0, 1000)
+
+    scale = np.abs(expected).max()
+    np.testing.assert_allclose(data[:, FI.P_NEXT], expected, rtol=0.0, atol=1e-8 * scale)
+    assert iterations < sor_sweeps / 3
+    assert np.isfinite(residual)
+
+def test_pcg_poisoned_rhs_raises_arithmetic_error():
+    """Rule 7: a non-finite source must trip the Krylov audit."""
+    _, core_block, rhs = setup_ppe_problem()
+    rhs[1, 1, 1] = np.nan
+    with np.errstate(all="ignore"), pytest.raises(ArithmeticError):
+        solve_pressure_poisson_pcg(core_block, rhs, "jacobi", 1.0, 1e-8, 0.0, 50)
+
+def test_pcg_rejects_unknown_preconditioner():
+    """Rule 5: no silent fallback to an unpreconditioned solve."""
+    _, core_block, rhs = setup_ppe_problem()
+    with pytest.raises(ValueError, match="preconditioner"):
+        solve_pressure_poisson_pcg(core_block, rhs, "ilu", 1.0, 1e-8, 0.0, 50)
+
+def test_config_without_ppe_solver_keeps_sor():
+    """Existing config.json files (no 'ppe_solver') keep the baseline SOR backend."""
+    config = SolverConfig(dt=0.01, dt_min_limit=1e-6, ppe_tolerance=1e-6, ppe_atol=1e-10,
+                          ppe_max_iter=100, ppe_omega=1.5, divergence_threshold=1e6)
+    assert config.ppe_solver == "sor"
@@ -1,9 +1,20 @@
 # tests/quality_gates/physics_gate/test_ppe_solver.py
 
+import numpy as np
 import pytest
 
 from src.common.field_schema import FI
-from src.step3.ppe_solver import solve_pressure_poisson_step
+from src.step2.stencil_assembler import (
+    assemble_core_block,
+    assemble_red_black_blocks,
+    assemble_stencil_matrix,
+)
+from src.step3.ppe_solver import (
+    compute_local_ppe_rhs,
+    solve_pressure_poisson_step,
+    solve_pressure_poisson_sweep,
+)
+from tests.helpers.solver_step1_output_dummy import make_step1_output_dummy
 from tests.helpers.solver_step2_output_dummy import make_step2_output_dummy
 
 
@@ -99,4 +110,44 @@ def test_ppe_sor_relaxation():
     
     solve_pressure_poisson_step(block, omega)
     
-    assert block.center.get_field(FI.P_NEXT) == pytest.approx(5.0)
\ No newline at end of file
+    assert block.center.get_field(FI.P_NEXT) == pytest.approx(5.0)
+
+def test_red_black_sweep_matches_cell_by_cell_gauss_seidel():
+    """
+    A vectorized red-black sweep must equal per-cell SOR visiting every 
+    red cell, then every black cell (non-cubic grid to catch axis mix-ups).
+    """
+    state = make_step1_output_dummy(nx=5, ny=4, nz=3)
+    stencil_list = assemble_stencil_matrix(state)
+    core_block = assemble_core_block(state)
+    sweep_blocks = assemble_red_black_blocks(state)
+
+    rng = np.random.default_rng(11)
+    data = state.fields.data
+    for field_id in (FI.VX_STAR, FI.VY_STAR, FI.VZ_STAR, FI.P, FI.P_NEXT):
+        data[:, field_id] = rng.uniform(-1.0, 1.0, data.shape[0])
+    p_next_initial = data[:, FI.P_NEXT].copy()
+
+    ordered = sorted(stencil_list, key=lambda b: (b.center.i + b.center.j + b.center.k) % 2)
+    for _ in range(2):
+        expected_delta = max(solve_pressure_poisson_step(block, 1.5) for block in ordered)
+    expected = data[:, FI.P_NEXT].copy()
+
+    data[:, FI.P_NEXT] = p_next_initial
+    rhs = compute_local_ppe_rhs(core_block)
+    for _ in range(2):
+        max_delta = solve_pressure_poisson_sweep(sweep_blocks, 1.5, rhs)
+
+    np.testing.assert_allclose(data[:, FI.P_NEXT], expected, rtol=1e-12, atol=1e-14)
+    assert max_delta == pytest.approx(expected_delta, rel=1e-12)
+
+def test_red_black_blocks_cover_core_once():
+    """Every core cell belongs to exactly one sub-lattice; degenerate axes are skipped."""
+    state = make_step1_output_dummy(nx=3, ny=2, nz=1)
+    sweep_blocks = assemble_red_black_blocks(state)
+    assert len(sweep_blocks) == 4
+
+    hits = np.zeros((3, 2, 1), dtype=int)
+    for block in sweep_blocks:
+        hits[block.center.core_index] += 1
+    assert np.all(hits == 1)
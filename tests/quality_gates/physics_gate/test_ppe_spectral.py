@@ -0,0 +1,56 @@
+# tests/quality_gates/physics_gate/test_ppe_spectral.py
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from src.common.field_schema import FI
+from src.common.solver_state import MaskManager
+from src.step2.stencil_assembler import assemble_core_block
+from src.step3.ppe_dispatcher import select_ppe_backend
+from src.step3.ppe_krylov import solve_pressure_poisson_pcg
+from src.step3.ppe_solver import compute_local_ppe_rhs
+from src.step3.ppe_spectral import solve_pressure_poisson_spectral
+from tests.helpers.solver_step1_output_dummy import make_step1_output_dummy
+
+
+def test_spectral_matches_cg_solution():
+    """The DST solve must reproduce the iterative solution with non-zero fixed ghosts."""
+    state = make_step1_output_dummy(nx=7, ny=5, nz=6)
+    core_block = assemble_core_block(state)
+
+    rng = np.random.default_rng(9)
+    data = state.fields.data
+    for field_id in (FI.VX_STAR, FI.VY_STAR, FI.VZ_STAR, FI.P, FI.P_NEXT):
+        data[:, field_id] = rng.uniform(-1.0, 1.0, data.shape[0])
+    rhs = compute_local_ppe_rhs(core_block)
+    p_next_initial = data[:, FI.P_NEXT].copy()
+
+    solve_pressure_poisson_pcg(core_block, rhs, "jacobi", 1.0, 1e-13, 0.0, 1000)
+    expected = data[:, FI.P_NEXT].copy()
+
+    data[:, FI.P_NEXT] = p_next_initial
+    iterations, residual = solve_pressure_poisson_spectral(core_block, rhs)
+
+    assert iterations == 1
+    np.testing.assert_allclose(data[:, FI.P_NEXT], expected, rtol=0.0, atol=1e-9 * np.abs(expected).max())
+    assert residual <= 1e-9 * np.linalg.norm(rhs)
+
+def _mask(values):
+    manager = MaskManager()
+    manager.mask = np.array(values).reshape(2, 2, 1)
+    return manager
+
+def test_spectral_auto_selected_only_for_all_fluid_masks():
+    """Any solid (0) or wall (-1) cell keeps the configured iterative backend."""
+    assert select_ppe_backend(SimpleNamespace(ppe_solver="cg"), _mask([1, 1, 1, 1])) == "spectral"
+    assert select_ppe_backend(SimpleNamespace(ppe_solver="cg"), _mask([1, 0, 1, 1])) == "cg"
+    assert select_ppe_backend(SimpleNamespace(ppe_solver="sor"), _mask([1, -1, 1, 1])) == "sor"
+    # Opted out (batched ensemble): the configured backend runs on an all-fluid mask too
+    assert select_ppe_backend(SimpleNamespace(ppe_solver="sor"), _mask([1, 1, 1, 1]), auto_spectral=False) == "sor"
+
+def test_explicit_spectral_on_masked_domain_raises():
+    """Rule 5: no silent fallback when the spectral solver cannot apply."""
+    with pytest.raises(ValueError, match="all-fluid"):
+        select_ppe_backend(SimpleNamespace(ppe_solver="spectral"), _mask([1, 0, 1, 1]))
@@ -1,9 +1,16 @@
 # tests/quality_gates/physics_gate/test_predictor.py
 
+import numpy as np
 import pytest
 
 from src.common.field_schema import FI
+from src.step2.stencil_assembler import (
+    assemble_core_block,
+    assemble_stencil_matrix,
+    assemble_stencil_table,
+)
 from src.step3.predictor import compute_local_predictor_step
+from tests.helpers.solver_step1_output_dummy import make_step1_output_dummy
 from tests.helpers.solver_step2_output_dummy import make_step2_output_dummy
 
 
@@ -76,4 +83,58 @@ def test_predictor_3d_logic_verification():
     # V* = 1.0 + 1.0 * [ (1*0.0) - (1*1.0) - 1.0 ] = -1.0
     
     obtained = block.center.get_field(FI.VX_STAR)
-    assert obtained == pytest.approx(-1.0), f"Expected -1.0, got {obtained}"
\ No newline at end of file
+    assert obtained == pytest.approx(-1.0), f"Expected -1.0, got {obtained}"
+
+def test_core_view_block_matches_per_block_path():
+    """
+    The whole-core CellView block must reproduce the per-StencilBlock 
+    predictor cell for cell (non-cubic grid to catch axis mix-ups).
+    """
+    state = make_step1_output_dummy(nx=5, ny=4, nz=3)
+    stencil_list = assemble_stencil_matrix(state)
+    core_block = assemble_core_block(state)
+
+    rng = np.random.default_rng(7)
+    data = state.fields.data
+    for field_id in (FI.VX, FI.VY, FI.VZ, FI.P):
+        data[:, field_id] = rng.uniform(-1.0, 1.0, data.shape[0])
+
+    for block in stencil_list:
+        compute_local_predictor_step(block)
+    expected = data[:, [FI.VX_STAR, FI.VY_STAR, FI.VZ_STAR]].copy()
+
+    data[:, [FI.VX_STAR, FI.VY_STAR, FI.VZ_STAR]] = 0.0
+    compute_local_predictor_step(core_block)
+
+    np.testing.assert_allclose(data[:, [FI.VX_STAR, FI.VY_STAR, FI.VZ_STAR]], expected, rtol=1e-12, atol=1e-15)
+
+def test_stencil_table_block_matches_per_block_path():
+    """The gather/scatter table block must drive the predictor kernels unchanged."""
+    state = make_step1_output_dummy(nx=4, ny=3, nz=5)
+    stencil_list = assemble_stencil_matrix(state)
+    table_block = assemble_stencil_table(state).as_block(state.fields.data)
+
+    rng = np.random.default_rng(13)
+    data = state.fields.data
+    for field_id in (FI.VX, FI.VY, FI.VZ, FI.P):
+        data[:, field_id] = rng.uniform(-1.0, 1.0, data.shape[0])
+
+    for block in stencil_list:
+        compute_local_predictor_step(block)
+    expected = data[:, [FI.VX_STAR, FI.VY_STAR, FI.VZ_STAR]].copy()
+
+    data[:, [FI.VX_STAR, FI.VY_STAR, FI.VZ_STAR]] = 0.0
+    compute_local_predictor_step(table_block)
+
+    np.testing.assert_allclose(data[:, [FI.VX_STAR, FI.VY_STAR, FI.VZ_STAR]], expected, rtol=1e-12, atol=1e-15)
+
+def test_core_view_block_audit_raises_arithmetic_error():
+    """Rule 7: a single poisoned cell must still trip the vectorized audit."""
+    state = make_step1_output_dummy(nx=3, ny=3, nz=3)
+    assemble_stencil_matrix(state)
+    core_block = assemble_core_block(state)
+
+    # Buffer cell (2, 2, 2) of the 5x5x5 padded grid is the core center
+    state.fields.data[2 + 5 * 2 + 25 * 2, FI.VX] = np.inf
+    with np.errstate(all="ignore"), pytest.raises(ArithmeticError):
+        compute_local_predictor_step(core_block)
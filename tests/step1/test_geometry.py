@@ -0,0 +1,80 @@
+# tests/step1/test_geometry.py
+
+import jsonschema
+import numpy as np
+import pytest
+
+from src.common.simulation_context import SimulationContext
+from src.common.solver_state import GridManager
+from src.main_solver import assemble_simulation, load_input_schema
+from src.step1.geometry import rasterize_geometry
+from tests.helpers.solver_input_schema_dummy import get_explicit_solver_config
+
+NX, NY, NZ = 12, 10, 8
+PRIMITIVES = [
+    {"type": "half_space", "tag": "wall", "point": [0.0, 0.15, 0.0], "normal": [0.0, 1.0, 0.0]},
+    {"type": "box", "tag": "solid", "min": [0.2, 0.3, 0.1], "max": [0.45, 0.6, 0.5]},
+    {"type": "sphere", "tag": "solid", "center": [0.7, 0.5, 0.5], "radius": 0.2},
+    {"type": "cylinder", "tag": "wall", "center": [0.7, 0.5, 0.5], "axis": "z", "radius": 0.1, "extent": [0.2, 0.8]},
+]
+
+
+def _grid():
+    grid = GridManager()
+    grid.x_min, grid.x_max, grid.y_min, grid.y_max, grid.z_min, grid.z_max = 0.0, 1.2, 0.0, 1.0, 0.0, 0.8
+    grid.nx, grid.ny, grid.nz = NX, NY, NZ
+    return grid
+
+def _inside(p, c):
+    """Per-cell reference predicate on one cell center."""
+    c = np.asarray(c)
+    if p["type"] == "box":
+        return bool(np.all((np.asarray(p["min"]) <= c) & (c <= np.asarray(p["max"]))))
+    if p["type"] == "sphere":
+        return bool(np.sum((c - p["center"]) ** 2) <= p["radius"] ** 2)
+    if p["type"] == "cylinder":
+        axis = "xyz".index(p["axis"])
+        d = np.delete(c - p["center"], axis)
+        lo, hi = p["extent"]
+        return bool(np.sum(d ** 2) <= p["radius"] ** 2 and lo <= c[axis] <= hi)
+    return bool(np.dot(p["normal"], c - np.asarray(p["point"])) <= 0.0)
+
+def test_rasterization_matches_per_cell_evaluation():
+    grid = _grid()
+    mask_3d = rasterize_geometry(PRIMITIVES, grid)
+
+    assert mask_3d.dtype == np.int8 and mask_3d.shape == (NX, NY, NZ)
+    for i, j, k in np.ndindex(NX, NY, NZ):
+        center = ((i + 0.5) * grid.dx, (j + 0.5) * grid.dy, (k + 0.5) * grid.dz)
+        expected = 1
+        for p in PRIMITIVES:
+            if _inside(p, center):
+                expected = 0 if p["tag"] == "solid" else -1
+        assert mask_3d[i, j, k] == expected, (i, j, k)
+    # Every tag is present: later primitives overwrite earlier ones
+    assert set(np.unique(mask_3d)) == {-1, 0, 1}
+
+@pytest.mark.parametrize("primitive, message", [
+    ({"type": "torus", "tag": "solid"}, "unknown type"),
+    ({"type": "sphere", "tag": "fluid", "center": [0, 0, 0], "radius": 1}, "tag must be"),
+    ({"type": "cylinder", "tag": "wall", "center": [0, 0, 0], "axis": "w", "radius": 1}, "axis"),
+])
+def test_invalid_primitives_raise(primitive, message):
+    with pytest.raises(ValueError, match=message):
+        rasterize_geometry([primitive], _grid())
+
+def test_geometry_input_assembles_like_the_explicit_mask():
+    explicit = rasterize_geometry(PRIMITIVES, _grid())
+    config = {"dt_min_limit": 1e-4, "ppe_tolerance": 1e-8, "ppe_atol": 1e-10, "ppe_max_iter": 10,
+              "ppe_omega": 1.4, "divergence_threshold": 1e6, "ppe_solver": "sor"}
+
+    states = []
+    for mask in ({"encoding": "geometry", "geometry": PRIMITIVES}, explicit.flatten(order="F").tolist()):
+        case = get_explicit_solver_config(NX, NY, NZ)
+        case["grid"].update(x_max=1.2, y_max=1.0, z_max=0.8)
+        case["mask"] = mask
+        jsonschema.validate(instance=case, schema=load_input_schema())
+        states.append(assemble_simulation(SimulationContext.create(case, dict(config)), load_input_schema())[0])
+
+    np.testing.assert_array_equal(states[0].mask.mask, explicit)
+    np.testing.assert_array_equal(states[0].fields.data, states[1].fields.data)
@@ -3,7 +3,8 @@
 import numpy as np
 import pytest
 
-from src.common.solver_input import GridInput
+from src.common.grid_math import get_flat_index
+from src.common.solver_input import GridInput, MaskInput
 from src.step1.helpers import generate_3d_masks
 
 
@@ -69,4 +70,27 @@ def test_different_dimensions():
     mask_3d, _, _ = generate_3d_masks(mask_data, grid)
     
     # 4x2x1 grid, last element index 7 should be at (3, 1, 0)
-    assert mask_3d[3, 1, 0] == 8
\ No newline at end of file
+    assert mask_3d[3, 1, 0] == 8
+
+def test_mapping_matches_flat_index_everywhere():
+    """The vectorized reshape places every flat entry at get_flat_index's (i, j, k)."""
+    nx, ny, nz = 5, 3, 4
+    mask_data = np.random.default_rng(0).choice([-1, 0, 1], size=nx * ny * nz).tolist()
+    mask_3d, is_fluid, is_boundary = generate_3d_masks(mask_data, create_test_grid(nx, ny, nz))
+
+    assert mask_3d.dtype == np.int8
+    for i, j, k in np.ndindex(nx, ny, nz):
+        assert mask_3d[i, j, k] == mask_data[get_flat_index(i, j, k, nx, ny)]
+    np.testing.assert_array_equal(is_fluid, mask_3d == 1)
+    np.testing.assert_array_equal(is_boundary, mask_3d == -1)
+
+def test_mask_input_converts_once_to_int8():
+    mask = MaskInput()
+    mask.data = [1, 0, -1, 1.0]
+    assert mask.array.dtype == np.int8 and not mask.array.flags.writeable
+    np.testing.assert_array_equal(mask.array, [1, 0, -1, 1])
+    assert mask.data == [1, 0, -1, 1.0]
+
+    for invalid in ([1, 2], [0.5], [[1, 0]]):
+        with pytest.raises(ValueError, match="Only -1, 0, 1 allowed"):
+            mask.data = invalid
@@ -186,4 +186,25 @@ def test_factory_mask_alignment_drift_simulation():
     # This will be '1' (Fluid) instead of '0' (Obstacle) 
     # because it's looking at the neighbor's mask value!
     assert dangerous_mask_value == 1 
-    print(f"\n[DANGER SIMULATED]: If we shifted the mask index, we'd see {dangerous_mask_value} instead of 0")
\ No newline at end of file
+    print(f"\n[DANGER SIMULATED]: If we shifted the mask index, we'd see {dangerous_mask_value} instead of 0")
+def test_initialize_foundation_matches_per_cell_factory():
+    """The vectorized initializer must write exactly what get_cell writes for every stencil cell."""
+    import numpy as np
+
+    from src.step2.factory import initialize_foundation
+    from src.step2.stencil_assembler import assemble_stencil_matrix
+
+    nx, ny, nz = 4, 3, 2
+    eager = make_step1_output_dummy(nx=nx, ny=ny, nz=nz)
+    eager.initial_conditions.velocity = np.array([1.0, -2.0, 0.5])
+    eager.initial_conditions.pressure = 3.0
+    eager.mask.mask = np.random.default_rng(0).integers(-1, 2, size=(nx, ny, nz))
+    fast = make_step1_output_dummy(nx=nx, ny=ny, nz=nz)
+    fast.initial_conditions.velocity = eager.initial_conditions.velocity
+    fast.initial_conditions.pressure = 3.0
+    fast.mask.mask = eager.mask.mask
+
+    assemble_stencil_matrix(eager)
+    initialize_foundation(fast)
+
+    np.testing.assert_array_equal(fast.fields.data, eager.fields.data)
@@ -1,9 +1,19 @@
 # tests/step2/test_stencil_assembler.py
 
+import copy
+import pickle
+from collections.abc import Sequence
+
 import numpy as np
 import pytest
 
-from src.step2.stencil_assembler import CellRegistry, assemble_stencil_matrix
+from src.common.field_schema import FI
+from src.step2.stencil_assembler import (
+    CellRegistry,
+    assemble_core_block,
+    assemble_stencil_matrix,
+    assemble_stencil_table,
+)
 from tests.helpers.solver_step1_output_dummy import make_step1_output_dummy
 
 
@@ -91,4 +101,99 @@ def test_registry_padding_failure():
     
     # Test upper padding
     with pytest.raises(IndexError):
-        registry.get_or_create(nx + 1, 0, 0, state)
\ No newline at end of file
+        registry.get_or_create(nx + 1, 0, 0, state)
+def test_core_block_views_cover_core_and_ghost_neighbors():
+    nx, ny, nz = 3, 2, 2
+    state = make_step1_output_dummy(nx=nx, ny=ny, nz=nz)
+    matrix_3d = get_matrix_3d(assemble_stencil_matrix(state))
+    core_block = assemble_core_block(state)
+
+    assert core_block.center.get_field(FI.P).shape == (nx, ny, nz)
+    assert list(core_block.center.i) == [0, 1, 2]
+    # The low-i neighbor view starts on the ghost plane
+    assert list(core_block.i_minus.i) == [-1, 0, 1]
+
+    # Writes through the view land on the same memory as the per-cell wiring
+    core_block.center.set_field(FI.P, 4.2)
+    assert matrix_3d[(2, 1, 1)].center.p == 4.2
+
+def test_stencil_table_matches_object_graph():
+    """Every table row must list the same Foundation indices as the StencilBlock it replaces."""
+    state = make_step1_output_dummy(nx=4, ny=3, nz=2)
+    stencil_list = assemble_stencil_matrix(state)
+    table = assemble_stencil_table(state)
+
+    assert len(table) == len(stencil_list)
+    assert table.center.dtype == np.int32
+    for name in table.MEMBERS:
+        expected = [getattr(block, name).index for block in stencil_list]
+        np.testing.assert_array_equal(getattr(table, name), expected)
+
+    block = stencil_list[0]
+    assert (table.dx, table.dt, table.rho, table.f_vals) == (block.dx, block.dt, block.rho, block.f_vals)
+
+def test_stencil_table_block_gathers_and_scatters():
+    """A table block reads and writes the Foundation through its index arrays."""
+    state = make_step1_output_dummy(nx=3, ny=3, nz=3)
+    table = assemble_stencil_table(state)
+    data = state.fields.data
+    data[:, FI.P] = np.arange(data.shape[0], dtype=float)
+
+    block = table.as_block(data, rows=slice(0, 5))
+    np.testing.assert_array_equal(block.i_plus.get_field(FI.P), table.i_plus[:5])
+    np.testing.assert_array_equal(block.center.i, [0, 1, 2, 0, 1])
+
+    block.center.set_field(FI.P_NEXT, -1.0)
+    assert np.count_nonzero(data[:, FI.P_NEXT] == -1.0) == 5
+
+def test_lazy_stencil_matrix_matches_eager_list():
+    """The lazy sequence exposes the same blocks, in the same order, as the eager list."""
+    from src.common.stencil_table import LazyStencilMatrix
+
+    state = make_step1_output_dummy(nx=3, ny=2, nz=2)
+    eager = assemble_stencil_matrix(state)
+    lazy = LazyStencilMatrix(assemble_stencil_table(state), state.fields.data)
+
+    assert isinstance(lazy, Sequence) and not isinstance(lazy, list)
+    assert len(lazy) == len(eager) == len(list(lazy)) == len(np.array(lazy, dtype=object))
+    for lazy_block, eager_block in zip(lazy, eager, strict=True):
+        for name in ("center", "i_minus", "i_plus", "j_minus", "j_plus", "k_minus", "k_plus"):
+            assert getattr(lazy_block, name).index == getattr(eager_block, name).index
+            assert getattr(lazy_block, name).is_ghost == getattr(eager_block, name).is_ghost
+        assert lazy_block.dt == eager_block.dt
+    assert lazy[-1].center.index == eager[-1].center.index
+    assert [b.center.index for b in lazy[1:4]] == [b.center.index for b in eager[1:4]]
+
+def test_lazy_stencil_matrix_reuses_flyweights():
+    """Live blocks and shared cells are handed out once; the sequence itself is read-only."""
+    from src.common.stencil_table import LazyStencilMatrix
+
+    state = make_step1_output_dummy(nx=3, ny=2, nz=2)
+    lazy = LazyStencilMatrix(assemble_stencil_table(state), state.fields.data)
+
+    first, second = lazy[0], lazy[1]
+    assert lazy[0] is first
+    assert first.i_plus is second.center
+    second.center.p = 7.5
+    assert first.i_plus.p == 7.5
+
+    with pytest.raises(IndexError):
+        lazy[len(lazy)]
+    with pytest.raises(TypeError):
+        lazy.append(first)
+    with pytest.raises(TypeError):
+        lazy[0] = first
+
+def test_lazy_stencil_matrix_copies_and_pickles():
+    from src.common.stencil_table import LazyStencilMatrix
+
+    state = make_step1_output_dummy(nx=3, ny=2, nz=2)
+    lazy = LazyStencilMatrix(assemble_stencil_table(state), state.fields.data)
+
+    assert lazy == lazy and lazy != []
+    for other in (copy.copy(lazy), pickle.loads(pickle.dumps(lazy))):
+        assert isinstance(other, LazyStencilMatrix) and len(other) == len(lazy)
+        assert [b.center.index for b in other] == [b.center.index for b in lazy]
+    # A shallow copy is over the same Foundation
+    copy.copy(lazy)[0].center.p = 3.25
+    assert lazy[0].center.p == 3.25
@@ -0,0 +1,66 @@
+# tests/step5/test_snapshot_writer.py
+
+import h5py
+import numpy as np
+import pytest
+
+from src.step5.io_archivist import SNAPSHOT_FIELDS, SnapshotWriter, save_snapshot
+from tests.helpers.solver_step1_output_dummy import make_step1_output_dummy
+
+
+def _state(tmp_path, name):
+    state = make_step1_output_dummy(nx=4, ny=3, nz=5)
+    state.manifest.output_directory = str(tmp_path / name)
+    return state
+
+def _advance(state, iteration):
+    """Stands in for a time step: new iteration, time and field values."""
+    state.iteration = iteration
+    state.time = 0.01 * iteration
+    for offset, (_, field_id) in enumerate(SNAPSHOT_FIELDS):
+        state.fields.data[:, field_id] = np.arange(state.fields.data.shape[0]) * iteration + offset
+
+def test_async_snapshots_match_inline_writes(tmp_path):
+    inline, staged = _state(tmp_path, "inline"), _state(tmp_path, "async")
+    writer = SnapshotWriter(staged, depth=1)
+
+    for iteration in range(1, 5):
+        _advance(inline, iteration)
+        save_snapshot(inline)
+        # The solver overwrites the Foundation right after submit; staging must have copied it
+        _advance(staged, iteration)
+        writer.submit(staged)
+        staged.fields.data[:] = np.nan
+    writer.close()
+
+    assert [p.rsplit("/", 1)[-1] for p in staged.manifest.saved_snapshots] == \
+        [f"snapshot_{n:04d}.h5" for n in range(1, 5)]
+    for expected, actual in zip(inline.manifest.saved_snapshots, staged.manifest.saved_snapshots, strict=True):
+        with h5py.File(expected) as a, h5py.File(actual) as b:
+            for name in [name for name, _ in SNAPSHOT_FIELDS] + ["x", "y", "z", "mask"]:
+                np.testing.assert_array_equal(a[name][...], b[name][...])
+            assert dict(a.attrs) == dict(b.attrs)
+
+def test_write_failure_surfaces_on_flush(tmp_path):
+    state = _state(tmp_path, "out")
+    writer = SnapshotWriter(state, depth=2)
+    writer.submit(state)
+    writer.flush()
+    assert len(state.manifest.saved_snapshots) == 1
+
+    # A directory squatting on the snapshot name makes the background write fail
+    (tmp_path / "out" / "snapshot_0002.h5").mkdir()
+    state.iteration = 2
+    writer.submit(state)
+    with pytest.raises(OSError):
+        writer.flush()
+    assert len(state.manifest.saved_snapshots) == 1
+
+    state.iteration = 3
+    writer.submit(state)
+    writer.close()
+    assert state.manifest.saved_snapshots[-1].endswith("snapshot_0003.h5")
+
+def test_depth_must_be_positive(tmp_path):
+    with pytest.raises(ValueError):
+        SnapshotWriter(_state(tmp_path, "out"), depth=0)